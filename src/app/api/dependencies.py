@@ -0,0 +1,33 @@
+from fastapi import Depends, Request
+
+from app.core.fundamentals_service import FundamentalsService
+from app.core.price_service import PriceService
+from app.core.services import Services
+from app.core.technical_service import TechnicalService
+from app.core.ticker_validation import TickerValidationService
+
+
+def get_services(request: Request) -> Services:
+    """
+    Provides the services built by the app lifespan.
+
+    Returns:
+        Services: The shared services.
+    """
+    return request.app.state.services
+
+def get_price_service(services: Services = Depends(get_services)) -> PriceService:
+    """Provides the shared PriceService."""
+    return services.price
+
+def get_fundamentals_service(services: Services = Depends(get_services)) -> FundamentalsService:
+    """Provides the shared FundamentalsService."""
+    return services.fundamentals
+
+def get_technical_service(services: Services = Depends(get_services)) -> TechnicalService:
+    """Provides the shared TechnicalService."""
+    return services.technical
+
+def get_ticker_validation_service(services: Services = Depends(get_services)) -> TickerValidationService:
+    """Provides the shared TickerValidationService."""
+    return services.ticker_validation
@@ -1,17 +1,101 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import AsyncIterator, Literal, Optional
 
-from app.schemas.eval import EvalResponse
-from app.metrics import evaluate_all
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_services
+from app.core.services import Services
+from app.schemas.eval import BatchEvalItem, BatchEvalRequest, BatchEvalResponse, EvalResponse
+from app.metrics import evaluate_all, parse_metric_selection, MetricSelectionError, MetricTimeoutError
+from app.metrics.batch import evaluate_batch, iter_batch
+from app.providers.executor import ProviderBusyError
+from app.providers.circuit_breaker import CircuitOpenError
 from app.schemas.ticker import ErrorResponse
 
 from app.utils.ticker import InvalidTickerError
-from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
+from app.providers.yahoo_client import YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
 from app.core.price_service import PriceDataError
 from app.core.fundamentals_service import FundamentalsDataError
+from app.core.technical_service import TechnicalDataError
 
 
 router = APIRouter(prefix="/eval", tags=["Evaluation"])
 
+@router.post(
+    "/batch",
+    response_model=BatchEvalResponse,
+    responses={
+        422: {"model": ErrorResponse},
+})
+async def evaluate_stocks(request: BatchEvalRequest, services: Services = Depends(get_services)):
+    """Evaluate stock metrics for many ticker symbols.
+
+    Symbols are evaluated with bounded concurrency; symbols that are invalid
+    or fail are listed in ``errors`` while the rest are still returned.
+
+    Args:
+        request (BatchEvalRequest): Symbols to evaluate.
+        services (Services): Shared services. Defaults to Depends(get_services).
+    Returns:
+        BatchEvalResponse: Per-symbol evaluation results and errors.
+    """
+    return await evaluate_batch(request.symbols, services)
+
+
+_STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+async def _ndjson_lines(items: AsyncIterator[BatchEvalItem]) -> AsyncIterator[bytes]:
+    """Encode batch items as newline-delimited JSON, one line per symbol."""
+    async for item in items:
+        yield item.model_dump_json(exclude_none=True).encode() + b"\n"
+
+async def _sse_events(items: AsyncIterator[BatchEvalItem]) -> AsyncIterator[bytes]:
+    """Encode batch items as server-sent events, ending with a ``done`` event."""
+    count = 0
+    async for item in items:
+        count += 1
+        event = "error" if item.error is not None else "result"
+        yield f"event: {event}\ndata: {item.model_dump_json(exclude_none=True)}\n\n".encode()
+    yield f"event: done\ndata: {{\"count\": {count}}}\n\n".encode()
+
+@router.post(
+    "/batch/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One BatchEvalItem per symbol, sent as soon as it completes.",
+            "content": {media_type: {} for media_type in _STREAM_MEDIA_TYPES.values()},
+        },
+        422: {"model": ErrorResponse},
+})
+async def evaluate_stocks_stream(
+    request: BatchEvalRequest,
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="Stream format: NDJSON lines or server-sent events."),
+    services: Services = Depends(get_services),
+):
+    """Stream stock metric evaluations for many ticker symbols.
+
+    Each symbol's result or error is written as soon as it completes, so
+    neither the client nor the server waits for, or holds, the whole batch.
+
+    Args:
+        request (BatchEvalRequest): Symbols to evaluate.
+        format (str): "ndjson" or "sse".
+        services (Services): Shared services. Defaults to Depends(get_services).
+    Returns:
+        StreamingResponse: The evaluations in completion order.
+    """
+    items = iter_batch(request.symbols, services)
+    encode = _sse_events if format == "sse" else _ndjson_lines
+    return StreamingResponse(
+        encode(items),
+        media_type=_STREAM_MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.get(
     "/{symbol}", 
     response_model=EvalResponse,
@@ -19,22 +103,40 @@ router = APIRouter(prefix="/eval", tags=["Evaluation"])
         422: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
         502: {"model": ErrorResponse},
-        
+        503: {"model": ErrorResponse},
+        504: {"model": ErrorResponse},
 })
 async def evaluate_stock(
     symbol: str,
+    metrics: Optional[str] = Query(None, description="Metric groups or keys to evaluate, comma-separated (e.g. price,technical.rsi_14d)."),
+    services: Services = Depends(get_services),
 ):
 
     """Evaluate stock metrics for a given ticker symbol.
 
+    Metrics run concurrently; any metric that fails or times out is reported
+    in the per-metric status while the others are still returned.
+
     Args:
         ticker (str): Stock ticker symbol.
+        metrics (Optional[str]): Metric groups or keys to evaluate; all by default.
+        services (Services): Shared services. Defaults to Depends(get_services).
     Returns:
         EvalResponse: Evaluation results including metrics.
     """
     try:
-        metrics = await evaluate_all(symbol)
-        return EvalResponse(ticker=symbol, metrics=metrics)
+        selection = parse_metric_selection(metrics)
+    except MetricSelectionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error": "INVALID_METRIC_SELECTION",
+                "message": str(e),
+                "details": f"Got '{metrics}'."
+            },
+        )
+    try:
+        return await evaluate_all(symbol, services, selection)
     except InvalidTickerError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -53,7 +155,34 @@ async def evaluate_stock(
                 "details": f"Symbol '{symbol}' does not exist."
             },
         )
-    except (YahooClientError, PriceDataError, FundamentalsDataError) as e:
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_UNAVAILABLE",
+                "message": str(e),
+                "details": "Yahoo Finance is currently unavailable and no cached data exists; retry shortly."
+            },
+        )
+    except YahooRateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_RATE_LIMITED",
+                "message": str(e),
+                "details": "Yahoo Finance is throttling requests; retry shortly."
+            },
+        )
+    except ProviderBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "PROVIDER_BUSY",
+                "message": str(e),
+                "details": "Too many Yahoo Finance requests are queued; retry shortly."
+            },
+        )
+    except (YahooClientError, PriceDataError, FundamentalsDataError, TechnicalDataError) as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail={
@@ -62,5 +191,12 @@ async def evaluate_stock(
                 "details": "Error occurred while communicating with Yahoo Finance."
             },
         )
-    
-    
\ No newline at end of file
+    except MetricTimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                "error": "EVALUATION_TIMEOUT",
+                "message": str(e),
+                "details": "No metric completed before its deadline."
+            },
+        )
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.metrics.fundamentals import get_fundamentals_service
+from app.api.dependencies import get_fundamentals_service
 from app.core.fundamentals_service import FundamentalsService, FundamentalsDataError
 from app.schemas.fundamentals import FundamentalsResponse
+from app.providers.executor import ProviderBusyError
+from app.providers.circuit_breaker import CircuitOpenError
 from app.schemas.ticker import ErrorResponse
 from app.utils.ticker import InvalidTickerError
-from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooSymbolNotFoundError
+from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
 
 router = APIRouter(prefix="/fundamentals", tags=["Fundamentals"])
 
@@ -16,6 +18,7 @@ router = APIRouter(prefix="/fundamentals", tags=["Fundamentals"])
         422: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
         502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
 async def get_fundamentals(
@@ -49,6 +52,33 @@ async def get_fundamentals(
                 "details": f"Symbol '{symbol}' does not exist."
             },
         )
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_UNAVAILABLE",
+                "message": str(e),
+                "details": "Yahoo Finance is currently unavailable and no cached data exists; retry shortly."
+            },
+        )
+    except YahooRateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_RATE_LIMITED",
+                "message": str(e),
+                "details": "Yahoo Finance is throttling requests; retry shortly."
+            },
+        )
+    except ProviderBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "PROVIDER_BUSY",
+                "message": str(e),
+                "details": "Too many Yahoo Finance requests are queued; retry shortly."
+            },
+        )
     except (YahooClientError, FundamentalsDataError) as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -0,0 +1,23 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_services
+from app.core.services import Services
+from app.providers.stack import provider_stats
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+@router.get("/provider", response_model=Dict[str, Dict[str, Any]])
+async def get_provider_health(services: Services = Depends(get_services)):
+    """
+    Report the counters of every layer of the shared provider stack.
+
+    Includes executor queue depth and wait times, cache hit rates,
+    coalesced calls, limiter and breaker state, for sizing the service,
+    plus per-metric hit rates of the metric result cache.
+    """
+    stats = provider_stats(services.yahoo_client)
+    stats["StaleFallback"] = services.stale_fallback.stats()
+    stats["MetricResultCache"] = services.metric_cache.stats()
+    return stats
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.price_service import PriceService, PriceDataError
-from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooSymbolNotFoundError
+from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
 from app.utils.ticker import InvalidTickerError
+from app.providers.executor import ProviderBusyError
+from app.providers.circuit_breaker import CircuitOpenError
 from app.schemas.ticker import ErrorResponse
 from app.schemas.price import PriceResponse
-from app.metrics.price import get_price_service
+from app.api.dependencies import get_price_service
 
 router = APIRouter(prefix="/price", tags=["Price"])
 
@@ -16,6 +18,7 @@ router = APIRouter(prefix="/price", tags=["Price"])
         422: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
         502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
 async def get_price(
@@ -49,6 +52,33 @@ async def get_price(
                 "details": f"Symbol '{symbol}' does not exist."
             },
         )
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_UNAVAILABLE",
+                "message": str(e),
+                "details": "Yahoo Finance is currently unavailable and no cached data exists; retry shortly."
+            },
+        )
+    except YahooRateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_RATE_LIMITED",
+                "message": str(e),
+                "details": "Yahoo Finance is throttling requests; retry shortly."
+            },
+        )
+    except ProviderBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "PROVIDER_BUSY",
+                "message": str(e),
+                "details": "Too many Yahoo Finance requests are queued; retry shortly."
+            },
+        )
     except (YahooClientError, PriceDataError) as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
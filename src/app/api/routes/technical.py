@@ -1,11 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from typing import Literal, Optional
 
-from app.metrics.technical import get_technical_service
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import Response, StreamingResponse
+
+from app.api.dependencies import get_technical_service
 from app.core.technical_service import TechnicalService, TechnicalDataError
+from app.core.indicators import IndicatorWindowError, IndicatorWindows
+from app.core.config import settings
 from app.schemas.technical import TechnicalResponse
+from app.providers.executor import ProviderBusyError
+from app.providers.circuit_breaker import CircuitOpenError
 from app.schemas.ticker import ErrorResponse
 from app.utils.ticker import InvalidTickerError
-from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooSymbolNotFoundError
+from app.utils.columnar import ARROW_MEDIA_TYPE, ArrowUnavailableError, iter_columnar_json, to_arrow_ipc
+from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
 
 router = APIRouter(prefix="/technical", tags=["Technical"])
 
@@ -16,11 +24,15 @@ router = APIRouter(prefix="/technical", tags=["Technical"])
         422: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
         502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
 
 async def get_technical(
     symbol: str,
+    sma: Optional[str] = Query(None, description="Extra SMA windows in days, comma-separated (e.g. 20,100)."),
+    rsi: Optional[str] = Query(None, description="Extra RSI windows, comma-separated (e.g. 7)."),
+    volatility: Optional[str] = Query(None, description="Extra volatility windows, comma-separated (e.g. 10,60)."),
     service: TechnicalService = Depends(get_technical_service),
 ):
     """
@@ -28,12 +40,119 @@ async def get_technical(
 
     Args:
         symbol (str): Stock ticker symbol.
+        sma (Optional[str]): Extra SMA windows.
+        rsi (Optional[str]): Extra RSI windows.
+        volatility (Optional[str]): Extra volatility windows.
         service (TechnicalService, optional): TechnicalService instance. Defaults to Depends(get_technical_service).
     """
+    windows = _parse_windows(sma, rsi, volatility)
+    try:
+        return await service.get_technical_for_symbol(symbol, windows or None)
+    except (InvalidTickerError, YahooClientError, TechnicalDataError) as e:
+        raise _http_error(e, symbol)
+
+
+@router.get(
+    "/{symbol}/history",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Columnar indicator series: JSON by default, Arrow IPC stream with ?format=arrow.",
+            "content": {"application/json": {}, ARROW_MEDIA_TYPE: {}},
+        },
+        404: {"model": ErrorResponse},
+        406: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+)
+async def get_technical_history(
+    symbol: str,
+    days: int = Query(252, ge=1, le=settings.technical_history_max_days, description="Number of most recent daily bars."),
+    format: Literal["json", "arrow"] = Query("json", description="Output format: columnar JSON or an Arrow IPC stream."),
+    sma: Optional[str] = Query(None, description="Extra SMA windows in days, comma-separated (e.g. 20,100)."),
+    rsi: Optional[str] = Query(None, description="Extra RSI windows, comma-separated (e.g. 7)."),
+    volatility: Optional[str] = Query(None, description="Extra volatility windows, comma-separated (e.g. 10,60)."),
+    service: TechnicalService = Depends(get_technical_service),
+):
+    """
+    Get full daily indicator series for a given stock symbol.
+
+    The response is ``{"symbol", "days", "columns": {"timestamp": [...], "close": [...], ...}}``
+    streamed column by column; undefined values are null.
+
+    Args:
+        symbol (str): Stock ticker symbol.
+        days (int): Number of most recent daily bars.
+        format (str): "json" or "arrow".
+        sma (Optional[str]): Extra SMA windows.
+        rsi (Optional[str]): Extra RSI windows.
+        volatility (Optional[str]): Extra volatility windows.
+        service (TechnicalService, optional): TechnicalService instance. Defaults to Depends(get_technical_service).
+    """
+    windows = _parse_windows(sma, rsi, volatility)
+    try:
+        history = await service.get_indicator_history(symbol, days, windows or None)
+    except (InvalidTickerError, YahooClientError, TechnicalDataError) as e:
+        raise _http_error(e, symbol)
+
+    meta = {"symbol": history.symbol, "days": len(history.timestamps)}
+    columns = {"timestamp": history.timestamps, **history.columns}
+
+    if format == "arrow":
+        try:
+            payload = to_arrow_ipc(meta, columns)
+        except ArrowUnavailableError as e:
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail={
+                    "error": "ARROW_UNAVAILABLE",
+                    "message": str(e),
+                    "details": "Request format=json instead."
+                },
+            )
+        return Response(content=payload, media_type=ARROW_MEDIA_TYPE)
+
+    return StreamingResponse(iter_columnar_json(meta, columns), media_type="application/json")
+
+
+def _parse_windows(sma: Optional[str], rsi: Optional[str], volatility: Optional[str]) -> IndicatorWindows:
+    """
+    Parse extra indicator windows from query values.
+
+    Args:
+        sma (Optional[str]): Extra SMA windows.
+        rsi (Optional[str]): Extra RSI windows.
+        volatility (Optional[str]): Extra volatility windows.
+    Returns:
+        IndicatorWindows: The parsed windows.
+    """
     try:
-        return await service.get_technical_for_symbol(symbol)
-    except InvalidTickerError as e:
+        return IndicatorWindows.parse(sma=sma, rsi=rsi, volatility=volatility, max_window=settings.history_window_days)
+    except IndicatorWindowError as e:
         raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error": "INVALID_INDICATOR_WINDOW",
+                "message": str(e),
+                "details": f"Windows are limited to the {settings.history_window_days}-day history."
+            },
+        )
+
+
+def _http_error(e: Exception, symbol: str) -> HTTPException:
+    """
+    Map a service error onto the HTTP error returned by the technical routes.
+
+    Args:
+        e (Exception): Error raised by the technical service.
+        symbol (str): Symbol from the request path.
+    Returns:
+        HTTPException: The error response to raise.
+    """
+    if isinstance(e, InvalidTickerError):
+        return HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={
                 "error": "INVALID_TICKER_FORMAT",
@@ -41,8 +160,8 @@ async def get_technical(
                 "details": f"Got '{symbol}'."
             },
         )
-    except YahooSymbolNotFoundError as e:
-        raise HTTPException(
+    if isinstance(e, YahooSymbolNotFoundError):
+        return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
                 "error": "TICKER_NOT_FOUND",
@@ -50,21 +169,38 @@ async def get_technical(
                 "details": f"Symbol '{symbol}' does not exist."
             },
         )
-    except (YahooClientError, TechnicalDataError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
+    if isinstance(e, CircuitOpenError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
-                "error": "YAHOO_CLIENT_ERROR",
+                "error": "UPSTREAM_UNAVAILABLE",
                 "message": str(e),
-                "details": "Error occurred while communicating with Yahoo Finance."
+                "details": "Yahoo Finance is currently unavailable and no cached data exists; retry shortly."
             },
         )
-    except TechnicalDataError as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
+    if isinstance(e, YahooRateLimitError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_RATE_LIMITED",
+                "message": str(e),
+                "details": "Yahoo Finance is throttling requests; retry shortly."
+            },
+        )
+    if isinstance(e, ProviderBusyError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
-                "error": "TECHNICAL_DATA_ERROR",
+                "error": "PROVIDER_BUSY",
                 "message": str(e),
-                "details": "Error occurred while retrieving technical data."
+                "details": "Too many Yahoo Finance requests are queued; retry shortly."
             },
-        )
\ No newline at end of file
+        )
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail={
+            "error": "YAHOO_CLIENT_ERROR",
+            "message": str(e),
+            "details": "Error occurred while communicating with Yahoo Finance."
+        },
+    )
@@ -1,21 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.ticker_validation import TickerValidationService, TickerNotFoundError
-from app.providers.yahoo_client import YFinanceYahooClient, YahooClientError
+from app.providers.yahoo_client import YahooClientError, YahooRateLimitError
+from app.api.dependencies import get_ticker_validation_service
 from app.utils.ticker import InvalidTickerError
+from app.providers.executor import ProviderBusyError
+from app.providers.circuit_breaker import CircuitOpenError
 from app.schemas.ticker import TickerValidationResponse, ErrorResponse
 
 router = APIRouter(prefix="/tickers", tags=["Tickers"])
 
-def get_ticker_validation_service() -> TickerValidationService:
-    """
-    Provides an instance of TickerValidationService with a YahooClient.
-    Returns:
-        TickerValidationService: An instance of TickerValidationService.
-    """
-    client = YFinanceYahooClient()
-    return TickerValidationService(yahoo_client=client)
-
 @router.get(
     "/{symbol}/validate", 
     response_model=TickerValidationResponse, 
@@ -23,6 +17,7 @@ def get_ticker_validation_service() -> TickerValidationService:
         422: {"model": ErrorResponse},
         404: {"model": ErrorResponse}, 
         502: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
 )
 async def validate_ticker(
@@ -58,6 +53,33 @@ async def validate_ticker(
             },
         )
     
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_UNAVAILABLE",
+                "message": str(e),
+                "details": "Yahoo Finance is currently unavailable and no cached data exists; retry shortly."
+            },
+        )
+    except YahooRateLimitError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "UPSTREAM_RATE_LIMITED",
+                "message": str(e),
+                "details": "Yahoo Finance is throttling requests; retry shortly."
+            },
+        )
+    except ProviderBusyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "PROVIDER_BUSY",
+                "message": str(e),
+                "details": "Too many Yahoo Finance requests are queued; retry shortly."
+            },
+        )
     except YahooClientError as e:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel
 
 
@@ -10,4 +12,114 @@ class Settings(BaseModel):
     environment: str = "development"
     debug: bool = True
     
+    # Evaluation deadlines (seconds). Metrics without an entry in
+    # metric_timeouts fall back to metric_timeout_seconds.
+    metric_timeout_seconds: float = 10.0
+    metric_timeouts: Dict[str, float] = {
+        "price": 5.0,
+        "fundamentals": 10.0,
+        "technical": 8.0,
+    }
+    
+    # Computed metric blocks reused across evaluations. Price and fundamentals
+    # stay fresh for a TTL (seconds); technical indicators until the next close.
+    metric_cache_enabled: bool = True
+    metric_cache_max_entries: int = 8192
+    metric_cache_ttls: Dict[str, float] = {
+        "price": 10.0,
+        "fundamentals": 24 * 3600.0,
+    }
+    market_timezone: str = "America/New_York"
+    market_close_time: str = "16:00"
+    
+    # POST /eval/batch: most symbols per request, symbols evaluated at once and
+    # symbols per history prefetch (later chunks download while earlier ones
+    # are evaluated and streamed)
+    eval_batch_max_symbols: int = 1000
+    eval_batch_concurrency: int = 16
+    eval_batch_prefetch_chunk: int = 100
+    
+    # msgpack file the provider, history and metric caches are saved to on
+    # shutdown and restored from on startup; None disables snapshots
+    cache_snapshot_path: Optional[str] = None
+    
+    # Optional startup phase run before the app reports ready: import the
+    # provider's heavy modules, open its connections and evaluate a watchlist
+    prewarm_enabled: bool = False
+    prewarm_symbols: List[str] = []
+    prewarm_timeout_seconds: float = 30.0
+    
+    # Daily bar history shared by the price and technical services
+    history_window_days: int = 200
+    history_ttl_seconds: float = 60.0
+    history_max_entries: int = 4096
+    # Persisted daily bars so refreshes only download new sessions; None
+    # keeps bars in memory only. Backend "sqlite" (path is a database file)
+    # or "mmap" (path is a directory of memory-mapped column files shared
+    # zero-copy by every worker process)
+    bar_store_path: Optional[str] = None
+    bar_store_backend: str = "sqlite"
+    # Symbols whose column files the "mmap" backend keeps mapped
+    bar_store_max_maps: int = 1024
+    indicator_state_max_symbols: int = 4096
+    # Longest indicator history served by /technical/{symbol}/history
+    technical_history_max_days: int = 2520
+    
+    # Upstream backend: "yfinance" (blocking library on the provider pool)
+    # or "http" (native async client on Yahoo's JSON endpoints)
+    yahoo_client_backend: str = "yfinance"
+    yahoo_http_base_url: str = "https://query2.finance.yahoo.com"
+    yahoo_http_timeout_seconds: float = 10.0
+    yahoo_http_max_connections: int = 20
+    yahoo_http_max_keepalive: int = 10
+    
+    # Dedicated thread pool for blocking yfinance calls
+    provider_max_workers: int = 8
+    provider_max_in_flight: int = 8
+    provider_max_queue: int = 64
+    provider_queue_timeout_seconds: float = 10.0
+    
+    # Circuit breaker around provider calls and last-known-good fallback
+    provider_breaker_enabled: bool = True
+    provider_breaker_window: int = 20
+    provider_breaker_min_calls: int = 5
+    provider_breaker_failure_rate: float = 0.5
+    provider_breaker_slow_call_seconds: float = 5.0
+    provider_breaker_slow_rate: float = 0.5
+    provider_breaker_open_seconds: float = 30.0
+    stale_max_entries: int = 4096
+    # Oldest last-known-good response that may still be served (seconds)
+    stale_max_age_seconds: float = 86400.0
+    
+    # Client-side pacing of Yahoo requests: token bucket plus AIMD concurrency
+    provider_rate_limit_enabled: bool = True
+    provider_rate_per_second: float = 5.0
+    provider_rate_burst: float = 10.0
+    provider_rate_max_wait_seconds: float = 5.0
+    provider_concurrency_initial: float = 4.0
+    provider_concurrency_min: float = 1.0
+    provider_concurrency_max: float = 16.0
+    
+    # Coalesce concurrent identical provider calls into one upstream call
+    provider_single_flight_enabled: bool = True
+    
+    # In-memory provider cache: TTL (seconds) per YahooClient method and LRU bound
+    provider_cache_enabled: bool = True
+    provider_cache_max_entries: int = 2048
+    provider_cache_ttls: Dict[str, float] = {
+        "fetch_quote": 15.0,
+        "fetch_daily_history": 300.0,
+        "fetch_fundamentals": 6 * 3600.0,
+    }
+    
+    def timeout_for(self, metric_name: str) -> float:
+        """Return the evaluation deadline for a metric.
+
+        Args:
+            metric_name (str): Name of the metric.
+        Returns:
+            float: Timeout in seconds.
+        """
+        return self.metric_timeouts.get(metric_name, self.metric_timeout_seconds)
+    
 settings = Settings()
@@ -0,0 +1,200 @@
+import asyncio
+from dataclasses import dataclass, field, is_dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Sequence, Set, Tuple, TypeVar
+
+from app.core.config import settings
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient
+
+T = TypeVar("T")
+
+
+@dataclass
+class EvaluationContext(YahooClient):
+    """
+    Request-scoped view over a YahooClient.
+
+    Memoizes raw provider payloads per symbol for the life of one evaluation so
+    that services sharing the context reuse each other's upstream calls.
+    Concurrent callers await the same in-flight call. Daily history is
+    fetched once per symbol for at least ``window_days`` bars and narrower
+    windows are sliced from it, whatever order they are asked for in.
+    """
+    yahoo_client: YahooClient
+    window_days: int = settings.history_window_days
+    _calls: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = field(default_factory=dict, init=False, repr=False)
+    # (source, symbol) -> widest window fetched
+    _history_days: Dict[Tuple[str, str], int] = field(default_factory=dict, init=False, repr=False)
+    # Metrics computed from last-known-good data instead of fresh data
+    stale: Set[str] = field(default_factory=set, init=False)
+
+    def bind(self, service: T) -> T:
+        """
+        Return a copy of a service whose provider calls go through this context.
+
+        A ``history_store`` field is rebound too, so history reads are shared
+        by the evaluation as well.
+
+        Args:
+            service (T): A service dataclass with a ``yahoo_client`` field.
+        Returns:
+            T: The bound service, or the service unchanged if it has no client.
+        """
+        if not is_dataclass(service) or not hasattr(service, "yahoo_client"):
+            return service
+        changes: Dict[str, Any] = {"yahoo_client": self}
+        store = getattr(service, "history_store", None)
+        if store is not None:
+            changes["history_store"] = ContextHistoryStore(history_store=store, context=self)
+        return replace(service, **changes)
+
+    def mark_stale(self, metric: str) -> None:
+        """
+        Record that a metric was computed from last-known-good data.
+
+        Args:
+            metric (str): Metric name.
+        """
+        self.stale.add(metric)
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch quote data, reusing ``info`` from fundamentals already fetched.
+
+        Args:
+            symbol (str): Stock ticker symbol.
+        Returns:
+            Dict[str, Any]: Quote data.
+        """
+        fundamentals = self._calls.get(("fundamentals", symbol))
+        if fundamentals is not None:
+            try:
+                info = (await asyncio.shield(fundamentals)).get("info") or {}
+            except Exception:
+                info = {}
+            if info:
+                quote = dict(info)
+                quote.setdefault("symbol", symbol)
+                return quote
+
+        return await self._memo(("quote", symbol), lambda: self.yahoo_client.fetch_quote(symbol))
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """
+        Fetch daily history, slicing narrower windows out of one shared download.
+
+        Args:
+            symbol (str): Stock ticker symbol.
+            days (int): Number of days of history to fetch.
+        Returns:
+            PriceSeries: Daily bars, oldest to newest.
+        """
+        return await self._history(
+            "client", symbol, days, self.window_days, lambda window: self.yahoo_client.fetch_daily_history(symbol, window),
+        )
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch raw fundamentals once per evaluation.
+
+        Args:
+            symbol (str): Stock ticker symbol.
+        Returns:
+            Dict[str, Any]: Raw fundamentals data.
+        """
+        return await self._memo(("fundamentals", symbol), lambda: self.yahoo_client.fetch_fundamentals(symbol))
+
+    async def _history(
+        self,
+        source: str,
+        symbol: str,
+        days: int,
+        floor: int,
+        fetch: Callable[[int], Awaitable[PriceSeries]],
+    ) -> PriceSeries:
+        """
+        Fetch at least ``floor`` bars of a symbol once and slice ``days`` from them.
+
+        Args:
+            source (str): Where the bars come from, part of the memo key.
+            symbol (str): Stock ticker symbol.
+            days (int): Number of bars wanted.
+            floor (int): Smallest window fetched.
+            fetch (Callable[[int], Awaitable[PriceSeries]]): Fetches a window of bars.
+        Returns:
+            PriceSeries: Up to ``days`` bars, oldest to newest.
+        """
+        widest = self._history_days.get((source, symbol), 0)
+        if widest < days:
+            widest = max(days, floor)
+            self._history_days[(source, symbol)] = widest
+        window = widest
+        history = await self._memo(("history", source, symbol, window), lambda: fetch(window))
+        return history.tail(days)
+
+    async def _memo(self, key: Tuple[Any, ...], call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the memoized result for key, starting the call on first use.
+
+        The shared task is shielded so a caller hitting its own deadline does not
+        cancel the call for the other services awaiting it.
+
+        Args:
+            key (Tuple[Any, ...]): Memo key, (method, symbol, *args).
+            call (Callable[[], Awaitable[T]]): Starts the upstream call.
+        Returns:
+            T: The provider payload.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+        return await asyncio.shield(task)
+
+
+@dataclass
+class ContextHistoryStore:
+    """
+    Request-scoped view over a HistoryStore, memoized in an EvaluationContext.
+
+    Services bound to the context read history through it, so the metrics
+    of one evaluation share a single read per symbol.
+    """
+    history_store: HistoryStore
+    context: EvaluationContext
+
+    @property
+    def window_days(self) -> int:
+        return self.history_store.window_days
+
+    async def get_history(self, symbol: str, days: int) -> PriceSeries:
+        """
+        Get the most recent daily bars for a symbol, once per evaluation.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            days (int): Number of bars wanted.
+        Returns:
+            PriceSeries: Up to ``days`` bars, oldest to newest.
+        """
+        return await self.context._history(
+            "store", symbol, days, self.history_store.window_days,
+            lambda window: self.history_store.get_history(symbol, window),
+        )
+
+    async def get_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """
+        Get daily bars for several symbols straight from the store.
+
+        Args:
+            symbols (Sequence[str]): Normalised stock ticker symbols.
+            days (int): Number of bars wanted.
+        Returns:
+            Dict[str, PriceSeries]: Bars per symbol found, oldest to newest.
+        """
+        return await self.history_store.get_history_many(symbols, days)
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop the store's cached bars for a symbol."""
+        self.history_store.invalidate(symbol)
@@ -5,6 +5,7 @@ from math import isfinite
 from app.utils.ticker import normalise_and_validate_ticker
 from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError, YahooClientError
 from app.schemas.fundamentals import FundamentalsResponse
+from app.core.stale import StaleFallback
 from app.core.utils.service_helpers import _latest_numeric, _safe_float
 class FundamentalsDataError(Exception):
     """Custom exception for fundamentals data retrieval errors."""
@@ -16,6 +17,7 @@ class FundamentalsService:
     Service for retrieving fundamentals data
     """
     yahoo_client: YahooClient
+    fallback: Optional[StaleFallback] = None
     
     async def get_fundamentals_for_symbol(self, raw_symbol: str) -> FundamentalsResponse:
         """
@@ -28,6 +30,19 @@ class FundamentalsService:
         """
         symbol = normalise_and_validate_ticker(raw_symbol)
         
+        if self.fallback is None:
+            return await self._fetch_fundamentals(symbol)
+        return await self.fallback.serve(("fundamentals", symbol), lambda: self._fetch_fundamentals(symbol))
+    
+    async def _fetch_fundamentals(self, symbol: str) -> FundamentalsResponse:
+        """
+        Build a fresh fundamentals data response from the provider.
+
+        Args:
+            symbol (str): The normalised symbol.
+        Returns:
+            FundamentalsResponse: The fundamentals data response.
+        """
         try:
             raw = await self.yahoo_client.fetch_fundamentals(symbol)
         except (YahooSymbolNotFoundError, YahooClientError):
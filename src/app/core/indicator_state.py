@@ -0,0 +1,309 @@
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from math import sqrt
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.indicators import PrefixSums
+from app.providers.price_series import PriceSeries
+
+
+class RollingSum:
+    """
+    Sum of the last ``window`` values, updated in constant time.
+
+    The running total is recomputed from the window every ``window`` pushes
+    (amortised O(1)) so floating-point drift cannot build up.
+    """
+    __slots__ = ("window", "values", "total", "_pushes")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self._pushes = 0
+
+    def push(self, x: float) -> None:
+        """Add the newest value, dropping the oldest once the window is full."""
+        self.values.append(x)
+        self.total += x
+        if len(self.values) > self.window:
+            self.total -= self.values.popleft()
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            self.total = sum(self.values)
+
+    def replace_last(self, x: float) -> None:
+        """Replace the newest value (e.g. an intraday bar that moved)."""
+        self.total += x - self.values[-1]
+        self.values[-1] = x
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.window
+
+    def mean(self) -> Optional[float]:
+        """Mean of the window, or None until it is full."""
+        return self.total / self.window if self.full else None
+
+
+class RollingVariance:
+    """
+    Sample variance of the last ``window`` values via sliding Welford updates.
+
+    Like RollingSum, the moments are recomputed from the window every
+    ``window`` pushes to bound drift.
+    """
+    __slots__ = ("window", "values", "mean", "m2", "_pushes")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: Deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._pushes = 0
+
+    def push(self, x: float) -> None:
+        """Add the newest value, dropping the oldest once the window is full."""
+        if len(self.values) == self.window:
+            self._remove(self.values[0])
+            self.values.popleft()
+        self.values.append(x)
+        self._add(x)
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            self.mean = sum(self.values) / len(self.values)
+            self.m2 = sum((v - self.mean) ** 2 for v in self.values)
+
+    def replace_last(self, x: float) -> None:
+        """Replace the newest value."""
+        self._remove(self.values[-1])
+        self.values[-1] = x
+        self._add(x)
+
+    def std(self) -> Optional[float]:
+        """Sample standard deviation of the window, or None until it is full."""
+        if len(self.values) != self.window or self.window < 2:
+            return None
+        return sqrt(max(self.m2, 0.0) / (self.window - 1))
+
+    def _add(self, x: float) -> None:
+        # Called after the value is appended, so len(values) is the new count
+        n = len(self.values)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (x - self.mean)
+
+    def _remove(self, x: float) -> None:
+        # Called while the value is still in the deque
+        n = len(self.values) - 1
+        if n == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / n
+        self.m2 -= delta * (x - self.mean)
+
+
+class IndicatorState:
+    """
+    Technical indicators for one symbol, folded in one bar at a time.
+
+    Keeps rolling sums for the 50/200-day SMAs, rolling gain and loss sums
+    for the 14-day RSI and a sliding Welford variance of the last 30 price
+    changes. ``update`` seeds the state from a full series once, then only
+    folds in bars newer than the last one seen; a moved last bar (intraday
+    updates) is replaced in place. Any other change in the history, such as a
+    split adjustment, triggers a rebuild from the series.
+    """
+    __slots__ = ("last_timestamp", "last_close", "bars", "rebuilds", "_sma_50", "_sma_200", "_gains", "_losses", "_deltas")
+
+    def __init__(self) -> None:
+        self.rebuilds = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.last_timestamp: Optional[np.datetime64] = None
+        self.last_close = 0.0
+        self.bars = 0
+        self._sma_50 = RollingSum(50)
+        self._sma_200 = RollingSum(200)
+        self._gains = RollingSum(14)
+        self._losses = RollingSum(14)
+        self._deltas = RollingVariance(30)
+
+    def update(self, series: PriceSeries) -> int:
+        """
+        Fold in the bars of a series not seen yet.
+
+        Args:
+            series (PriceSeries): Daily bars, oldest to newest.
+        Returns:
+            int: Number of bars folded in or replaced (the whole series on a rebuild).
+        """
+        if not len(series):
+            return 0
+        if self.last_timestamp is None:
+            return self._rebuild(series)
+
+        # Position of the last bar seen in the new series
+        i = int(np.searchsorted(series.timestamps, self.last_timestamp))
+        if i >= len(series) or series.timestamps[i] != self.last_timestamp:
+            return self._rebuild(series)
+
+        work = 0
+        close = float(series.close[i])
+        if close != self.last_close:
+            if i != len(series) - 1:
+                # A settled bar changed: the history was revised
+                return self._rebuild(series)
+            self._replace_last(close)
+            work += 1
+
+        for j in range(i + 1, len(series)):
+            self._push(series.timestamps[j], float(series.close[j]))
+            work += 1
+        return work
+
+    def values(self) -> Dict[str, Any]:
+        """
+        Current indicator values.
+
+        Returns:
+            Dict[str, Any]: ``sma_50d``, ``sma_200d``, ``above_200d``, ``rsi_14d``
+            and ``volatility_30``; values that cannot be computed yet are None.
+        """
+        sma_200d = self._sma_200.mean()
+        rsi_14d = None
+        if self._gains.full:
+            avg_gain = self._gains.mean()
+            avg_loss = self._losses.mean()
+            if avg_loss > 0:
+                rsi_14d = 100 - (100 / (1 + (avg_gain / avg_loss)))
+        return {
+            "sma_50d": self._sma_50.mean(),
+            "sma_200d": sma_200d,
+            "above_200d": self.last_close > sma_200d if sma_200d is not None else None,
+            "rsi_14d": rsi_14d,
+            "volatility_30": self._deltas.std(),
+        }
+
+    def _rebuild(self, series: PriceSeries) -> int:
+        self._reset()
+        self.rebuilds += 1
+        for ts, close in zip(series.timestamps, series.close.tolist()):
+            self._push(ts, close)
+        return len(series)
+
+    def _push(self, timestamp: np.datetime64, close: float) -> None:
+        if self.bars:
+            delta = close - self.last_close
+            self._gains.push(max(delta, 0.0))
+            self._losses.push(max(-delta, 0.0))
+            self._deltas.push(delta)
+        self._sma_50.push(close)
+        self._sma_200.push(close)
+        self.last_timestamp = timestamp
+        self.last_close = close
+        self.bars += 1
+
+    def _replace_last(self, close: float) -> None:
+        self._sma_50.replace_last(close)
+        self._sma_200.replace_last(close)
+        if self.bars > 1:
+            previous = self.last_close - self._deltas.values[-1]
+            delta = close - previous
+            self._gains.replace_last(max(delta, 0.0))
+            self._losses.replace_last(max(-delta, 0.0))
+            self._deltas.replace_last(delta)
+        self.last_close = close
+
+
+@dataclass
+class IndicatorStateStore:
+    """
+    Per-symbol IndicatorState and PrefixSums, bounded to ``max_entries``
+    symbols each (least recently used evicted).
+    """
+    max_entries: int = settings.indicator_state_max_symbols
+    folded: int = field(default=0, init=False)
+    rebuilds: int = field(default=0, init=False)
+    prefix_builds: int = field(default=0, init=False)
+    _states: "OrderedDict[str, IndicatorState]" = field(default_factory=OrderedDict, init=False, repr=False)
+    # symbol -> (series fingerprint, closes summed, prefix sums)
+    _prefix: "OrderedDict[str, Tuple[Tuple[Any, ...], np.ndarray, PrefixSums]]" = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def update(self, symbol: str, series: PriceSeries) -> Dict[str, Any]:
+        """
+        Fold the series into the symbol's state and return its indicators.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            series (PriceSeries): Latest daily bars, oldest to newest.
+        Returns:
+            Dict[str, Any]: Indicator values, as from ``IndicatorState.values``.
+        """
+        state = self._states.get(symbol)
+        if state is None:
+            state = IndicatorState()
+            self._states[symbol] = state
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+        self._states.move_to_end(symbol)
+
+        rebuilds = state.rebuilds
+        work = state.update(series)
+        if state.rebuilds != rebuilds:
+            self.rebuilds += 1
+        else:
+            self.folded += work
+        return state.values()
+
+    def prefix_sums(self, symbol: str, series: PriceSeries) -> PrefixSums:
+        """
+        Return prefix sums for the series, reusing the cached ones while the series is unchanged.
+
+        Any changed close counts, not just the last one: a revised history
+        (e.g. dividend or split adjustments) of the same length is rebuilt,
+        as ``IndicatorState.update`` does.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            series (PriceSeries): Latest daily bars, oldest to newest.
+        Returns:
+            PrefixSums: Prefix sums of the series' closes.
+        """
+        fingerprint: Tuple[Any, ...] = (len(series),)
+        if len(series):
+            fingerprint += (series.timestamps[0], series.timestamps[-1], float(series.close[-1]))
+
+        entry = self._prefix.get(symbol)
+        if entry is not None and entry[0] == fingerprint and np.array_equal(entry[1], series.close):
+            self._prefix.move_to_end(symbol)
+            return entry[2]
+
+        sums = PrefixSums(series.close)
+        self.prefix_builds += 1
+        self._prefix[symbol] = (fingerprint, series.close.copy(), sums)
+        self._prefix.move_to_end(symbol)
+        while len(self._prefix) > self.max_entries:
+            self._prefix.popitem(last=False)
+        return sums
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report store counters.
+
+        Returns:
+            Dict[str, int]: Bars folded incrementally, full rebuilds, prefix-sum
+            builds and symbols kept.
+        """
+        return {
+            "folded": self.folded,
+            "rebuilds": self.rebuilds,
+            "prefix_builds": self.prefix_builds,
+            "size": len(self._states),
+        }
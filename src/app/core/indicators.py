@@ -0,0 +1,456 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.providers.price_series import PriceSeries
+
+# Most extra windows accepted per indicator in one request
+MAX_WINDOWS = 10
+
+
+class IndicatorWindowError(ValueError):
+    """Raised when requested indicator windows are malformed or out of range."""
+
+
+def _finite(value: float) -> Optional[float]:
+    """
+    Convert an indicator value to a float, mapping NaN and infinities to None.
+
+    Args:
+        value (float): Indicator value.
+    Returns:
+        Optional[float]: The value, or None if it is not finite.
+    """
+    return float(value) if np.isfinite(value) else None
+
+def sma_series(closes: np.ndarray, window: int) -> np.ndarray:
+    """
+    Simple moving average at every bar, from a cumulative sum.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of closes to average.
+    Returns:
+        np.ndarray: Averages aligned with ``closes``; NaN until ``window`` closes are available.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(closes.shape, np.nan)
+    if window < 1 or closes.size < window:
+        return out
+    csum = np.concatenate(([0.0], np.cumsum(closes)))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+def rsi_series(closes: np.ndarray, window: int) -> np.ndarray:
+    """
+    Relative Strength Index at every bar, from the mean gain and loss of the last ``window`` changes.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of price changes to use.
+    Returns:
+        np.ndarray: RSI values aligned with ``closes``; NaN until ``window`` changes
+        are available and wherever there was no loss in the window.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(closes.shape, np.nan)
+    if window < 1 or closes.size < window + 1:
+        return out
+    deltas = np.diff(closes)
+    gains = sma_series(np.clip(deltas, 0.0, None), window)[window - 1:]
+    losses = sma_series(np.clip(-deltas, 0.0, None), window)[window - 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(losses > 0, 100.0 - 100.0 / (1.0 + gains / losses), np.nan)
+    out[window:] = rsi
+    return out
+
+def volatility_series(closes: np.ndarray, window: int) -> np.ndarray:
+    """
+    Sample standard deviation of the last ``window`` price changes at every bar.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of price changes to use.
+    Returns:
+        np.ndarray: Standard deviations aligned with ``closes``; NaN until ``window``
+        changes are available.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(closes.shape, np.nan)
+    if window < 2 or closes.size < window + 1:
+        return out
+    deltas = np.diff(closes)
+    windows = np.lib.stride_tricks.sliding_window_view(deltas, window)
+    out[window:] = windows.std(axis=1, ddof=1)
+    return out
+
+def sma(closes: np.ndarray, window: int) -> Optional[float]:
+    """
+    Simple moving average of the last ``window`` closes.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of closes to average.
+    Returns:
+        Optional[float]: The average or None if there are not enough closes.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if window < 1 or closes.size < window:
+        return None
+    return _finite(closes[-window:].mean())
+
+def rsi(closes: np.ndarray, window: int) -> Optional[float]:
+    """
+    Relative Strength Index from the mean gain and loss of the last ``window`` changes.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of price changes to use.
+    Returns:
+        Optional[float]: The RSI or None if it cannot be computed.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if window < 1 or closes.size < window + 1:
+        return None
+    return _finite(rsi_series(closes[-window - 1:], window)[-1])
+
+def volatility(closes: np.ndarray, window: int) -> Optional[float]:
+    """
+    Sample standard deviation of the last ``window`` changes in closing price.
+
+    Args:
+        closes (np.ndarray): Closing prices, oldest to newest.
+        window (int): Number of price changes to use.
+    Returns:
+        Optional[float]: The standard deviation or None if there are not enough closes.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if window < 2 or closes.size < window + 1:
+        return None
+    return _finite(np.diff(closes[-window - 1:]).std(ddof=1))
+
+def compute_indicators(series: PriceSeries) -> Dict[str, Any]:
+    """
+    Compute the technical indicators served by the API from daily bars.
+
+    Args:
+        series (PriceSeries): Daily bars, oldest to newest.
+    Returns:
+        Dict[str, Any]: ``sma_50d``, ``sma_200d``, ``above_200d``, ``rsi_14d``
+        and ``volatility_30``; values that cannot be computed are None.
+    """
+    closes = series.close
+    sma_200d = sma(closes, 200)
+    return {
+        "sma_50d": sma(closes, 50),
+        "sma_200d": sma_200d,
+        "above_200d": bool(closes[-1] > sma_200d) if sma_200d is not None and closes.size else None,
+        "rsi_14d": rsi(closes, 14),
+        "volatility_30": volatility(closes, 30),
+    }
+
+
+# Bars of history read by compute_indicators: the 200-day SMA is the longest window
+INDICATOR_LOOKBACK = 200
+
+def close_matrix(series: Sequence[PriceSeries], width: int = INDICATOR_LOOKBACK) -> np.ndarray:
+    """
+    Stack the last ``width`` closes of many series into one symbol x time matrix.
+
+    Rows are right-aligned on each series' latest bar, so column ``-k`` holds
+    every symbol's k-th most recent close; shorter series are NaN-padded on the left.
+
+    Args:
+        series (Sequence[PriceSeries]): Daily bars per symbol, oldest to newest.
+        width (int): Number of most recent bars kept per row.
+    Returns:
+        np.ndarray: ``(len(series), width)`` float64 matrix.
+    """
+    matrix = np.full((len(series), width), np.nan)
+    for row, bars in enumerate(series):
+        closes = bars.close[-width:]
+        if closes.size:
+            matrix[row, width - closes.size:] = closes
+    return matrix
+
+def compute_indicators_matrix(closes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute the standard indicators for every row of a close matrix at once.
+
+    Each row gives the same values as ``compute_indicators`` on that symbol's
+    bars: a window reaching into the NaN padding yields NaN.
+
+    Args:
+        closes (np.ndarray): ``(symbols, time)`` matrix from ``close_matrix``.
+    Returns:
+        Dict[str, np.ndarray]: Per-row ``sma_50d``, ``sma_200d``, ``rsi_14d`` and
+        ``volatility_30``, NaN where undefined, plus the boolean ``above_200d``.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    width = closes.shape[1]
+
+    def tail_mean(values: np.ndarray, window: int) -> np.ndarray:
+        if values.shape[1] < window:
+            return np.full(values.shape[0], np.nan)
+        return values[:, -window:].mean(axis=1)
+
+    deltas = np.diff(closes[:, -31:], axis=1)
+    gains = tail_mean(np.clip(deltas, 0.0, None), 14)
+    losses = tail_mean(np.clip(-deltas, 0.0, None), 14)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi_14d = np.where(losses > 0, 100.0 - 100.0 / (1.0 + gains / losses), np.nan)
+
+    volatility_30 = np.full(closes.shape[0], np.nan)
+    if width >= 31:
+        volatility_30 = deltas.std(axis=1, ddof=1)
+
+    sma_200d = tail_mean(closes, 200)
+    return {
+        "sma_50d": tail_mean(closes, 50),
+        "sma_200d": sma_200d,
+        "above_200d": closes[:, -1] > sma_200d if width else np.zeros(0, dtype=bool),
+        "rsi_14d": rsi_14d,
+        "volatility_30": volatility_30,
+    }
+
+def compute_indicators_many(series: Sequence[PriceSeries]) -> List[Dict[str, Any]]:
+    """
+    Compute the standard indicators for many symbols in one vectorised pass.
+
+    Args:
+        series (Sequence[PriceSeries]): Daily bars per symbol, oldest to newest.
+    Returns:
+        List[Dict[str, Any]]: One ``compute_indicators``-style dict per series, in order.
+    """
+    values = compute_indicators_matrix(close_matrix(series))
+    results: List[Dict[str, Any]] = []
+    for row in range(len(series)):
+        sma_200d = _finite(values["sma_200d"][row])
+        results.append({
+            "sma_50d": _finite(values["sma_50d"][row]),
+            "sma_200d": sma_200d,
+            "above_200d": bool(values["above_200d"][row]) if sma_200d is not None else None,
+            "rsi_14d": _finite(values["rsi_14d"][row]),
+            "volatility_30": _finite(values["volatility_30"][row]),
+        })
+    return results
+
+
+class PrefixSums:
+    """
+    Prefix sums over a close series answering any-window indicators in O(1).
+
+    Holds cumulative sums of the closes, of the price changes and their
+    squares, and of the gains and losses, so an SMA, volatility or RSI over
+    any window is a difference of two entries.
+    """
+    __slots__ = ("size", "_close", "_delta", "_delta_sq", "_gain", "_loss")
+
+    def __init__(self, closes: np.ndarray) -> None:
+        closes = np.asarray(closes, dtype=np.float64)
+        deltas = np.diff(closes)
+        self.size = closes.size
+        self._close = np.concatenate(([0.0], np.cumsum(closes)))
+        self._delta = np.concatenate(([0.0], np.cumsum(deltas)))
+        self._delta_sq = np.concatenate(([0.0], np.cumsum(deltas * deltas)))
+        self._gain = np.concatenate(([0.0], np.cumsum(np.clip(deltas, 0.0, None))))
+        self._loss = np.concatenate(([0.0], np.cumsum(np.clip(-deltas, 0.0, None))))
+
+    def sma(self, window: int) -> Optional[float]:
+        """
+        Simple moving average of the last ``window`` closes.
+
+        Args:
+            window (int): Number of closes to average.
+        Returns:
+            Optional[float]: The average or None if there are not enough closes.
+        """
+        if window < 1 or self.size < window:
+            return None
+        return _finite((self._close[-1] - self._close[-1 - window]) / window)
+
+    def rsi(self, window: int) -> Optional[float]:
+        """
+        Relative Strength Index from the mean gain and loss of the last ``window`` changes.
+
+        Args:
+            window (int): Number of price changes to use.
+        Returns:
+            Optional[float]: The RSI or None if it cannot be computed.
+        """
+        if window < 1 or self.size < window + 1:
+            return None
+        gain = self._gain[-1] - self._gain[-1 - window]
+        loss = self._loss[-1] - self._loss[-1 - window]
+        if loss <= 0:
+            return None
+        return _finite(100.0 - 100.0 / (1.0 + gain / loss))
+
+    def volatility(self, window: int) -> Optional[float]:
+        """
+        Sample standard deviation of the last ``window`` changes in closing price.
+
+        Args:
+            window (int): Number of price changes to use.
+        Returns:
+            Optional[float]: The standard deviation or None if there are not enough closes.
+        """
+        if window < 2 or self.size < window + 1:
+            return None
+        total = self._delta[-1] - self._delta[-1 - window]
+        total_sq = self._delta_sq[-1] - self._delta_sq[-1 - window]
+        variance = (total_sq - total * total / window) / (window - 1)
+        return _finite(np.sqrt(max(variance, 0.0)))
+
+
+def _parse_windows(raw: Optional[str], name: str, max_window: int) -> Tuple[int, ...]:
+    """
+    Parse a comma-separated list of windows such as ``"20,100"``.
+
+    Args:
+        raw (Optional[str]): Raw query value.
+        name (str): Indicator name, for error messages.
+        max_window (int): Largest window allowed.
+    Returns:
+        Tuple[int, ...]: Distinct windows in request order.
+    Raises:
+        IndicatorWindowError: If a window is not a positive integer up to ``max_window``
+            or more than MAX_WINDOWS are requested.
+    """
+    if raw is None or not raw.strip():
+        return ()
+    windows = []
+    for part in raw.split(","):
+        part = part.strip()
+        if not part.isdigit() or not 1 <= int(part) <= max_window:
+            raise IndicatorWindowError(f"{name} windows must be integers between 1 and {max_window}; got '{part}'.")
+        windows.append(int(part))
+    windows = list(dict.fromkeys(windows))
+    if len(windows) > MAX_WINDOWS:
+        raise IndicatorWindowError(f"At most {MAX_WINDOWS} {name} windows can be requested.")
+    return tuple(windows)
+
+
+@dataclass(frozen=True)
+class IndicatorWindows:
+    """Extra indicator windows requested on top of the standard ones."""
+    sma: Tuple[int, ...] = ()
+    rsi: Tuple[int, ...] = ()
+    volatility: Tuple[int, ...] = ()
+
+    @classmethod
+    def parse(
+        cls,
+        sma: Optional[str] = None,
+        rsi: Optional[str] = None,
+        volatility: Optional[str] = None,
+        max_window: int = 200,
+    ) -> "IndicatorWindows":
+        """
+        Build windows from comma-separated query values.
+
+        Args:
+            sma (Optional[str]): SMA windows, e.g. ``"20,100"``.
+            rsi (Optional[str]): RSI windows.
+            volatility (Optional[str]): Volatility windows.
+            max_window (int): Largest window allowed (the history window).
+        Returns:
+            IndicatorWindows: The parsed windows.
+        Raises:
+            IndicatorWindowError: If any value is invalid.
+        """
+        return cls(
+            sma=_parse_windows(sma, "sma", max_window),
+            rsi=_parse_windows(rsi, "rsi", max_window),
+            volatility=_parse_windows(volatility, "volatility", max_window),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.sma or self.rsi or self.volatility)
+
+    @property
+    def key(self) -> str:
+        """Canonical form of the windows, e.g. for cache keys."""
+        return ";".join(
+            f"{name}={','.join(map(str, sorted(getattr(self, name))))}"
+            for name in ("sma", "rsi", "volatility")
+            if getattr(self, name)
+        )
+
+    def compute(self, sums: PrefixSums) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Compute the requested windows from prefix sums.
+
+        Args:
+            sums (PrefixSums): Prefix sums of the symbol's closes.
+        Returns:
+            Dict[str, Dict[str, Optional[float]]]: ``sma``, ``rsi`` and ``volatility``
+            values keyed by window.
+        """
+        return {
+            "sma": {str(w): sums.sma(w) for w in self.sma},
+            "rsi": {str(w): sums.rsi(w) for w in self.rsi},
+            "volatility": {str(w): sums.volatility(w) for w in self.volatility},
+        }
+
+
+@dataclass
+class IndicatorHistory:
+    """Indicator series aligned with their bar timestamps, oldest to newest."""
+    symbol: str
+    timestamps: np.ndarray
+    columns: Dict[str, np.ndarray]
+
+
+def warmup_bars(windows: Optional[IndicatorWindows] = None) -> int:
+    """
+    Number of bars needed before a row for all its indicators to be defined.
+
+    Args:
+        windows (Optional[IndicatorWindows]): Extra windows requested.
+    Returns:
+        int: Bars of warm-up history.
+    """
+    windows = windows or IndicatorWindows()
+    longest = max((200, *windows.sma, *(w + 1 for w in (14, 30, *windows.rsi, *windows.volatility))))
+    return longest - 1
+
+def indicator_history(symbol: str, series: PriceSeries, rows: int, windows: Optional[IndicatorWindows] = None) -> IndicatorHistory:
+    """
+    Compute whole indicator series in one vectorised pass.
+
+    Indicators are computed over the full series, then only the last ``rows``
+    bars are kept, so earlier bars serve as warm-up for the long windows.
+
+    Args:
+        symbol (str): Normalised stock ticker symbol.
+        series (PriceSeries): Daily bars, oldest to newest.
+        rows (int): Number of most recent bars to return.
+        windows (Optional[IndicatorWindows]): Extra windows to include.
+    Returns:
+        IndicatorHistory: ``close``, the standard indicators and any extra
+        windows (``sma_<w>``, ``rsi_<w>``, ``volatility_<w>``); NaN where undefined.
+    """
+    windows = windows or IndicatorWindows()
+    closes = series.close
+    columns: Dict[str, np.ndarray] = {
+        "close": closes,
+        "sma_50d": sma_series(closes, 50),
+        "sma_200d": sma_series(closes, 200),
+        "rsi_14d": rsi_series(closes, 14),
+        "volatility_30": volatility_series(closes, 30),
+    }
+    for window in windows.sma:
+        columns[f"sma_{window}"] = sma_series(closes, window)
+    for window in windows.rsi:
+        columns[f"rsi_{window}"] = rsi_series(closes, window)
+    for window in windows.volatility:
+        columns[f"volatility_{window}"] = volatility_series(closes, window)
+
+    start = max(len(series) - rows, 0)
+    return IndicatorHistory(
+        symbol=symbol,
+        timestamps=series.timestamps[start:],
+        columns={name: values[start:] for name, values in columns.items()},
+    )
@@ -0,0 +1,86 @@
+import asyncio
+import importlib
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Sequence
+
+from app.core.config import Settings, settings
+from app.core.services import Services
+from app.metrics.batch import evaluate_batch
+from app.providers.stack import find_layer
+from app.providers.yahoo_client import YFinanceYahooClient
+from app.providers.yahoo_http import HttpYahooClient
+
+logger = logging.getLogger(__name__)
+
+# Modules the yfinance backend otherwise imports on its first call
+_YFINANCE_MODULES = ("pandas", "yfinance")
+
+
+def _import_modules(names: Sequence[str]) -> None:
+    """Import modules so later imports are dictionary lookups."""
+    for name in names:
+        importlib.import_module(name)
+
+async def _open_connections(services: Services) -> None:
+    """
+    Start the backend's worker threads or connection pool.
+
+    Args:
+        services (Services): The shared services.
+    """
+    http = find_layer(services.yahoo_client, HttpYahooClient)
+    if http is not None:
+        # Any response leaves a TLS connection in the keep-alive pool
+        await http.http.get("/")
+    yfinance = find_layer(services.yahoo_client, YFinanceYahooClient)
+    if yfinance is not None and yfinance.executor is not None:
+        await yfinance.executor.run(lambda: None)
+
+async def _prefetch(services: Services, symbols: Sequence[str]) -> None:
+    """
+    Evaluate the watchlist to fill the history, provider and metric caches.
+
+    Args:
+        services (Services): The shared services.
+        symbols (Sequence[str]): Watchlist symbols.
+    """
+    response = await evaluate_batch(symbols, services)
+    if response.errors:
+        logger.warning("Prewarm could not evaluate %s", sorted(response.errors))
+
+async def prewarm(services: Services, config: Settings = settings) -> Dict[str, float]:
+    """
+    Warm the process before it serves traffic.
+
+    Runs three phases in order: importing the backend's heavy modules,
+    opening provider connections and evaluating ``prewarm_symbols``. A phase
+    that fails or runs past ``prewarm_timeout_seconds`` is logged and
+    skipped; prewarming never prevents startup.
+
+    Args:
+        services (Services): The shared services.
+        config (Settings): Application settings.
+    Returns:
+        Dict[str, float]: Time spent in each phase, in milliseconds.
+    """
+    modules = _YFINANCE_MODULES if config.yahoo_client_backend == "yfinance" else ()
+    phases: Dict[str, Callable[[], Awaitable[None]]] = {
+        "imports": lambda: asyncio.to_thread(_import_modules, modules),
+        "connections": lambda: _open_connections(services),
+    }
+    if config.prewarm_symbols:
+        phases["prefetch"] = lambda: _prefetch(services, config.prewarm_symbols)
+
+    timings: Dict[str, float] = {}
+    for name, phase in phases.items():
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(phase(), timeout=config.prewarm_timeout_seconds)
+        except Exception as e:
+            logger.warning("Prewarm phase '%s' failed: %r", name, e)
+        timings[name] = (time.perf_counter() - started) * 1000.0
+        logger.info("Prewarm phase '%s' took %.0f ms", name, timings[name])
+
+    logger.info("Prewarm finished in %.0f ms", sum(timings.values()))
+    return timings
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import Optional
 
 from app.utils.ticker import normalise_and_validate_ticker, InvalidTickerError
 from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError, YahooClientError
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
 from app.schemas.price import PriceResponse
+from app.core.stale import StaleFallback
 
 class PriceDataError(Exception):
     """Custom exception for price data retrieval errors."""
@@ -29,6 +32,12 @@ class PriceService:
     Service for retrieving price data
     """
     yahoo_client: YahooClient
+    history_store: Optional[HistoryStore] = None
+    fallback: Optional[StaleFallback] = None
+    
+    def __post_init__(self) -> None:
+        if self.history_store is None:
+            self.history_store = HistoryStore(yahoo_client=self.yahoo_client)
     
     async def get_price_for_symbol(self, raw_symbol: str) -> PriceResponse:
         """
@@ -42,8 +51,21 @@ class PriceService:
         """
         symbol = normalise_and_validate_ticker(raw_symbol)
         
+        if self.fallback is None:
+            return await self._fetch_price(symbol)
+        return await self.fallback.serve(("price", symbol), lambda: self._fetch_price(symbol))
+    
+    async def _fetch_price(self, symbol: str) -> PriceResponse:
+        """
+        Build a fresh price data response from the provider.
+
+        Args:
+            symbol (str): The normalised symbol.
+        Returns:
+            PriceResponse: The price data response.
+        """
         try:
-            history: List[Dict[str, Any]] = await self.yahoo_client.fetch_daily_history(symbol, days=7)
+            history: PriceSeries = await self.history_store.get_history(symbol, days=7)
         except (YahooSymbolNotFoundError, YahooClientError):
             # Bubble up to the API
             raise
@@ -52,9 +74,9 @@ class PriceService:
             raise PriceDataError(f"Not enough price data for symbol '{symbol}'.")
         
         # History is oldest to newest
-        latest = history[-1]["close"]
-        prev_close = history[-2]["close"]
-        week_ago_close = history[0]["close"]
+        latest = history.close[-1]
+        prev_close = history.close[-2]
+        week_ago_close = history.close[0]
         
         current = float(latest)
         change_1d_pct = _pct_change(current, float(prev_close))
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import List
+
+from app.core.config import Settings, settings
+from app.core.fundamentals_service import FundamentalsService
+from app.core.indicator_state import IndicatorStateStore
+from app.core.price_service import PriceService
+from app.core.stale import StaleFallback
+from app.core.technical_service import TechnicalService
+from app.core.ticker_validation import TickerValidationService
+from app.metrics import build_metrics
+from app.metrics.base import BaseMetric
+from app.metrics.cache import MetricResultCache
+from app.providers.bar_store import build_bar_store
+from app.providers.circuit_breaker import CircuitBreakerYahooClient
+from app.providers.history_store import HistoryStore
+from app.providers.stack import build_yahoo_client, find_layer
+from app.providers.yahoo_client import YahooClient, YFinanceYahooClient
+from app.providers.yahoo_http import HttpYahooClient
+
+
+@dataclass
+class Services:
+    """
+    The application's shared provider stack and the services built on it.
+
+    Built once by the app lifespan and kept on ``app.state.services`` so
+    caches, pools, limiter and breaker state live across requests; routes
+    receive the services through dependencies and evaluations run the
+    metrics built here instead of constructing their own.
+    """
+    yahoo_client: YahooClient
+    history_store: HistoryStore
+    stale_fallback: StaleFallback
+    indicators: IndicatorStateStore
+    metric_cache: MetricResultCache
+    price: PriceService
+    fundamentals: FundamentalsService
+    technical: TechnicalService
+    ticker_validation: TickerValidationService
+    metrics: List[BaseMetric]
+
+    @classmethod
+    def build(cls, config: Settings = settings) -> "Services":
+        """
+        Build the provider stack, stores and services.
+
+        Args:
+            config (Settings): Application settings.
+        Returns:
+            Services: The shared services.
+        """
+        client = build_yahoo_client(config)
+        history_store = HistoryStore(
+            yahoo_client=client,
+            window_days=config.history_window_days,
+            ttl_seconds=config.history_ttl_seconds,
+            max_entries=config.history_max_entries,
+            bar_store=build_bar_store(config),
+        )
+        breaker = find_layer(client, CircuitBreakerYahooClient)
+        fallback = StaleFallback(
+            breaker=breaker.breaker if breaker is not None else None,
+            max_entries=config.stale_max_entries,
+            max_age=config.stale_max_age_seconds,
+        )
+        indicators = IndicatorStateStore(max_entries=config.indicator_state_max_symbols)
+        price = PriceService(yahoo_client=client, history_store=history_store, fallback=fallback)
+        fundamentals = FundamentalsService(yahoo_client=client, fallback=fallback)
+        technical = TechnicalService(yahoo_client=client, history_store=history_store, fallback=fallback, indicators=indicators)
+        return cls(
+            yahoo_client=client,
+            history_store=history_store,
+            stale_fallback=fallback,
+            indicators=indicators,
+            metric_cache=MetricResultCache(max_entries=config.metric_cache_max_entries),
+            price=price,
+            fundamentals=fundamentals,
+            technical=technical,
+            ticker_validation=TickerValidationService(yahoo_client=client),
+            metrics=build_metrics(price, fundamentals, technical),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Release the backend's connections and worker threads and the bar store.
+
+        Both are recreated on next use, so the services stay usable afterwards.
+        """
+        http = find_layer(self.yahoo_client, HttpYahooClient)
+        if http is not None:
+            await http.aclose()
+        yfinance = find_layer(self.yahoo_client, YFinanceYahooClient)
+        if yfinance is not None and yfinance.executor is not None:
+            yfinance.executor.shutdown()
+        close_store = getattr(self.history_store.bar_store, "close", None)
+        if close_store is not None:
+            close_store()
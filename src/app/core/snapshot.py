@@ -0,0 +1,163 @@
+import logging
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+import msgpack
+import numpy as np
+
+from app.core.services import Services
+from app.metrics.cache import MetricResultCache
+from app.providers.caching import CachingYahooClient
+from app.providers.price_series import PriceSeries
+from app.providers.stack import find_layer
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# msgpack extension type codes
+_EXT_PRICE_SERIES = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+
+_SERIES_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _encode(value: Any) -> Any:
+    """
+    Encode values msgpack does not know as extension types.
+
+    Args:
+        value (Any): Value found while packing.
+    Returns:
+        Any: A msgpack-native value or ExtType.
+    Raises:
+        TypeError: If the value cannot be encoded.
+    """
+    if isinstance(value, PriceSeries):
+        payload = [value.timestamps.astype("int64").tobytes()]
+        payload += [getattr(value, column).tobytes() for column in _SERIES_COLUMNS]
+        return msgpack.ExtType(_EXT_PRICE_SERIES, msgpack.packb(payload))
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat(timespec="microseconds").encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot snapshot value of type {type(value).__name__}.")
+
+def _decode(code: int, data: bytes) -> Any:
+    """
+    Decode the extension types written by ``_encode``.
+
+    Args:
+        code (int): Extension type code.
+        data (bytes): Extension payload.
+    Returns:
+        Any: The decoded value.
+    """
+    if code == _EXT_PRICE_SERIES:
+        timestamps, *columns = msgpack.unpackb(data)
+        return PriceSeries(
+            np.frombuffer(timestamps, dtype="int64").astype("datetime64[ns]"),
+            *(np.frombuffer(column, dtype=np.float64).copy() for column in columns),
+        )
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+def _pack_entries(entries: List[Any], section: str) -> List[bytes]:
+    """
+    Pack entries one by one, skipping any that cannot be encoded.
+
+    Args:
+        entries (List[Any]): Entries exported by a cache.
+        section (str): Cache name, for logging.
+    Returns:
+        List[bytes]: Packed entries.
+    """
+    packed: List[bytes] = []
+    for entry in entries:
+        try:
+            packed.append(msgpack.packb(entry, default=_encode))
+        except (TypeError, ValueError, OverflowError) as e:
+            logger.debug("Skipping %s snapshot entry: %s", section, e)
+    return packed
+
+def _unpack_entries(packed: List[bytes]) -> List[Any]:
+    return [msgpack.unpackb(entry, ext_hook=_decode, strict_map_key=False) for entry in packed]
+
+def save_snapshot(path: str, services: Services, metric_cache: Optional[MetricResultCache] = None) -> Dict[str, int]:
+    """
+    Write the provider, history and metric result caches to a msgpack file.
+
+    Entries keep their expiry as wall-clock time, so a restored entry
+    expires when the original would have. The file is replaced atomically.
+
+    Args:
+        path (str): Snapshot file path.
+        services (Services): The shared services.
+        metric_cache (Optional[MetricResultCache]): Metric result cache to include.
+    Returns:
+        Dict[str, int]: Entries written per cache.
+    """
+    provider = find_layer(services.yahoo_client, CachingYahooClient)
+    sections = {
+        "provider": _pack_entries(provider.snapshot() if provider is not None else [], "provider"),
+        "history": _pack_entries(services.history_store.snapshot(), "history"),
+        "metrics": _pack_entries(metric_cache.snapshot() if metric_cache is not None else [], "metrics"),
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(msgpack.packb({"version": SNAPSHOT_VERSION, "saved_at": time.time(), **sections}))
+    os.replace(tmp_path, path)
+
+    counts = {name: len(entries) for name, entries in sections.items()}
+    logger.info("Saved cache snapshot to %s: %s", path, counts)
+    return counts
+
+def load_snapshot(path: str, services: Services, metric_cache: Optional[MetricResultCache] = None) -> Dict[str, int]:
+    """
+    Restore caches from a snapshot written by ``save_snapshot``.
+
+    Entries that expired in the meantime are skipped. A missing, unreadable
+    or incompatible file restores nothing.
+
+    Args:
+        path (str): Snapshot file path.
+        services (Services): The shared services.
+        metric_cache (Optional[MetricResultCache]): Metric result cache to fill.
+    Returns:
+        Dict[str, int]: Entries restored per cache.
+    """
+    counts = {"provider": 0, "history": 0, "metrics": 0}
+    if not os.path.exists(path):
+        return counts
+
+    try:
+        with open(path, "rb") as f:
+            snapshot = msgpack.unpackb(f.read())
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning("Ignoring cache snapshot %s with version %r", path, snapshot.get("version"))
+            return counts
+
+        provider = find_layer(services.yahoo_client, CachingYahooClient)
+        if provider is not None:
+            counts["provider"] = provider.restore(_unpack_entries(snapshot.get("provider", [])))
+        counts["history"] = services.history_store.restore(_unpack_entries(snapshot.get("history", [])))
+        if metric_cache is not None:
+            counts["metrics"] = metric_cache.restore(_unpack_entries(snapshot.get("metrics", [])))
+    except Exception as e:
+        logger.warning("Could not load cache snapshot %s: %r", path, e)
+        return counts
+
+    logger.info("Restored cache snapshot from %s: %s", path, counts)
+    return counts
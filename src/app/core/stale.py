@@ -0,0 +1,108 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.providers.circuit_breaker import CLOSED, HALF_OPEN, CircuitBreaker
+from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
+
+R = TypeVar("R", bound=BaseModel)
+
+
+@dataclass
+class StaleFallback:
+    """
+    Last-known-good responses served while the provider is unhealthy.
+
+    While the breaker is not closed, responses come straight from the last good
+    value, marked ``stale``; once the breaker turns half-open a background
+    refresh is started so the next caller gets fresh data. While the breaker is
+    closed, a failed upstream call also falls back to the last good value.
+    Values older than ``max_age`` seconds are never served.
+    """
+    breaker: Optional[CircuitBreaker] = None
+    max_entries: int = settings.stale_max_entries
+    max_age: float = settings.stale_max_age_seconds
+    clock: Callable[[], float] = time.time
+    served_stale: int = field(default=0, init=False)
+    refreshes: int = field(default=0, init=False)
+    # (kind, symbol) -> (stored_at, response), least recently used first
+    _entries: "OrderedDict[Tuple[str, str], Tuple[float, BaseModel]]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _refreshing: Dict[Tuple[str, str], "asyncio.Task[Any]"] = field(default_factory=dict, init=False, repr=False)
+
+    async def serve(self, key: Tuple[str, str], fetch: Callable[[], Awaitable[R]]) -> R:
+        """
+        Fetch a response, falling back to the last good one on provider trouble.
+
+        Args:
+            key (Tuple[str, str]): Response kind and symbol.
+            fetch (Callable[[], Awaitable[R]]): Builds a fresh response.
+        Returns:
+            R: A fresh response, or the last good one with ``stale`` set.
+        Raises:
+            YahooClientError: If the provider failed and there is no last good value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self.clock() - entry[0] > self.max_age:
+            del self._entries[key]
+            entry = None
+
+        if entry is not None and self.breaker is not None and self.breaker.state != CLOSED:
+            if self.breaker.state == HALF_OPEN:
+                self._refresh_in_background(key, fetch)
+            return self._stale(entry)
+
+        try:
+            response = await fetch()
+        except YahooSymbolNotFoundError:
+            raise
+        except YahooClientError:
+            if entry is None:
+                raise
+            return self._stale(entry)
+
+        self._store(key, response)
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report fallback counters.
+
+        Returns:
+            Dict[str, int]: Stale responses served, background refreshes started and entries kept.
+        """
+        return {
+            "served_stale": self.served_stale,
+            "refreshes": self.refreshes,
+            "size": len(self._entries),
+        }
+
+    def _stale(self, entry: Tuple[float, BaseModel]) -> Any:
+        self.served_stale += 1
+        return entry[1].model_copy(update={"stale": True})
+
+    def _store(self, key: Tuple[str, str], response: BaseModel) -> None:
+        self._entries[key] = (self.clock(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: Tuple[str, str], fetch: Callable[[], Awaitable[R]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            try:
+                self._store(key, await fetch())
+            except Exception:
+                # The breaker records the failure; keep serving the last good value
+                pass
+            finally:
+                self._refreshing.pop(key, None)
+
+        self.refreshes += 1
+        self._refreshing[key] = asyncio.ensure_future(_refresh())
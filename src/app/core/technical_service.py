@@ -1,12 +1,20 @@
 from dataclasses import dataclass
-from typing import Any, Dict
-
-from math import isfinite
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError, YahooClientError
+from app.providers.history_store import HistoryStore
 from app.schemas.technical import TechnicalResponse
+from app.core.stale import StaleFallback
 from app.utils.ticker import normalise_and_validate_ticker
-from app.core.utils.service_helpers import _safe_float
+from app.core.indicator_state import IndicatorStateStore
+from app.core.indicators import (
+    INDICATOR_LOOKBACK,
+    IndicatorHistory,
+    IndicatorWindows,
+    compute_indicators_many,
+    indicator_history,
+    warmup_bars,
+)
 
 class TechnicalDataError(Exception):
     """Exception for error in fetching technical data.
@@ -18,29 +26,99 @@ class TechnicalService:
     Service for fetching technical data.
     """
     yahoo_client: YahooClient
+    history_store: Optional[HistoryStore] = None
+    fallback: Optional[StaleFallback] = None
+    indicators: Optional[IndicatorStateStore] = None
+    
+    def __post_init__(self) -> None:
+        if self.history_store is None:
+            self.history_store = HistoryStore(yahoo_client=self.yahoo_client)
+        if self.indicators is None:
+            self.indicators = IndicatorStateStore()
     
-    async def get_technical_for_symbol(self, raw_symbol: str) -> TechnicalResponse:
+    async def get_technical_for_symbol(self, raw_symbol: str, windows: Optional[IndicatorWindows] = None) -> TechnicalResponse:
         """
         Get technical data for a symbol.
 
         Args:
             raw_symbol (str): The raw symbol to get technical data for.
+            windows (Optional[IndicatorWindows]): Extra indicator windows to compute.
         Returns:
             TechnicalResponse: The technical data response.
         """
         symbol = normalise_and_validate_ticker(raw_symbol)
         
+        if self.fallback is None:
+            return await self._fetch_technical(symbol, windows)
+        kind = f"technical?{windows.key}" if windows else "technical"
+        return await self.fallback.serve((kind, symbol), lambda: self._fetch_technical(symbol, windows))
+    
+    async def _fetch_technical(self, symbol: str, windows: Optional[IndicatorWindows] = None) -> TechnicalResponse:
+        """
+        Build a fresh technical data response from the provider.
+
+        Args:
+            symbol (str): The normalised symbol.
+            windows (Optional[IndicatorWindows]): Extra indicator windows to compute.
+        Returns:
+            TechnicalResponse: The technical data response.
+        """
         try:
-            raw = await self.yahoo_client.fetch_technical(symbol)
+            history = await self.history_store.get_history(symbol, days=200)
         except (YahooSymbolNotFoundError, YahooClientError):
             # Bubble up to the API
             raise
         
-        return TechnicalResponse(
-            symbol=symbol,
-            sma_50d=_safe_float(raw.get("sma_50d")),
-            sma_200d=_safe_float(raw.get("sma_200d")),
-            above_200d=raw.get("above_200d"),
-            rsi_14d=_safe_float(raw.get("rsi_14d")),
-            volatility_30=_safe_float(raw.get("volatility_30"))
-        )
\ No newline at end of file
+        if not len(history):
+            raise TechnicalDataError(f"No price history for symbol '{symbol}'.")
+        
+        # Only bars newer than the last call are folded into the indicator state
+        values = self.indicators.update(symbol, history)
+        if windows:
+            # Extra windows come from the same history via cached prefix sums
+            values.update(windows.compute(self.indicators.prefix_sums(symbol, history)))
+        return TechnicalResponse(symbol=symbol, **values)
+    
+    async def get_technical_for_symbols(self, raw_symbols: Sequence[str]) -> Dict[str, TechnicalResponse]:
+        """
+        Get technical data for many symbols in one pass.
+
+        Histories come from one batch fetch and the indicators for all
+        symbols are computed together over a symbol x time close matrix.
+
+        Args:
+            raw_symbols (Sequence[str]): The raw symbols to get technical data for.
+        Returns:
+            Dict[str, TechnicalResponse]: Responses keyed by normalised symbol, in
+            request order; symbols without price history are left out.
+        Raises:
+            InvalidTickerError: If any symbol is malformed.
+        """
+        symbols = list(dict.fromkeys(normalise_and_validate_ticker(raw) for raw in raw_symbols))
+        histories = await self.history_store.get_history_many(symbols, days=INDICATOR_LOOKBACK)
+
+        found = [symbol for symbol in symbols if symbol in histories and len(histories[symbol])]
+        values = compute_indicators_many([histories[symbol] for symbol in found])
+        return {symbol: TechnicalResponse(symbol=symbol, **row) for symbol, row in zip(found, values)}
+    
+    async def get_indicator_history(self, raw_symbol: str, days: int, windows: Optional[IndicatorWindows] = None) -> IndicatorHistory:
+        """
+        Get full indicator series for the most recent ``days`` bars of a symbol.
+
+        Warm-up bars for the longest window are fetched as well, so every
+        returned row has its indicators defined when enough history exists.
+
+        Args:
+            raw_symbol (str): The raw symbol to get indicator history for.
+            days (int): Number of bars to return.
+            windows (Optional[IndicatorWindows]): Extra indicator windows to include.
+        Returns:
+            IndicatorHistory: Indicator series aligned with bar timestamps.
+        """
+        symbol = normalise_and_validate_ticker(raw_symbol)
+        
+        history = await self.history_store.get_history(symbol, days=days + warmup_bars(windows))
+        if not len(history):
+            raise TechnicalDataError(f"No price history for symbol '{symbol}'.")
+        
+        return indicator_history(symbol, history, rows=days, windows=windows)
@@ -1,8 +1,45 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
 
-from app.api.routes import tickers, price, fundamentals, technical, eval
+from app.api.routes import tickers, price, fundamentals, technical, eval, health
 from app.core.config import settings
+from app.core.services import Services
+from app.core.prewarm import prewarm
+from app.core.snapshot import load_snapshot, save_snapshot
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the shared provider stack and services at startup, release them at shutdown.
+
+    With ``settings.cache_snapshot_path`` the caches are restored from the
+    snapshot first and saved back at shutdown. With ``settings.prewarm_enabled``
+    the startup also runs ``prewarm``, so the server only starts accepting
+    requests once the process is warm.
+
+    Args:
+        app (FastAPI): The application being served.
+    """
+    services = Services.build()
+    app.state.services = services
+    if settings.cache_snapshot_path:
+        load_snapshot(settings.cache_snapshot_path, services, services.metric_cache)
+    if settings.prewarm_enabled:
+        await prewarm(services)
+    try:
+        yield
+    finally:
+        if settings.cache_snapshot_path:
+            try:
+                save_snapshot(settings.cache_snapshot_path, services, services.metric_cache)
+            except OSError as e:
+                logger.warning("Could not save cache snapshot: %r", e)
+        await services.aclose()
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
@@ -12,7 +49,8 @@ def create_app() -> FastAPI:
     """
     
     app = FastAPI(
-        title=settings.app_name,)
+        title=settings.app_name,
+        lifespan=lifespan,)
     
     app.include_router(tickers.router)
     
@@ -25,6 +63,8 @@ def create_app() -> FastAPI:
     # Evaluate all
     app.include_router(eval.router)
     
+    app.include_router(health.router)
+    
     return app
 
 app = create_app()
\ No newline at end of file
@@ -1,32 +1,192 @@
-from typing import Dict, Any, List
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Type
 
 from .base import BaseMetric
 from .price import StockPriceMetric
 from .fundamentals import StockFundamentalsMetric
 from .technical import StockTechnicalMetric
+from .selection import MetricSelection, MetricSelectionError
+from .cache import MetricResultCache
 
-# List of all available metrics
-_METRICS: List[BaseMetric] = [
-    StockPriceMetric(),
-    StockFundamentalsMetric(),
-    StockTechnicalMetric(),
-    
+from app.core.config import settings
+from app.core.evaluation_context import EvaluationContext
+from app.core.fundamentals_service import FundamentalsService
+from app.core.price_service import PriceService
+from app.core.technical_service import TechnicalService
+from app.schemas.eval import EvalResponse, MetricStatus
+from app.utils.ticker import normalise_and_validate_ticker
+
+if TYPE_CHECKING:
+    from app.core.services import Services
+
+# All available metrics, in evaluation order
+METRIC_TYPES: List[Type[BaseMetric]] = [
+    StockPriceMetric,
+    StockFundamentalsMetric,
+    StockTechnicalMetric,
 ]
 
-async def evaluate_all(ticker: str) -> Dict[str, Any]:
-    """Evaluate all metrics for a given ticker.
+def build_metrics(price: PriceService, fundamentals: FundamentalsService, technical: TechnicalService) -> List[BaseMetric]:
+    """Build one instance of every available metric on the given services.
+
+    Args:
+        price (PriceService): Service behind the price metric.
+        fundamentals (FundamentalsService): Service behind the fundamentals metric.
+        technical (TechnicalService): Service behind the technical metric.
+    Returns:
+        List[BaseMetric]: The metrics, in ``METRIC_TYPES`` order.
+    """
+    return [
+        StockPriceMetric(price),
+        StockFundamentalsMetric(fundamentals),
+        StockTechnicalMetric(technical),
+    ]
+
+class MetricTimeoutError(Exception):
+    """Raised when every metric of an evaluation ran past its deadline."""
+
+def parse_metric_selection(value: Optional[str]) -> MetricSelection:
+    """Parse a ``?metrics=`` value against the available metrics.
+
+    Args:
+        value (Optional[str]): Comma-separated metric names and keys.
+    Returns:
+        MetricSelection: The selection; empty means every metric.
+    Raises:
+        MetricSelectionError: If a metric name or key is unknown.
+    """
+    return MetricSelection.parse(value, METRIC_TYPES)
+
+async def _run_metric(
+    metric: BaseMetric,
+    ticker: str,
+    context: EvaluationContext,
+    precomputed: Optional[Any] = None,
+) -> Tuple[Any, MetricStatus, Exception | None]:
+    """Run a single metric under its configured deadline.
+
+    Args:
+        metric (BaseMetric): Metric to compute.
+        ticker (str): Normalised stock ticker symbol.
+        context (EvaluationContext): Provider context shared by the evaluation.
+        precomputed (Optional[Any]): Value already computed by the caller; the
+            metric is then not run.
+    Returns:
+        Tuple[Any, MetricStatus, Exception | None]: The computed value (or None),
+        the metric status and the error raised, if any.
+    """
+    if precomputed is not None:
+        return precomputed, MetricStatus(status="ok", elapsed_ms=0.0), None
+
+    timeout = settings.timeout_for(metric.name)
+    started = time.perf_counter()
+
+    def _elapsed_ms() -> float:
+        return (time.perf_counter() - started) * 1000.0
+
+    try:
+        value = await asyncio.wait_for(metric.compute(ticker, context), timeout=timeout)
+    except asyncio.TimeoutError:
+        error = MetricTimeoutError(f"Metric '{metric.name}' timed out after {timeout:g}s.")
+        return None, MetricStatus(status="timeout", error=str(error), elapsed_ms=_elapsed_ms()), error
+    except Exception as e:
+        return None, MetricStatus(status="error", error=str(e), elapsed_ms=_elapsed_ms()), e
+
+    return value, MetricStatus(status="ok", elapsed_ms=_elapsed_ms(), stale=metric.name in context.stale), None
+
+async def _run_cached_metric(
+    metric: BaseMetric,
+    ticker: str,
+    context: EvaluationContext,
+    cache: Optional[MetricResultCache],
+    precomputed: Optional[Any] = None,
+) -> Tuple[Any, MetricStatus, Exception | None]:
+    """Serve a metric from the result cache, or run it and cache its values.
+
+    Metrics without a ``freshness`` policy always run. Nothing is cached
+    once the evaluation has served any stale data.
+
+    Args:
+        metric (BaseMetric): Metric to compute.
+        ticker (str): Normalised stock ticker symbol.
+        context (EvaluationContext): Provider context shared by the evaluation.
+        cache (Optional[MetricResultCache]): Result cache, or None when disabled.
+        precomputed (Optional[Any]): Value already computed by the caller.
+    Returns:
+        Tuple[Any, MetricStatus, Exception | None]: As from ``_run_metric``.
+    """
+    freshness = getattr(metric, "freshness", None)
+    if cache is None or freshness is None:
+        return await _run_metric(metric, ticker, context, precomputed)
+
+    cached = cache.get(metric.name, ticker)
+    if cached is not None:
+        return cached, MetricStatus(status="ok", elapsed_ms=0.0, cached=True), None
+
+    value, status, error = await _run_metric(metric, ticker, context, precomputed)
+    # Values built from last-known-good data must not outlive the outage
+    if error is None and not context.stale:
+        cache.put(metric.name, ticker, value, freshness)
+    return value, status, error
+
+async def evaluate_all(
+    ticker: str,
+    services: "Services",
+    selection: Optional[MetricSelection] = None,
+    precomputed: Optional[Dict[str, Any]] = None,
+) -> EvalResponse:
+    """Evaluate all metrics for a given ticker concurrently.
+
+    Each metric runs under its own deadline (see ``Settings.timeout_for``).
+    All metrics share one EvaluationContext, so each upstream dataset is
+    fetched once per evaluation.
+    Metrics that fail or time out are reported in ``status`` and left out of
+    ``metrics``; the evaluation only fails when no metric completed.
+    With a selection, metrics outside it are not run at all, so their
+    provider data is never fetched. Metric blocks still fresh in the result
+    cache are served from it; only stale or missing ones are recomputed.
 
     Args:
         ticker (str): Stock ticker symbol.
+        services (Services): Shared services providing the metrics, provider and result cache.
+        selection (Optional[MetricSelection]): Metrics and keys to return. Defaults to all.
+        precomputed (Optional[Dict[str, Any]]): Metric values already computed
+            for this symbol (e.g. by a batch), keyed by metric name; those
+            metrics are not run.
     Returns:
-        Dict[str, Any]: Dictionary of metric names and their computed values.
+        EvalResponse: Computed metric values and per-metric status.
+    Raises:
+        InvalidTickerError: If the ticker format is invalid.
+        MetricTimeoutError: If every metric timed out.
+        Exception: The first metric error when no metric completed.
     """
-    
+    symbol = normalise_and_validate_ticker(ticker)
+    context = EvaluationContext(yahoo_client=services.yahoo_client)
+
+    selection = selection or MetricSelection()
+    metrics = [metric for metric in services.metrics if selection.includes(metric.name)]
+
+    cache = services.metric_cache if settings.metric_cache_enabled else None
+    precomputed = precomputed or {}
+    outcomes = await asyncio.gather(*(
+        _run_cached_metric(metric, symbol, context, cache, precomputed.get(metric.name)) for metric in metrics
+    ))
+
     results: Dict[str, Any] = {}
-    
-    # Compute each metric and store the results
-    for metric in _METRICS:
-        value = await metric.compute(ticker)
-        results[metric.name] = value
-    
-    return results
\ No newline at end of file
+    statuses: Dict[str, MetricStatus] = {}
+    errors: List[Exception] = []
+
+    for metric, (value, status, error) in zip(metrics, outcomes):
+        statuses[metric.name] = status
+        if error is None:
+            results[metric.name] = selection.filter(metric.name, value)
+        else:
+            errors.append(error)
+
+    if metrics and not results:
+        # Nothing to return: surface the most meaningful error to the API
+        upstream = [e for e in errors if not isinstance(e, MetricTimeoutError)]
+        raise (upstream or errors)[0]
+
+    return EvalResponse(ticker=symbol, metrics=results, status=statuses)
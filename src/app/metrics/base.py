@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional, Tuple
+
+from app.core.evaluation_context import EvaluationContext
+from app.metrics.cache import FreshnessPolicy
 
 class BaseMetric(ABC):
     """Base class for all metrics.
@@ -9,12 +12,18 @@ class BaseMetric(ABC):
     """
     
     name: str
+    # Keys of the values returned by compute, for metric selection
+    keys: Tuple[str, ...] = ()
+    # How long computed values may be reused; None disables result caching
+    freshness: Optional[FreshnessPolicy] = None
     
     @abstractmethod
-    async def compute(self, ticker: str) -> Any:
+    async def compute(self, ticker: str, context: Optional[EvaluationContext] = None) -> Any:
         """Compute the metric for a given ticker.
 
         Args:
-            ticker (str): Stock ticker symbol."""
+            ticker (str): Stock ticker symbol.
+            context (Optional[EvaluationContext]): Request-scoped provider context
+                shared with the other metrics of the same evaluation."""
         pass
     
\ No newline at end of file
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from app.metrics import evaluate_all, MetricTimeoutError
+from app.metrics.technical import StockTechnicalMetric
+from app.core.config import settings
+from app.core.fundamentals_service import FundamentalsDataError
+from app.core.price_service import PriceDataError
+from app.core.technical_service import TechnicalDataError
+from app.providers.circuit_breaker import CircuitOpenError
+from app.providers.executor import ProviderBusyError
+from app.providers.history_store import HistoryStore
+from app.providers.yahoo_client import YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
+from app.schemas.eval import BatchEvalError, BatchEvalItem, BatchEvalResponse, EvalResponse
+from app.utils.ticker import InvalidTickerError, normalise_and_validate_ticker
+
+if TYPE_CHECKING:
+    from app.core.services import Services
+
+logger = logging.getLogger(__name__)
+
+# Error codes shared with GET /eval/{symbol}; the first matching type wins
+_ERROR_CODES: List[Tuple[Type[Exception], str]] = [
+    (InvalidTickerError, "INVALID_TICKER_FORMAT"),
+    (YahooSymbolNotFoundError, "TICKER_NOT_FOUND"),
+    (CircuitOpenError, "UPSTREAM_UNAVAILABLE"),
+    (YahooRateLimitError, "UPSTREAM_RATE_LIMITED"),
+    (ProviderBusyError, "PROVIDER_BUSY"),
+    (MetricTimeoutError, "EVALUATION_TIMEOUT"),
+    (YahooClientError, "YAHOO_CLIENT_ERROR"),
+    (PriceDataError, "YAHOO_CLIENT_ERROR"),
+    (FundamentalsDataError, "YAHOO_CLIENT_ERROR"),
+    (TechnicalDataError, "YAHOO_CLIENT_ERROR"),
+]
+
+def _batch_error(e: Exception) -> BatchEvalError:
+    """Describe a failed symbol evaluation.
+
+    Args:
+        e (Exception): Error raised while evaluating the symbol.
+    Returns:
+        BatchEvalError: Error code and message.
+    """
+    for error_type, code in _ERROR_CODES:
+        if isinstance(e, error_type):
+            return BatchEvalError(error=code, message=str(e))
+    return BatchEvalError(error="EVALUATION_ERROR", message=str(e))
+
+async def _prefetch_history(symbols: Sequence[str], store: HistoryStore) -> None:
+    """Load daily history for all symbols into the shared store with one batch fetch.
+
+    The per-symbol evaluations then read their bars from the store. A failed
+    prefetch is not fatal: each symbol falls back to its own fetch.
+
+    Args:
+        symbols (Sequence[str]): Normalised stock ticker symbols.
+        store (HistoryStore): Store used by the price and technical services.
+    """
+    try:
+        await store.get_history_many(symbols, days=store.window_days)
+    except Exception as e:
+        logger.warning("Batch history prefetch for %d symbols failed: %s", len(symbols), e)
+
+async def _compute_technical(symbols: Sequence[str], services: "Services") -> Dict[str, Dict[str, Any]]:
+    """Compute the technical metric of many symbols in one vectorised pass.
+
+    Reads the prefetched history, so it makes no upstream call of its own.
+    A failure is not fatal: each symbol then computes its own block.
+
+    Args:
+        symbols (Sequence[str]): Normalised stock ticker symbols.
+        services (Services): Shared services.
+    Returns:
+        Dict[str, Dict[str, Any]]: Technical metric values keyed by symbol;
+        symbols without history are left out.
+    """
+    try:
+        responses = await services.technical.get_technical_for_symbols(symbols)
+    except Exception as e:
+        logger.warning("Batch technical computation for %d symbols failed: %s", len(symbols), e)
+        return {}
+    return {symbol: StockTechnicalMetric.values(response) for symbol, response in responses.items()}
+
+async def _prepare(chunk: Sequence[str], services: "Services") -> Dict[str, Dict[str, Any]]:
+    """Prefetch a chunk's history and compute its technical blocks.
+
+    Args:
+        chunk (Sequence[str]): Normalised stock ticker symbols.
+        services (Services): Shared services.
+    Returns:
+        Dict[str, Dict[str, Any]]: As from ``_compute_technical``.
+    """
+    await _prefetch_history(chunk, services.history_store)
+    return await _compute_technical(chunk, services)
+
+async def _evaluate_prepared(
+    symbol: str,
+    services: "Services",
+    prepared: "asyncio.Task[Dict[str, Dict[str, Any]]]",
+) -> BatchEvalItem:
+    """Evaluate one symbol once its chunk is prepared.
+
+    Args:
+        symbol (str): Normalised stock ticker symbol.
+        services (Services): Shared services.
+        prepared (asyncio.Task): The ``_prepare`` task of the symbol's chunk,
+            shared with the other symbols of the chunk.
+    Returns:
+        BatchEvalItem: The evaluation or the error.
+    """
+    technical = await asyncio.shield(prepared)
+    return await _evaluate_one(symbol, services, technical.get(symbol))
+
+def _validate(tickers: Sequence[str]) -> Tuple[List[str], Dict[str, BatchEvalError]]:
+    """Normalise tickers, dropping duplicates and collecting invalid ones.
+
+    Args:
+        tickers (Sequence[str]): Stock ticker symbols as requested.
+    Returns:
+        Tuple[List[str], Dict[str, BatchEvalError]]: Valid normalised symbols in
+        request order, and errors keyed by the invalid raw tickers.
+    """
+    symbols: Dict[str, None] = {}
+    invalid: Dict[str, BatchEvalError] = {}
+    for ticker in tickers:
+        try:
+            symbols[normalise_and_validate_ticker(ticker)] = None
+        except InvalidTickerError as e:
+            invalid[ticker] = _batch_error(e)
+    return list(symbols), invalid
+
+async def _evaluate_one(symbol: str, services: "Services", technical: Optional[Dict[str, Any]]) -> BatchEvalItem:
+    """Evaluate one symbol, capturing its failure as a batch error.
+
+    Args:
+        symbol (str): Normalised stock ticker symbol.
+        services (Services): Shared services.
+        technical (Optional[Dict[str, Any]]): The symbol's technical metric
+            values from the batch pass, or None to compute them per symbol.
+    Returns:
+        BatchEvalItem: The evaluation or the error.
+    """
+    precomputed = {StockTechnicalMetric.name: technical} if technical is not None else None
+    try:
+        return BatchEvalItem(symbol=symbol, result=await evaluate_all(symbol, services, precomputed=precomputed))
+    except Exception as e:
+        return BatchEvalItem(symbol=symbol, error=_batch_error(e))
+
+async def iter_batch(
+    tickers: Sequence[str],
+    services: "Services",
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[BatchEvalItem]:
+    """Evaluate all metrics for many tickers, yielding each symbol as it completes.
+
+    Invalid tickers are yielded first. Daily history for the valid ones is
+    fetched with one batch call per ``settings.eval_batch_prefetch_chunk``
+    symbols and each chunk's technical indicators are computed together in
+    one vectorised pass. A chunk's symbols are evaluated as soon as it is
+    ready, while the next chunk downloads, so the first results do not wait
+    for the whole batch's history. At most ``concurrency`` symbols are
+    evaluated at a time; a new symbol starts only when one finishes, so memory
+    stays bounded by the concurrency rather than the batch size. Evaluations
+    still running when the consumer stops iterating are cancelled.
+
+    Args:
+        tickers (Sequence[str]): Stock ticker symbols.
+        services (Services): Shared services; history is prefetched into their store.
+        concurrency (Optional[int]): Symbols evaluated at once. Defaults to
+            ``settings.eval_batch_concurrency``.
+    Yields:
+        BatchEvalItem: One evaluation or error per symbol, in completion order.
+    """
+    symbols, invalid = _validate(tickers)
+    items = _iter_validated(symbols, invalid, services, concurrency)
+    try:
+        async for item in items:
+            yield item
+    finally:
+        # Cancel running evaluations now, not when the generator is collected
+        await items.aclose()
+
+async def _iter_validated(
+    symbols: Sequence[str],
+    invalid: Dict[str, BatchEvalError],
+    services: "Services",
+    concurrency: Optional[int],
+) -> AsyncIterator[BatchEvalItem]:
+    """Yield the invalid tickers, then evaluate the valid symbols (see ``iter_batch``).
+
+    Args:
+        symbols (Sequence[str]): Valid normalised symbols, as returned by ``_validate``.
+        invalid (Dict[str, BatchEvalError]): Errors keyed by the invalid raw tickers.
+        services (Services): Shared services; history is prefetched into their store.
+        concurrency (Optional[int]): Symbols evaluated at once.
+    Yields:
+        BatchEvalItem: One evaluation or error per symbol, in completion order.
+    """
+    for ticker, error in invalid.items():
+        yield BatchEvalItem(symbol=ticker, error=error)
+
+    if not symbols:
+        return
+
+    size = max(settings.eval_batch_prefetch_chunk, 1)
+    chunks = [symbols[start:start + size] for start in range(0, len(symbols), size)]
+    prepared: List["asyncio.Task[Dict[str, Dict[str, Any]]]"] = []
+
+    def prepared_for(index: int) -> "asyncio.Task[Dict[str, Dict[str, Any]]]":
+        # Start the chunk's prefetch, and the next one's so it downloads
+        # while this chunk is evaluated
+        while len(prepared) <= min(index + 1, len(chunks) - 1):
+            prepared.append(asyncio.ensure_future(_prepare(chunks[len(prepared)], services)))
+        return prepared[index]
+
+    limit = max(concurrency or settings.eval_batch_concurrency, 1)
+    queued = ((symbol, position // size) for position, symbol in enumerate(symbols))
+    pending: Set["asyncio.Task[BatchEvalItem]"] = set()
+    try:
+        while True:
+            for symbol, index in islice(queued, limit - len(pending)):
+                pending.add(asyncio.ensure_future(_evaluate_prepared(symbol, services, prepared_for(index))))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in [*pending, *prepared]:
+            task.cancel()
+
+async def evaluate_batch(
+    tickers: Sequence[str],
+    services: "Services",
+    concurrency: Optional[int] = None,
+) -> BatchEvalResponse:
+    """Evaluate all metrics for many tickers.
+
+    Collects the ``iter_batch`` items into one response, in request order. A symbol
+    that fails is reported in ``errors`` and never fails the batch.
+
+    Args:
+        tickers (Sequence[str]): Stock ticker symbols.
+        services (Services): Shared services; history is prefetched into their store.
+        concurrency (Optional[int]): Symbols evaluated at once. Defaults to
+            ``settings.eval_batch_concurrency``.
+    Returns:
+        BatchEvalResponse: Per-symbol evaluations and errors.
+    """
+    symbols, invalid = _validate(tickers)
+    items = {item.symbol: item async for item in _iter_validated(symbols, invalid, services, concurrency)}
+
+    results: Dict[str, EvalResponse] = {}
+    errors: Dict[str, BatchEvalError] = {}
+    for key in [*invalid, *symbols]:
+        item = items[key]
+        if item.error is not None:
+            errors[key] = item.error
+        else:
+            results[key] = item.result
+    return BatchEvalResponse(results=results, errors=errors)
@@ -0,0 +1,166 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+
+class FreshnessPolicy(Protocol):
+    """Decides how long a computed metric block stays fresh."""
+
+    def expires_at(self, now: float) -> float:
+        """
+        Return when a block computed at ``now`` goes stale.
+
+        Args:
+            now (float): Computation time, in seconds since the epoch.
+        Returns:
+            float: Expiry time, in seconds since the epoch.
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class TtlFreshness:
+    """Fresh for a fixed number of seconds."""
+    seconds: float
+
+    def expires_at(self, now: float) -> float:
+        return now + self.seconds
+
+
+@dataclass(frozen=True)
+class NextCloseFreshness:
+    """
+    Fresh until the next weekday market close, when a new daily bar settles.
+
+    Exchange holidays are not modelled; the block is simply recomputed after
+    that day's nominal close.
+    """
+    timezone: str = settings.market_timezone
+    close_time: str = settings.market_close_time
+
+    def expires_at(self, now: float) -> float:
+        local = datetime.fromtimestamp(now, ZoneInfo(self.timezone))
+        hour, minute = (int(part) for part in self.close_time.split(":"))
+        close = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        # Aware arithmetic in one zone keeps the wall-clock time across DST changes
+        while close <= local or close.weekday() >= 5:
+            close += timedelta(days=1)
+        return close.timestamp()
+
+
+@dataclass
+class MetricResultCache:
+    """
+    Computed metric blocks per (metric, symbol), kept while their metric's
+    freshness policy says they are fresh.
+
+    Bounded to ``max_entries`` (least recently used evicted). Errors are
+    never cached. Hits and misses are counted per metric.
+    """
+    max_entries: int = settings.metric_cache_max_entries
+    clock: Callable[[], float] = time.time
+    evictions: int = field(default=0, init=False)
+    # metric -> {"hits": n, "misses": n, "expirations": n}
+    _counters: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False, repr=False)
+    # (metric, symbol) -> (expires_at, values), least recently used first
+    _entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def get(self, metric: str, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the fresh cached block for a metric and symbol.
+
+        Args:
+            metric (str): Metric name.
+            symbol (str): Normalised stock ticker symbol.
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the cached values, or None on a miss.
+        """
+        counters = self._counters.setdefault(metric, {"hits": 0, "misses": 0, "expirations": 0})
+        key = (metric, symbol)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                counters["hits"] += 1
+                return dict(entry[1])
+            del self._entries[key]
+            counters["expirations"] += 1
+        counters["misses"] += 1
+        return None
+
+    def put(self, metric: str, symbol: str, values: Dict[str, Any], freshness: FreshnessPolicy) -> None:
+        """
+        Store a freshly computed block.
+
+        Args:
+            metric (str): Metric name.
+            symbol (str): Normalised stock ticker symbol.
+            values (Dict[str, Any]): Values computed by the metric.
+            freshness (FreshnessPolicy): The metric's freshness policy.
+        """
+        now = self.clock()
+        expires_at = freshness.expires_at(now)
+        if expires_at <= now:
+            return
+        key = (metric, symbol)
+        self._entries[key] = (expires_at, dict(values))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict[str, Any]: Per-metric hits, misses, expirations and hit rate,
+            plus LRU evictions and current size.
+        """
+        metrics: Dict[str, Dict[str, Any]] = {}
+        for metric, counters in self._counters.items():
+            lookups = counters["hits"] + counters["misses"]
+            metrics[metric] = {**counters, "hit_rate": counters["hits"] / lookups if lookups else 0.0}
+        return {"metrics": metrics, "evictions": self.evictions, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop every cached block."""
+        self._entries.clear()
+
+    def snapshot(self) -> List[Tuple[str, str, float, Dict[str, Any]]]:
+        """
+        Export the fresh blocks for persisting across restarts.
+
+        Returns:
+            List[Tuple[str, str, float, Dict[str, Any]]]: (metric, symbol, expiry,
+            values) per block, least recently used first.
+        """
+        now = self.clock()
+        return [(metric, symbol, expires_at, values) for (metric, symbol), (expires_at, values) in self._entries.items() if expires_at > now]
+
+    def restore(self, entries: Sequence[Tuple[str, str, float, Dict[str, Any]]]) -> int:
+        """
+        Load blocks exported by ``snapshot``, keeping their original expiry.
+
+        Args:
+            entries (Sequence[Tuple[str, str, float, Dict[str, Any]]]): Exported blocks.
+        Returns:
+            int: Number of blocks restored; expired ones are skipped.
+        """
+        now = self.clock()
+        restored = 0
+        for metric, symbol, expires_at, values in entries:
+            if expires_at <= now:
+                continue
+            self._entries[(metric, symbol)] = (expires_at, dict(values))
+            self._entries.move_to_end((metric, symbol))
+            restored += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return restored
@@ -2,10 +2,9 @@ from .base import BaseMetric
 from typing import Dict, Any, Optional
 
 from app.core.fundamentals_service import FundamentalsService
-from app.providers.yahoo_client import YFinanceYahooClient
-
-def get_fundamentals_service() -> FundamentalsService:
-    return FundamentalsService(yahoo_client=YFinanceYahooClient())
+from app.core.evaluation_context import EvaluationContext
+from app.metrics.cache import TtlFreshness
+from app.core.config import settings
 
 class StockFundamentalsMetric(BaseMetric):
     """Implements a metric to fetch stock fundamentals.
@@ -14,18 +13,32 @@ class StockFundamentalsMetric(BaseMetric):
         BaseMetric : Inherits from the BaseMetric class.
     """
     name = "fundamentals"
+    keys = (
+        "fundamentals.pe_ttm",
+        "fundamentals.pe_forward",
+        "fundamentals.market_cap",
+        "fundamentals.dividend_yield",
+        "fundamentals.return_on_invested_capital",
+        "fundamentals.fcf_yield",
+        "fundamentals.revenue_growth_5y",
+    )
+    freshness = TtlFreshness(settings.metric_cache_ttls["fundamentals"])
     
-    def __init__(self, service: Optional[FundamentalsService] = None) -> None:
-        self.service = service or get_fundamentals_service()
+    def __init__(self, service: FundamentalsService) -> None:
+        self.service = service
     
-    async def compute(self, ticker: str) -> Dict[str, Any]:
+    async def compute(self, ticker: str, context: Optional[EvaluationContext] = None) -> Dict[str, Any]:
         """Fetch the stock fundamentals for the given ticker.
         Args:
             ticker (str): Stock ticker symbol.
+            context (Optional[EvaluationContext]): Request-scoped provider context.
         Returns:
             Dict[str, Any]: A dictionary containing fundamentals metrics.
         """
-        res = await self.service.get_fundamentals_for_symbol(ticker)
+        service = self.service if context is None else context.bind(self.service)
+        res = await service.get_fundamentals_for_symbol(ticker)
+        if res.stale and context is not None:
+            context.mark_stale(self.name)
         return {
             "fundamentals.pe_ttm": res.pe_ttm,
             "fundamentals.pe_forward": res.pe_forward,
@@ -2,10 +2,9 @@ from typing import Dict, Any, Optional
 
 from .base import BaseMetric
 from app.core.price_service import PriceService
-from app.providers.yahoo_client import YFinanceYahooClient
-
-def get_price_service() -> PriceService:
-    return PriceService(yahoo_client=YFinanceYahooClient())
+from app.core.evaluation_context import EvaluationContext
+from app.metrics.cache import TtlFreshness
+from app.core.config import settings
 
 class StockPriceMetric(BaseMetric):
     """Implements a metric to fetch the current stock price.
@@ -14,18 +13,28 @@ class StockPriceMetric(BaseMetric):
         BaseMetric : Inherits from the BaseMetric class.
     """
     name = "price"
+    keys = (
+        "price.current",
+        "price.change_1d_pct",
+        "price.change_1w_pct",
+    )
+    freshness = TtlFreshness(settings.metric_cache_ttls["price"])
     
-    def __init__(self, service: Optional[PriceService] = None) -> None:
-        self.service = service or get_price_service()
+    def __init__(self, service: PriceService) -> None:
+        self.service = service
     
-    async def compute(self, ticker: str) -> Dict[str, Any]:
+    async def compute(self, ticker: str, context: Optional[EvaluationContext] = None) -> Dict[str, Any]:
         """Fetch the current stock price for the given ticker.
         Args:
             ticker (str): Stock ticker symbol.
+            context (Optional[EvaluationContext]): Request-scoped provider context.
         Returns:
             Dict[str, Any]: A dictionary containing price metrics.
         """
-        res = await self.service.get_price_for_symbol(ticker)
+        service = self.service if context is None else context.bind(self.service)
+        res = await service.get_price_for_symbol(ticker)
+        if res.stale and context is not None:
+            context.mark_stale(self.name)
         return {
             "price.current": res.current,
             "price.change_1d_pct": res.change_1d_pct,
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .base import BaseMetric
+
+
+class MetricSelectionError(ValueError):
+    """Raised when a metric selection names unknown metrics or keys."""
+
+
+@dataclass(frozen=True)
+class MetricSelection:
+    """
+    Metric groups and individual metric keys requested from an evaluation.
+
+    An empty selection means every metric. ``groups`` are metric names
+    (e.g. ``price``) whose keys are all returned; ``keys`` are single values
+    (e.g. ``technical.rsi_14d``) whose metric runs with only those keys kept.
+    """
+    groups: Tuple[str, ...] = ()
+    keys: Tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, value: Optional[str], metrics: Sequence[BaseMetric]) -> "MetricSelection":
+        """
+        Build a selection from a comma-separated query value.
+
+        Args:
+            value (Optional[str]): Metric names and keys, e.g. ``"price,technical.rsi_14d"``.
+            metrics (Sequence[BaseMetric]): Metrics (or metric classes) available for evaluation.
+        Returns:
+            MetricSelection: The selection; empty when ``value`` is empty.
+        Raises:
+            MetricSelectionError: If a metric name or key is unknown.
+        """
+        available = {metric.name: getattr(metric, "keys", ()) for metric in metrics}
+        groups: Dict[str, None] = {}
+        keys: Dict[str, None] = {}
+        for item in (value or "").split(","):
+            item = item.strip()
+            if not item:
+                continue
+            name = item.split(".", 1)[0]
+            if name not in available:
+                raise MetricSelectionError(f"Unknown metric '{name}'; expected one of {sorted(available)}.")
+            if item == name:
+                groups[name] = None
+            elif available[name] and item not in available[name]:
+                raise MetricSelectionError(f"Unknown metric key '{item}'.")
+            else:
+                keys[item] = None
+        return cls(groups=tuple(groups), keys=tuple(key for key in keys if key.split(".", 1)[0] not in groups))
+
+    def __bool__(self) -> bool:
+        return bool(self.groups or self.keys)
+
+    def includes(self, name: str) -> bool:
+        """
+        Whether a metric has to run for this selection.
+
+        Args:
+            name (str): Metric name.
+        Returns:
+            bool: True if the metric or one of its keys is selected.
+        """
+        if not self:
+            return True
+        return name in self.groups or any(key.split(".", 1)[0] == name for key in self.keys)
+
+    def filter(self, name: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Keep the selected keys of a metric's values.
+
+        Args:
+            name (str): Metric name.
+            values (Dict[str, Any]): Values computed by the metric.
+        Returns:
+            Dict[str, Any]: The selected values.
+        """
+        if not self or name in self.groups:
+            return values
+        return {key: value for key, value in values.items() if key in self.keys}
@@ -2,10 +2,9 @@ from .base import BaseMetric
 from typing import Dict, Any, Optional
 
 from app.core.technical_service import TechnicalService
-from app.providers.yahoo_client import YFinanceYahooClient
-
-def get_technical_service() -> TechnicalService:
-    return TechnicalService(yahoo_client=YFinanceYahooClient())
+from app.core.evaluation_context import EvaluationContext
+from app.metrics.cache import NextCloseFreshness
+from app.schemas.technical import TechnicalResponse
 
 class StockTechnicalMetric(BaseMetric):
     """Implements a metric to fetch stock technical indicators.
@@ -14,18 +13,40 @@ class StockTechnicalMetric(BaseMetric):
         BaseMetric : Inherits from the BaseMetric class.
     """
     name = "technical"
+    keys = (
+        "technical.sma_50d",
+        "technical.sma_200d",
+        "technical.above_200d",
+        "technical.rsi_14d",
+        "technical.volatility_30",
+    )
+    freshness = NextCloseFreshness()
     
-    def __init__(self, service: Optional[TechnicalService] = None) -> None:
-        self.service = service or get_technical_service()
+    def __init__(self, service: TechnicalService) -> None:
+        self.service = service
     
-    async def compute(self, ticker: str) -> Dict[str, Any]:
+    async def compute(self, ticker: str, context: Optional[EvaluationContext] = None) -> Dict[str, Any]:
         """Fetch the stock technical indicators for the given ticker.
         Args:
             ticker (str): Stock ticker symbol.
+            context (Optional[EvaluationContext]): Request-scoped provider context.
+        Returns:
+            Dict[str, Any]: Dictionary of technical indicators.
+        """
+        service = self.service if context is None else context.bind(self.service)
+        res = await service.get_technical_for_symbol(ticker)
+        if res.stale and context is not None:
+            context.mark_stale(self.name)
+        return self.values(res)
+
+    @staticmethod
+    def values(res: TechnicalResponse) -> Dict[str, Any]:
+        """Turn a technical response into the metric's values.
+        Args:
+            res (TechnicalResponse): Technical data for one symbol.
         Returns:
             Dict[str, Any]: Dictionary of technical indicators.
         """
-        res = await self.service.get_technical_for_symbol(ticker)
         return {
             "technical.sma_50d": res.sma_50d,
             "technical.sma_200d": res.sma_200d,
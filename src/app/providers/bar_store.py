@@ -0,0 +1,297 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional, Protocol, Tuple
+
+import numpy as np
+
+from app.core.config import Settings, settings
+from app.providers.price_series import PriceSeries
+
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Depth recorded when a full download reached back to the symbol's listing
+# date, i.e. the stored bars are its whole history and cover any window
+FULL_HISTORY = np.iinfo(np.int64).max
+
+
+class BarStore(Protocol):
+    """
+    Persistent daily bars per symbol, oldest to newest.
+
+    Implementations are synchronous; callers on the event loop run them in a
+    worker thread.
+    """
+
+    def read(self, symbol: str, days: Optional[int] = None) -> PriceSeries:
+        """
+        Read stored bars.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            days (Optional[int]): Most recent bars wanted; all when None.
+        Returns:
+            PriceSeries: Stored bars, empty if the symbol is unknown.
+        """
+        ...
+
+    def depth(self, symbol: str) -> int:
+        """
+        Widest window downloaded for a symbol.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+        Returns:
+            int: Bars requested by the last full download, ``FULL_HISTORY`` if it
+            reached back to the symbol's listing date, 0 if never downloaded.
+        """
+        ...
+
+    def write(self, symbol: str, bars: PriceSeries, depth: int) -> None:
+        """
+        Replace every stored bar of a symbol with a full download.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            bars (PriceSeries): Downloaded bars.
+            depth (int): Bars requested by the download, or ``FULL_HISTORY``.
+        """
+        ...
+
+    def append(self, symbol: str, bars: PriceSeries) -> None:
+        """
+        Add newer bars, replacing stored bars from the first new timestamp on.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            bars (PriceSeries): Downloaded recent bars.
+        """
+        ...
+
+
+@dataclass
+class SQLiteBarStore(BarStore):
+    """
+    BarStore in one SQLite file, one row per (symbol, bar).
+
+    Timestamps are stored as epoch nanoseconds. The connection is shared by
+    worker threads and serialised with a lock.
+    """
+    path: str
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The database connection, opened and migrated on first use."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS bars (
+                    symbol TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL NOT NULL, volume REAL,
+                    PRIMARY KEY (symbol, ts)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS symbols (
+                    symbol TEXT PRIMARY KEY,
+                    depth INTEGER NOT NULL
+                );
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def read(self, symbol: str, days: Optional[int] = None) -> PriceSeries:
+        query = "SELECT ts, open, high, low, close, volume FROM bars WHERE symbol = ? ORDER BY ts DESC"
+        params: tuple = (symbol,)
+        if days is not None:
+            query += " LIMIT ?"
+            params += (max(days, 0),)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        if not rows:
+            return PriceSeries.empty()
+
+        # NULL columns come back as None; an object array maps them to NaN
+        table = np.array(rows[::-1], dtype=object)
+        return PriceSeries(
+            table[:, 0].astype(np.int64).astype("datetime64[ns]"),
+            *(table[:, i].astype(np.float64) for i in range(1, 6)),
+        )
+
+    def depth(self, symbol: str) -> int:
+        with self._lock:
+            row = self.conn.execute("SELECT depth FROM symbols WHERE symbol = ?", (symbol,)).fetchone()
+        return row[0] if row else 0
+
+    def write(self, symbol: str, bars: PriceSeries, depth: int) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM bars WHERE symbol = ?", (symbol,))
+            self.conn.executemany("INSERT INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", _rows(symbol, bars))
+            self.conn.execute("INSERT OR REPLACE INTO symbols VALUES (?, ?)", (symbol, depth))
+
+    def append(self, symbol: str, bars: PriceSeries) -> None:
+        if not len(bars):
+            return
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM bars WHERE symbol = ? AND ts >= ?", (symbol, int(bars.timestamps[0].astype(np.int64))))
+            self.conn.executemany("INSERT INTO bars VALUES (?, ?, ?, ?, ?, ?, ?)", _rows(symbol, bars))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+@dataclass
+class MmapBarStore(BarStore):
+    """
+    BarStore of one memory-mapped column file per symbol under ``root``.
+
+    Each ``<symbol>.npy`` file holds an ``int64`` array of shape
+    ``(6, bars + 1)``: row 0 is the timestamps in epoch nanoseconds and rows
+    1-5 the bit patterns of the float64 open/high/low/close/volume columns,
+    so every column is contiguous on disk. Column 0 is a header holding the
+    download depth. Reads return PriceSeries whose columns are read-only
+    views of the mapping, so worker processes share the page cache instead
+    of each holding a copy. Writes build a new file and swap it in with
+    ``os.replace``; readers notice the new file by its inode and remap it.
+
+    At most ``max_maps`` files are kept mapped (least recently used
+    dropped); a dropped file is unmapped once no series read from it is left.
+    """
+    root: str
+    max_maps: int = settings.bar_store_max_maps
+    # symbol -> ((inode, mtime), mapped file)
+    _maps: "OrderedDict[str, Tuple[Tuple[int, int], np.ndarray]]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _write_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def read(self, symbol: str, days: Optional[int] = None) -> PriceSeries:
+        table = self._map(symbol)
+        if table is None:
+            return PriceSeries.empty()
+        bars = table[:, 1:]
+        if days is not None:
+            bars = bars[:, bars.shape[1] - min(max(days, 0), bars.shape[1]):]
+        return PriceSeries(bars[0].view("datetime64[ns]"), *(bars[i].view(np.float64) for i in range(1, 6)))
+
+    def depth(self, symbol: str) -> int:
+        table = self._map(symbol)
+        return int(table[0, 0]) if table is not None else 0
+
+    def write(self, symbol: str, bars: PriceSeries, depth: int) -> None:
+        with self._write_lock:
+            self._save(symbol, bars, depth)
+
+    def append(self, symbol: str, bars: PriceSeries) -> None:
+        if not len(bars):
+            return
+        with self._write_lock:
+            stored = self.read(symbol)
+            keep = stored[stored.timestamps < bars.timestamps[0]]
+            merged = PriceSeries(
+                np.concatenate([keep.timestamps, bars.timestamps]),
+                *(np.concatenate([getattr(keep, name), getattr(bars, name)]) for name in _COLUMNS),
+            )
+            self._save(symbol, merged, self.depth(symbol))
+
+    def close(self) -> None:
+        """Drop this process's mappings; series already read stay valid."""
+        with self._lock:
+            self._maps.clear()
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.root, f"{symbol}.npy")
+
+    def _map(self, symbol: str) -> Optional[np.ndarray]:
+        """
+        Map a symbol's file, reusing the mapping while the file is unchanged.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+        Returns:
+            Optional[np.ndarray]: The mapped table, or None if nothing is stored.
+        """
+        path = self._path(symbol)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            entry = self._maps.get(symbol)
+            if entry is not None and entry[0] == key:
+                self._maps.move_to_end(symbol)
+                return entry[1]
+            try:
+                table = np.load(path, mmap_mode="r")
+            except FileNotFoundError:
+                return None
+            self._maps[symbol] = (key, table)
+            self._maps.move_to_end(symbol)
+            while len(self._maps) > self.max_maps:
+                self._maps.popitem(last=False)
+            return table
+
+    def _save(self, symbol: str, bars: PriceSeries, depth: int) -> None:
+        table = np.empty((6, len(bars) + 1), dtype=np.int64)
+        table[:, 0] = 0
+        table[0, 0] = depth
+        table[0, 1:] = bars.timestamps.astype(np.int64)
+        for i, name in enumerate(_COLUMNS, start=1):
+            table[i, 1:] = getattr(bars, name).view(np.int64)
+
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(symbol)
+        # Unique temporary file, so concurrent writers (threads or worker
+        # processes) never share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=f"{symbol}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, table)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def build_bar_store(config: Settings = settings) -> Optional[BarStore]:
+    """
+    Build the configured bar store.
+
+    Args:
+        config (Settings): Application settings.
+    Returns:
+        Optional[BarStore]: The store at ``bar_store_path``, or None when it is unset.
+    Raises:
+        ValueError: If ``bar_store_backend`` is not a known backend.
+    """
+    if not config.bar_store_path:
+        return None
+    if config.bar_store_backend == "sqlite":
+        return SQLiteBarStore(config.bar_store_path)
+    if config.bar_store_backend == "mmap":
+        return MmapBarStore(config.bar_store_path)
+    raise ValueError(f"Unknown bar_store_backend: {config.bar_store_backend!r}")
+
+
+def _rows(symbol: str, bars: PriceSeries) -> Iterator[Tuple[Any, ...]]:
+    """Yield SQLite rows for bars, with NaN stored as NULL."""
+    columns = [bars.timestamps.astype(np.int64).tolist()]
+    for name in _COLUMNS:
+        values = getattr(bars, name)
+        columns.append([None if np.isnan(v) else v for v in values.tolist()])
+    for row in zip(*columns):
+        yield (symbol, *row)
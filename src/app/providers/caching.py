@@ -0,0 +1,193 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from app.core.config import settings
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient
+
+
+@dataclass
+class CachingYahooClient(YahooClient):
+    """
+    YahooClient decorator caching results in memory.
+
+    Each method has its own time-to-live (``ttls``, keyed by method name; a
+    missing or non-positive TTL disables caching for that method). The cache
+    is bounded to ``max_entries`` and evicts the least recently used entry
+    first. Errors are never cached. Batch calls share the single-symbol
+    entries and only ask upstream for the symbols that missed.
+    """
+    yahoo_client: YahooClient
+    ttls: Dict[str, float] = field(default_factory=lambda: dict(settings.provider_cache_ttls))
+    max_entries: int = settings.provider_cache_max_entries
+    clock: Callable[[], float] = time.monotonic
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    expirations: int = field(default=0, init=False)
+    # (method, symbol, *args) -> (expires_at, value), least recently used first
+    _entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = field(default_factory=OrderedDict, init=False, repr=False)
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch quote data, cached for ``ttls["fetch_quote"]`` seconds."""
+        return await self._cached(("fetch_quote", symbol), lambda: self.yahoo_client.fetch_quote(symbol))
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily history, cached for ``ttls["fetch_daily_history"]`` seconds."""
+        return await self._cached(("fetch_daily_history", symbol, days), lambda: self.yahoo_client.fetch_daily_history(symbol, days))
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """Fetch raw fundamentals, cached for ``ttls["fetch_fundamentals"]`` seconds."""
+        return await self._cached(("fetch_fundamentals", symbol), lambda: self.yahoo_client.fetch_fundamentals(symbol))
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quote data for several symbols, sharing the ``fetch_quote`` entries."""
+        return await self._cached_many(("fetch_quote",), (), symbols, lambda missing: self.yahoo_client.fetch_quotes_many(missing))
+
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """Fetch daily history for several symbols, sharing the ``fetch_daily_history`` entries."""
+        return await self._cached_many(
+            ("fetch_daily_history",), (days,), symbols,
+            lambda missing: self.yahoo_client.fetch_daily_history_many(missing, days),
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, LRU evictions, TTL expirations and current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def snapshot(self) -> List[Tuple[Tuple[Any, ...], float, Any]]:
+        """
+        Export the live entries for persisting across restarts.
+
+        Returns:
+            List[Tuple[Tuple[Any, ...], float, Any]]: (key, expiry as epoch seconds,
+            value) per entry, least recently used first.
+        """
+        now = self.clock()
+        offset = time.time() - now
+        return [(key, expires_at + offset, value) for key, (expires_at, value) in self._entries.items() if expires_at > now]
+
+    def restore(self, entries: Sequence[Tuple[Tuple[Any, ...], float, Any]]) -> int:
+        """
+        Load entries exported by ``snapshot``, keeping their original expiry.
+
+        Args:
+            entries (Sequence[Tuple[Tuple[Any, ...], float, Any]]): Exported entries.
+        Returns:
+            int: Number of entries restored; expired ones are skipped.
+        """
+        now = self.clock()
+        offset = time.time() - now
+        restored = 0
+        for key, expires_epoch, value in entries:
+            expires_at = expires_epoch - offset
+            if expires_at <= now:
+                continue
+            key = tuple(key)
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            restored += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return restored
+
+    async def _cached(self, key: Tuple[Any, ...], call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a fresh cached value for key or fetch and store it.
+
+        Args:
+            key (Tuple[Any, ...]): Cache key, (method, symbol, *args).
+            call (Callable[[], Awaitable[Any]]): Performs the upstream call.
+        Returns:
+            Any: The cached or freshly fetched value.
+        """
+        ttl = self.ttls.get(key[0], 0.0)
+        if ttl <= 0:
+            return await call()
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        value = await call()
+        self._store(key, value, ttl)
+        return value
+
+    async def _cached_many(
+        self,
+        method: Tuple[str],
+        args: Tuple[Any, ...],
+        symbols: Sequence[str],
+        call: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Serve a batch from the per-symbol entries, fetching only the misses in one call.
+
+        Args:
+            method (Tuple[str]): Single-symbol method whose entries are shared.
+            args (Tuple[Any, ...]): Extra key arguments after the symbol.
+            symbols (Sequence[str]): Requested symbols.
+            call (Callable[[List[str]], Awaitable[Dict[str, Any]]]): Batch upstream call for the missing symbols.
+        Returns:
+            Dict[str, Any]: Values keyed by symbol.
+        """
+        unique = list(dict.fromkeys(symbols))
+        ttl = self.ttls.get(method[0], 0.0)
+        if ttl <= 0:
+            return await call(unique)
+
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        for symbol in unique:
+            found, value = self._lookup(method + (symbol,) + args)
+            if found:
+                results[symbol] = value
+            else:
+                missing.append(symbol)
+
+        if missing:
+            fetched = await call(missing)
+            for symbol, value in fetched.items():
+                self._store(method + (symbol,) + args, value, ttl)
+            results.update(fetched)
+
+        return {symbol: results[symbol] for symbol in unique if symbol in results}
+
+    def _lookup(self, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if self.clock() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+            self.expirations += 1
+
+        self.misses += 1
+        return False, None
+
+    def _store(self, key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+        self._entries[key] = (self.clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,218 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Sequence, Tuple, TypeVar
+
+from app.providers.executor import ProviderBusyError, queued_seconds
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooClientError, YahooSymbolNotFoundError
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(YahooClientError):
+    """Raised instead of calling the provider while the circuit is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Circuit breaker over the outcomes of the last ``window_size`` calls.
+
+    Trips open when, over at least ``min_calls`` calls, the failure rate or the
+    share of calls slower than ``slow_call_seconds`` reaches its threshold.
+    After ``open_seconds`` it lets ``half_open_max_calls`` trial calls through:
+    a success closes it again, a failure re-opens it.
+    """
+    window_size: int = 20
+    min_calls: int = 5
+    failure_rate_threshold: float = 0.5
+    slow_call_seconds: float = 5.0
+    slow_rate_threshold: float = 0.5
+    open_seconds: float = 30.0
+    half_open_max_calls: int = 1
+    clock: Callable[[], float] = time.monotonic
+    opened: int = field(default=0, init=False)
+    _state: str = field(default=CLOSED, init=False, repr=False)
+    _opened_at: float = field(default=0.0, init=False, repr=False)
+    _trials: int = field(default=0, init=False, repr=False)
+    # (failed, slow) per recent call
+    _outcomes: Deque[Tuple[bool, bool]] = field(default_factory=deque, init=False, repr=False)
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once ``open_seconds`` have passed."""
+        if self._state == OPEN and self.clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._trials = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go to the provider, taking a trial slot when half-open.
+
+        Returns:
+            bool: True if the call may proceed.
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._trials < self.half_open_max_calls:
+            self._trials += 1
+            return True
+        return False
+
+    def record_success(self, elapsed: float) -> None:
+        """
+        Record a completed call.
+
+        Args:
+            elapsed (float): Call duration in seconds.
+        """
+        slow = elapsed >= self.slow_call_seconds
+        if self._state == HALF_OPEN:
+            if slow:
+                self._trip()
+            else:
+                self._close()
+            return
+        self._record(False, slow)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self._state == HALF_OPEN:
+            self._trip()
+            return
+        self._record(True, False)
+
+    def abandon(self) -> None:
+        """Give back a trial slot for a call that was cancelled before it finished."""
+        if self._state == HALF_OPEN and self._trials > 0:
+            self._trials -= 1
+
+    def record_cancelled(self, elapsed: float) -> None:
+        """
+        Record a call cancelled by its caller, e.g. on a deadline.
+
+        A call cut off after ``slow_call_seconds`` counts as a slow failure,
+        so calls that only end on their callers' deadlines still trip the
+        breaker; one cancelled sooner is not held against the provider.
+
+        Args:
+            elapsed (float): Time the call ran before it was cancelled, in seconds.
+        """
+        if elapsed < self.slow_call_seconds:
+            self.abandon()
+            return
+        if self._state == HALF_OPEN:
+            self._trip()
+            return
+        self._record(True, True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the breaker state.
+
+        Returns:
+            Dict[str, Any]: State, failure and slow-call rates over the window
+            and how many times the breaker opened.
+        """
+        calls = len(self._outcomes)
+        return {
+            "state": self.state,
+            "calls": calls,
+            "failure_rate": sum(f for f, _ in self._outcomes) / calls if calls else 0.0,
+            "slow_rate": sum(s for _, s in self._outcomes) / calls if calls else 0.0,
+            "opened": self.opened,
+        }
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        self._outcomes.append((failed, slow))
+        while len(self._outcomes) > self.window_size:
+            self._outcomes.popleft()
+
+        calls = len(self._outcomes)
+        if self._state != CLOSED or calls < self.min_calls:
+            return
+        failures = sum(f for f, _ in self._outcomes)
+        slow_calls = sum(s for _, s in self._outcomes)
+        if failures / calls >= self.failure_rate_threshold or slow_calls / calls >= self.slow_rate_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self.opened += 1
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+
+
+@dataclass
+class CircuitBreakerYahooClient(YahooClient):
+    """
+    YahooClient decorator failing fast with CircuitOpenError while the breaker is open.
+
+    Provider errors count as failures; YahooSymbolNotFoundError is a valid
+    answer and counts as a success. ProviderBusyError is our own backpressure,
+    not the provider's, and is not counted; neither is time spent queued for
+    a provider slot.
+    """
+    yahoo_client: YahooClient
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch quote data through the breaker."""
+        return await self._guarded(lambda: self.yahoo_client.fetch_quote(symbol))
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily history through the breaker."""
+        return await self._guarded(lambda: self.yahoo_client.fetch_daily_history(symbol, days))
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """Fetch raw fundamentals through the breaker."""
+        return await self._guarded(lambda: self.yahoo_client.fetch_fundamentals(symbol))
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quote data for several symbols as one call through the breaker."""
+        return await self._guarded(lambda: self.yahoo_client.fetch_quotes_many(symbols))
+
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """Fetch daily history for several symbols as one call through the breaker."""
+        return await self._guarded(lambda: self.yahoo_client.fetch_daily_history_many(symbols, days))
+
+    def stats(self) -> Dict[str, Any]:
+        """Report the breaker state."""
+        return self.breaker.stats()
+
+    async def _guarded(self, call: Callable[[], Awaitable[T]]) -> T:
+        if not self.breaker.allow():
+            raise CircuitOpenError("Yahoo Finance circuit is open; skipping upstream call.")
+
+        started = self.breaker.clock()
+        queued = queued_seconds()
+
+        def elapsed() -> float:
+            return self.breaker.clock() - started - (queued_seconds() - queued)
+
+        try:
+            result = await call()
+        except YahooSymbolNotFoundError:
+            self.breaker.record_success(elapsed())
+            raise
+        except ProviderBusyError:
+            self.breaker.abandon()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.record_cancelled(elapsed())
+            raise
+        self.breaker.record_success(elapsed())
+        return result
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, TypeVar
+
+from app.providers.yahoo_client import YahooClientError
+
+T = TypeVar("T")
+
+# Seconds the current task has spent queued for provider slots
+_queue_wait: ContextVar[float] = ContextVar("provider_queue_wait", default=0.0)
+
+
+def queued_seconds() -> float:
+    """
+    Report how long the current task has waited for provider slots so far.
+
+    Callers timing a provider call (e.g. the circuit breaker) subtract the
+    difference across the call, so queueing behind our own traffic is not
+    counted as upstream latency.
+
+    Returns:
+        float: Total queue wait of the current task, in seconds.
+    """
+    return _queue_wait.get()
+
+
+class ProviderBusyError(YahooClientError):
+    """Raised when a provider call cannot be admitted to the executor."""
+
+
+@dataclass
+class ProviderExecutor:
+    """
+    Dedicated thread pool for blocking provider calls with backpressure.
+
+    At most ``max_in_flight`` calls run at once; up to ``max_queue`` more may
+    wait for a slot, for at most ``queue_timeout`` seconds. Calls beyond that
+    are rejected with ProviderBusyError instead of piling up.
+    """
+    max_workers: int = 8
+    max_in_flight: int = 8
+    max_queue: int = 64
+    queue_timeout: Optional[float] = 10.0
+    in_flight: int = field(default=0, init=False)
+    waiting: int = field(default=0, init=False)
+    completed: int = field(default=0, init=False)
+    rejected: int = field(default=0, init=False)
+    total_wait: float = field(default=0.0, init=False)
+    max_wait: float = field(default=0.0, init=False)
+    _waits: int = field(default=0, init=False, repr=False)
+    _pool: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False, repr=False)
+
+    async def run(self, fn: Callable[[], T]) -> T:
+        """
+        Run a blocking function on the provider pool.
+
+        Args:
+            fn (Callable[[], T]): Blocking function to run.
+        Returns:
+            T: The function's result.
+        Raises:
+            ProviderBusyError: If the wait queue is full or the wait timed out.
+        """
+        semaphore = self._limiter()
+        if semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ProviderBusyError(f"Provider queue is full ({self.waiting} waiting).")
+
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise ProviderBusyError(f"Timed out after {self.queue_timeout:g}s waiting for a provider slot.") from None
+        finally:
+            self.waiting -= 1
+            waited = time.perf_counter() - started
+            self._record_wait(waited)
+            _queue_wait.set(_queue_wait.get() + waited)
+
+        self.in_flight += 1
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor().submit(fn)
+        except BaseException:
+            self._finish(semaphore)
+            raise
+        # The slot is held until the thread finishes, not until the caller
+        # stops waiting, so cancelled callers cannot exceed max_in_flight
+        future.add_done_callback(lambda _: self._release_from_thread(loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report queue depth and wait times.
+
+        Returns:
+            Dict[str, float]: Calls running, waiting, completed and rejected, and
+            the average and maximum queue wait in milliseconds.
+        """
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": (self.total_wait / self._waits) * 1000.0 if self._waits else 0.0,
+            "max_wait_ms": self.max_wait * 1000.0,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once running calls finish."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="yahoo-provider")
+        return self._pool
+
+    def _limiter(self) -> asyncio.Semaphore:
+        # asyncio primitives belong to one event loop; rebuild if the loop changed
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    def _finish(self, semaphore: asyncio.Semaphore) -> None:
+        self.in_flight -= 1
+        self.completed += 1
+        semaphore.release()
+
+    def _release_from_thread(self, loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+        try:
+            loop.call_soon_threadsafe(self._finish, semaphore)
+        except RuntimeError:
+            # The loop is closed; nothing is left waiting on its semaphore
+            pass
+
+    def _record_wait(self, waited: float) -> None:
+        self._waits += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
@@ -0,0 +1,322 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.providers.bar_store import FULL_HISTORY, BarStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient
+
+# Stored bars downloaded again on an incremental refresh, to pick up the
+# final values of the last stored session and detect revised history
+_OVERLAP_BARS = 2
+
+
+def _utc_today() -> np.datetime64:
+    return np.datetime64("today", "D")
+
+
+@dataclass
+class HistoryStore:
+    """
+    Single fetch path for daily OHLCV bars.
+
+    Downloads the widest window any consumer needs once per symbol, keeps it
+    for ``ttl_seconds`` and serves narrower windows as slices of it. At most
+    ``max_entries`` symbols are kept (least recently used evicted).
+    Concurrent readers of the same symbol share one upstream download.
+
+    With a ``bar_store``, bars are persisted and a refresh only downloads the
+    sessions after the last stored bar (plus a small overlap), appending them
+    to the store. Reads are served from the store; a symbol is downloaded in
+    full only when the store does not reach back far enough or its stored
+    history was revised upstream (e.g. split adjustments). Cached windows
+    are the store's own series, so a memory-mapped store is not copied.
+    """
+    yahoo_client: YahooClient
+    window_days: int = settings.history_window_days
+    ttl_seconds: float = settings.history_ttl_seconds
+    bar_store: Optional[BarStore] = None
+    today: Callable[[], np.datetime64] = field(default=_utc_today, repr=False)
+    max_entries: int = settings.history_max_entries
+    # symbol -> (fetched_at, window fetched, bars oldest to newest)
+    _entries: "OrderedDict[str, Tuple[float, int, PriceSeries]]" = field(default_factory=OrderedDict, init=False, repr=False)
+    _pending: Dict[Tuple[str, int], "asyncio.Task[PriceSeries]"] = field(default_factory=dict, init=False, repr=False)
+
+    async def get_history(self, symbol: str, days: int) -> PriceSeries:
+        """
+        Get the most recent daily bars for a symbol.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            days (int): Number of bars wanted.
+        Returns:
+            PriceSeries: Up to ``days`` bars, oldest to newest.
+        """
+        window = max(days, self.window_days)
+
+        bars = self._lookup(symbol, window, time.monotonic())
+        if bars is not None:
+            return bars.tail(days)
+
+        bars = await self._download(symbol, window)
+        return bars.tail(days)
+
+    async def get_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """
+        Get the most recent daily bars for several symbols.
+
+        Fresh cached windows are served as slices; the remaining symbols are
+        downloaded together with one batch call.
+
+        Args:
+            symbols (Sequence[str]): Normalised stock ticker symbols.
+            days (int): Number of bars wanted.
+        Returns:
+            Dict[str, PriceSeries]: Bars per symbol found, oldest to newest.
+        """
+        window = max(days, self.window_days)
+        now = time.monotonic()
+
+        found: Dict[str, PriceSeries] = {}
+        missing: List[str] = []
+        for symbol in dict.fromkeys(symbols):
+            bars = self._lookup(symbol, window, now)
+            if bars is not None:
+                found[symbol] = bars.tail(days)
+            else:
+                missing.append(symbol)
+
+        if missing:
+            if self.bar_store is None:
+                fetched = await self.yahoo_client.fetch_daily_history_many(missing, window)
+            else:
+                fetched = await self._refresh_stored_many(missing, window)
+            fetched_at = time.monotonic()
+            for symbol, bars in fetched.items():
+                self._remember(symbol, fetched_at, window, bars)
+                found[symbol] = bars.tail(days)
+        return found
+
+    def invalidate(self, symbol: str) -> None:
+        """
+        Drop the cached bars for a symbol.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+        """
+        self._entries.pop(symbol, None)
+
+    def snapshot(self) -> List[Tuple[str, float, int, PriceSeries]]:
+        """
+        Export the fresh windows for persisting across restarts.
+
+        Returns:
+            List[Tuple[str, float, int, PriceSeries]]: (symbol, fetch time as epoch
+            seconds, window, bars) per symbol.
+        """
+        now = time.monotonic()
+        offset = time.time() - now
+        return [
+            (symbol, fetched_at + offset, window, bars)
+            for symbol, (fetched_at, window, bars) in self._entries.items()
+            if now - fetched_at < self.ttl_seconds
+        ]
+
+    def restore(self, entries: Sequence[Tuple[str, float, int, PriceSeries]]) -> int:
+        """
+        Load windows exported by ``snapshot``, keeping their original fetch time.
+
+        Args:
+            entries (Sequence[Tuple[str, float, int, PriceSeries]]): Exported windows.
+        Returns:
+            int: Number of windows restored; ones past the TTL are skipped.
+        """
+        now = time.monotonic()
+        offset = time.time() - now
+        restored = 0
+        for symbol, fetched_epoch, window, bars in entries:
+            fetched_at = fetched_epoch - offset
+            if now - fetched_at >= self.ttl_seconds:
+                continue
+            self._remember(symbol, fetched_at, window, bars)
+            restored += 1
+        return restored
+
+    def _lookup(self, symbol: str, window: int, now: float) -> Optional[PriceSeries]:
+        """
+        Return a symbol's cached bars if they are fresh and wide enough.
+
+        Expired windows are dropped.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            window (int): Number of bars wanted.
+            now (float): Current monotonic time.
+        Returns:
+            Optional[PriceSeries]: The cached bars, or None on a miss.
+        """
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+        fetched_at, fetched_window, bars = entry
+        if now - fetched_at >= self.ttl_seconds:
+            del self._entries[symbol]
+            return None
+        if fetched_window < window:
+            return None
+        self._entries.move_to_end(symbol)
+        return bars
+
+    def _remember(self, symbol: str, fetched_at: float, window: int, bars: PriceSeries) -> None:
+        self._entries[symbol] = (fetched_at, window, bars)
+        self._entries.move_to_end(symbol)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _download(self, symbol: str, window: int) -> PriceSeries:
+        """
+        Download a window of bars, sharing the call with concurrent readers.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            window (int): Number of bars to download.
+        Returns:
+            PriceSeries: Downloaded bars, oldest to newest.
+        """
+        key = (symbol, window)
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(symbol, window))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, symbol: str, window: int) -> PriceSeries:
+        if self.bar_store is None:
+            bars = await self.yahoo_client.fetch_daily_history(symbol, window)
+        else:
+            bars = await self._refresh_stored(symbol, window)
+        self._remember(symbol, time.monotonic(), window, bars)
+        return bars
+
+    async def _refresh_stored(self, symbol: str, window: int) -> PriceSeries:
+        """
+        Bring a symbol's stored bars up to date and read a window of them.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            window (int): Number of bars wanted.
+        Returns:
+            PriceSeries: Up to ``window`` bars, oldest to newest.
+        """
+        stored, days = await asyncio.to_thread(self._plan, symbol, window)
+        if days is not None:
+            recent = await self.yahoo_client.fetch_daily_history(symbol, days)
+            merged = await asyncio.to_thread(self._merge, symbol, stored, recent, window)
+            if merged is not None:
+                return merged
+
+        bars = await self.yahoo_client.fetch_daily_history(symbol, window)
+        return await asyncio.to_thread(self._replace, symbol, bars, window)
+
+    async def _refresh_stored_many(self, symbols: Sequence[str], window: int) -> Dict[str, PriceSeries]:
+        """
+        Bring several symbols' stored bars up to date with at most two batch downloads.
+
+        Symbols with usable stored bars share one download of the largest
+        missing span; the others are downloaded in full together.
+
+        Args:
+            symbols (Sequence[str]): Normalised stock ticker symbols.
+            window (int): Number of bars wanted.
+        Returns:
+            Dict[str, PriceSeries]: Up to ``window`` bars per symbol found.
+        """
+        plans = await asyncio.to_thread(lambda: {symbol: self._plan(symbol, window) for symbol in symbols})
+        incremental = {symbol: plan for symbol, plan in plans.items() if plan[1] is not None}
+        full = [symbol for symbol, plan in plans.items() if plan[1] is None]
+
+        results: Dict[str, PriceSeries] = {}
+        if incremental:
+            days = max(plan[1] for plan in incremental.values())
+            recent = await self.yahoo_client.fetch_daily_history_many(list(incremental), days)
+            for symbol, bars in recent.items():
+                merged = await asyncio.to_thread(self._merge, symbol, incremental[symbol][0], bars, window)
+                if merged is None:
+                    full.append(symbol)
+                else:
+                    results[symbol] = merged
+
+        if full:
+            downloaded = await self.yahoo_client.fetch_daily_history_many(full, window)
+            for symbol, bars in downloaded.items():
+                results[symbol] = await asyncio.to_thread(self._replace, symbol, bars, window)
+        return results
+
+    def _plan(self, symbol: str, window: int) -> Tuple[PriceSeries, Optional[int]]:
+        """
+        Decide how much to download to refresh a symbol's stored bars.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            window (int): Number of bars wanted.
+        Returns:
+            Tuple[PriceSeries, Optional[int]]: The stored window and the number of
+            recent bars to download, or None when a full download is needed.
+        """
+        if self.bar_store.depth(symbol) < window:
+            return PriceSeries.empty(), None
+        stored = self.bar_store.read(symbol, window)
+        if not len(stored):
+            return stored, None
+
+        last = stored.timestamps[-1].astype("datetime64[D]")
+        days = int(np.busday_count(last, self.today())) + _OVERLAP_BARS
+        return stored, days if days < window else None
+
+    def _replace(self, symbol: str, bars: PriceSeries, window: int) -> PriceSeries:
+        # Serve the stored copy so the download can be freed (memory-mapped
+        # stores then keep a single shared copy of the bars). Only a download
+        # reaching back to the reported listing date is the whole history
+        # (e.g. a recent IPO) and serves any window; a merely short download
+        # keeps the requested depth, so a wider request downloads again
+        depth = FULL_HISTORY if len(bars) < window and bars.starts_at_listing() else window
+        self.bar_store.write(symbol, bars, depth)
+        return self.bar_store.read(symbol, window)
+
+    def _merge(self, symbol: str, stored: PriceSeries, recent: PriceSeries, window: int) -> Optional[PriceSeries]:
+        """
+        Append downloaded recent bars to the stored ones.
+
+        Args:
+            symbol (str): Normalised stock ticker symbol.
+            stored (PriceSeries): Stored window, as returned by ``_plan``.
+            recent (PriceSeries): Downloaded recent bars.
+            window (int): Number of bars wanted.
+        Returns:
+            Optional[PriceSeries]: The updated window, or None when the download
+            does not line up with the stored bars and a full download is needed.
+        """
+        if not len(recent):
+            return stored
+
+        start = int(np.searchsorted(stored.timestamps, recent.timestamps[0]))
+        if start >= len(stored) or stored.timestamps[start] != recent.timestamps[0]:
+            # Gap between the stored and downloaded bars
+            return None
+
+        overlap = len(stored) - start
+        # The last stored bar may have been taken intraday; earlier ones are settled
+        settled = overlap - 1
+        if len(recent) < overlap or not np.array_equal(recent.timestamps[:overlap], stored.timestamps[start:]):
+            return None
+        if not np.allclose(recent.close[:settled], stored.close[start:start + settled], rtol=1e-9, atol=0.0):
+            return None
+
+        self.bar_store.append(symbol, recent[settled:])
+        return self.bar_store.read(symbol, window)
@@ -0,0 +1,163 @@
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class PriceSeries:
+    """
+    Daily OHLCV bars held as contiguous NumPy arrays, oldest to newest.
+
+    ``timestamps`` is ``datetime64[ns]`` (UTC); the price and volume columns
+    are ``float64`` and share its length. Slicing returns a PriceSeries of
+    array views, so windows of a series cost no copies. ``first_trade`` is
+    the listing date reported by the upstream, when it reports one.
+    """
+    __slots__ = ("timestamps", "open", "high", "low", "close", "volume", "first_trade")
+
+    def __init__(
+        self,
+        timestamps: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any,
+        first_trade: Optional[np.datetime64] = None,
+    ) -> None:
+        self.timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.volume = np.asarray(volume, dtype=np.float64)
+        self.first_trade = first_trade
+
+        n = len(self.timestamps)
+        if any(len(getattr(self, column)) != n for column in _COLUMNS):
+            raise ValueError("PriceSeries columns must have the same length.")
+
+    @classmethod
+    def empty(cls) -> "PriceSeries":
+        """
+        Build a series without bars.
+
+        Returns:
+            PriceSeries: An empty series.
+        """
+        return cls(*([[]] * 6))
+
+    @classmethod
+    def from_frame(cls, frame: "pd.DataFrame") -> "PriceSeries":
+        """
+        Build a series from a yfinance OHLCV DataFrame indexed by date.
+
+        Rows without a close are dropped and rows are put in date order; the
+        columns are copied out as whole arrays, without per-row objects.
+
+        Args:
+            frame (pd.DataFrame): Frame with Open/High/Low/Close/Volume columns.
+        Returns:
+            PriceSeries: The bars in the frame.
+        """
+        frame = frame.dropna(subset=["Close"])
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index()
+
+        index = frame.index
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_convert("UTC").tz_localize(None)
+
+        return cls(
+            timestamps=index.to_numpy(dtype="datetime64[ns]"),
+            open=frame["Open"].to_numpy(dtype=np.float64),
+            high=frame["High"].to_numpy(dtype=np.float64),
+            low=frame["Low"].to_numpy(dtype=np.float64),
+            close=frame["Close"].to_numpy(dtype=np.float64),
+            volume=frame["Volume"].to_numpy(dtype=np.float64),
+        )
+
+    @classmethod
+    def from_epoch_columns(
+        cls,
+        timestamps: Sequence[int],
+        open: Sequence[Optional[float]],
+        high: Sequence[Optional[float]],
+        low: Sequence[Optional[float]],
+        close: Sequence[Optional[float]],
+        volume: Sequence[Optional[float]],
+    ) -> "PriceSeries":
+        """
+        Build a series from epoch-second timestamps and nullable columns.
+
+        Missing values become NaN and bars without a close are dropped.
+
+        Args:
+            timestamps (Sequence[int]): Bar times in seconds since the epoch.
+            open (Sequence[Optional[float]]): Opening prices.
+            high (Sequence[Optional[float]]): Highs.
+            low (Sequence[Optional[float]]): Lows.
+            close (Sequence[Optional[float]]): Closing prices.
+            volume (Sequence[Optional[float]]): Volumes.
+        Returns:
+            PriceSeries: The bars, oldest to newest.
+        """
+        n = len(timestamps)
+        columns = [
+            np.array([np.nan if v is None else v for v in values], dtype=np.float64) if len(values) == n else np.full(n, np.nan)
+            for values in (open, high, low, close, volume)
+        ]
+        series = cls(np.asarray(timestamps, dtype="datetime64[s]"), *columns)
+
+        keep = ~np.isnan(series.close)
+        if not keep.all():
+            series = series[keep]
+        if n > 1 and not (np.diff(series.timestamps) >= np.timedelta64(0)).all():
+            series = series[np.argsort(series.timestamps, kind="stable")]
+        return series
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "PriceSeries":
+        if isinstance(index, (int, np.integer)):
+            raise TypeError("Index a PriceSeries column (e.g. series.close[i]) for single bars.")
+        series = PriceSeries.__new__(PriceSeries)
+        for name in ("timestamps", *_COLUMNS):
+            setattr(series, name, getattr(self, name)[index])
+        series.first_trade = self.first_trade
+        return series
+
+    def starts_at_listing(self) -> bool:
+        """
+        Check whether the series reaches back to the symbol's listing.
+
+        Returns:
+            bool: True when the upstream reported a listing date and the first
+            bar is on or before it, i.e. no older bars exist.
+        """
+        if self.first_trade is None or not len(self):
+            return False
+        return bool(self.timestamps[0].astype("datetime64[D]") <= self.first_trade.astype("datetime64[D]"))
+
+    def tail(self, n: int) -> "PriceSeries":
+        """
+        Return the most recent bars.
+
+        Args:
+            n (int): Number of bars wanted.
+        Returns:
+            PriceSeries: Up to ``n`` bars, oldest to newest.
+        """
+        if n <= 0:
+            return self[:0]
+        return self[-n:]
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "PriceSeries(bars=0)"
+        return f"PriceSeries(bars={len(self)}, first={self.timestamps[0]}, last={self.timestamps[-1]})"
@@ -0,0 +1,187 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Sequence, TypeVar
+
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooRateLimitError
+
+T = TypeVar("T")
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket admitting ``rate`` calls per second with bursts of ``capacity``.
+
+    Callers wait for their token; a caller that would wait longer than
+    ``max_wait`` seconds is rejected with YahooRateLimitError instead.
+    """
+    rate: float
+    capacity: float
+    max_wait: Optional[float] = None
+    clock: Callable[[], float] = time.monotonic
+    tokens: float = field(default=-1.0, init=False)
+    _updated: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+        self._updated = self.clock()
+
+    async def acquire(self) -> None:
+        """
+        Take one token, waiting for the bucket to refill if needed.
+
+        Raises:
+            YahooRateLimitError: If the wait would exceed ``max_wait``.
+        """
+        self._refill()
+        # Tokens go negative to queue callers in arrival order
+        wait = (1.0 - self.tokens) / self.rate if self.tokens < 1.0 else 0.0
+        if self.max_wait is not None and wait > self.max_wait:
+            raise YahooRateLimitError(f"Client-side rate limit reached; next slot in {wait:.1f}s.")
+        self.tokens -= 1.0
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # The caller gave up before using its token; hand it back
+                self._refill()
+                self.tokens = min(self.capacity, self.tokens + 1.0)
+                raise
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+@dataclass
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for upstream calls.
+
+    The limit grows additively (by about one slot per ``limit`` successful
+    calls) up to ``max_limit`` and is halved, at most once per ``cooldown``
+    seconds, whenever the upstream signals throttling.
+    """
+    initial_limit: float = 4.0
+    min_limit: float = 1.0
+    max_limit: float = 16.0
+    decrease_factor: float = 0.5
+    cooldown: float = 1.0
+    clock: Callable[[], float] = time.monotonic
+    limit: float = field(default=0.0, init=False)
+    in_flight: int = field(default=0, init=False)
+    throttled: int = field(default=0, init=False)
+    _last_decrease: float = field(default=float("-inf"), init=False, repr=False)
+    _waiters: Deque["asyncio.Future[None]"] = field(default_factory=deque, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.limit = self.initial_limit
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self.in_flight >= int(self.limit):
+            waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            woken = False
+            try:
+                await waiter
+                woken = True
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                if not woken and waiter.done() and not waiter.cancelled():
+                    # Woken, then cancelled before taking the slot; pass the
+                    # wake-up on so the slot does not sit idle
+                    self._wake()
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Free a slot and wake as many waiters as the limit allows."""
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """Additive increase after a successful call."""
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease after the upstream throttled a call."""
+        self.throttled += 1
+        now = self.clock()
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+            self._last_decrease = now
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        for waiter in list(self._waiters)[:max(free, 0)]:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+@dataclass
+class RateLimitedYahooClient(YahooClient):
+    """
+    YahooClient decorator pacing upstream calls.
+
+    Every call takes a token from ``bucket`` and a slot from ``limiter``;
+    YahooRateLimitError from the wrapped client shrinks the limiter and
+    successful calls grow it back, so throughput settles near the upstream limit.
+    """
+    yahoo_client: YahooClient
+    bucket: TokenBucket
+    limiter: AdaptiveConcurrencyLimiter
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch quote data under the rate limit."""
+        return await self._paced(lambda: self.yahoo_client.fetch_quote(symbol))
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily history under the rate limit."""
+        return await self._paced(lambda: self.yahoo_client.fetch_daily_history(symbol, days))
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """Fetch raw fundamentals under the rate limit."""
+        return await self._paced(lambda: self.yahoo_client.fetch_fundamentals(symbol))
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quote data for several symbols as one paced call."""
+        return await self._paced(lambda: self.yahoo_client.fetch_quotes_many(symbols))
+
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """Fetch daily history for several symbols as one paced call."""
+        return await self._paced(lambda: self.yahoo_client.fetch_daily_history_many(symbols, days))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report the limiter state.
+
+        Returns:
+            Dict[str, float]: Current concurrency limit, calls in flight and waiting,
+            throttling responses seen and tokens left in the bucket.
+        """
+        return {
+            "concurrency_limit": self.limiter.limit,
+            "in_flight": self.limiter.in_flight,
+            "waiting": len(self.limiter._waiters),
+            "throttled": self.limiter.throttled,
+            "tokens": self.bucket.tokens,
+        }
+
+    async def _paced(self, call: Callable[[], Awaitable[T]]) -> T:
+        await self.bucket.acquire()
+        await self.limiter.acquire()
+        try:
+            result = await call()
+        except YahooRateLimitError:
+            self.limiter.on_throttle()
+            raise
+        finally:
+            self.limiter.release()
+        self.limiter.on_success()
+        return result
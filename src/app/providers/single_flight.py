@@ -0,0 +1,84 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Sequence, Tuple
+
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient
+
+
+@dataclass
+class SingleFlightYahooClient(YahooClient):
+    """
+    YahooClient decorator coalescing concurrent identical calls.
+
+    Callers asking for the same (method, symbol, args) while a call is in
+    flight await that call instead of starting their own. Its result, or the
+    exception it raised, is handed to every waiter unchanged. A waiter giving
+    up (e.g. on timeout) does not cancel the call for the others.
+    """
+    yahoo_client: YahooClient
+    calls: int = field(default=0, init=False)
+    coalesced: int = field(default=0, init=False)
+    _in_flight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = field(default_factory=dict, init=False, repr=False)
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch quote data, sharing concurrent identical calls."""
+        return await self._flight(("fetch_quote", symbol), lambda: self.yahoo_client.fetch_quote(symbol))
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily history, sharing concurrent identical calls."""
+        return await self._flight(("fetch_daily_history", symbol, days), lambda: self.yahoo_client.fetch_daily_history(symbol, days))
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """Fetch raw fundamentals, sharing concurrent identical calls."""
+        return await self._flight(("fetch_fundamentals", symbol), lambda: self.yahoo_client.fetch_fundamentals(symbol))
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quote data for several symbols, sharing concurrent identical batches."""
+        key = ("fetch_quotes_many", tuple(sorted(set(symbols))))
+        return await self._flight(key, lambda: self.yahoo_client.fetch_quotes_many(symbols))
+
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """Fetch daily history for several symbols, sharing concurrent identical batches."""
+        key = ("fetch_daily_history_many", tuple(sorted(set(symbols))), days)
+        return await self._flight(key, lambda: self.yahoo_client.fetch_daily_history_many(symbols, days))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report coalescing counters.
+
+        Returns:
+            Dict[str, int]: Upstream calls started, callers that joined one, and calls in flight.
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    async def _flight(self, key: Tuple[Any, ...], call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Join the in-flight call for key or start it.
+
+        Args:
+            key (Tuple[Any, ...]): Call key, (method, symbol, *args).
+            call (Callable[[], Awaitable[Any]]): Performs the upstream call.
+        Returns:
+            Any: The shared result.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Tuple[Any, ...], future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the error as retrieved in case every waiter already gave up
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,134 @@
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from app.core.config import Settings, settings
+from app.providers.caching import CachingYahooClient
+from app.providers.circuit_breaker import CircuitBreaker, CircuitBreakerYahooClient
+from app.providers.executor import ProviderExecutor
+from app.providers.rate_limit import AdaptiveConcurrencyLimiter, RateLimitedYahooClient, TokenBucket
+from app.providers.single_flight import SingleFlightYahooClient
+from app.providers.yahoo_client import YahooClient, YFinanceYahooClient
+from app.providers.yahoo_http import HttpYahooClient
+
+L = TypeVar("L")
+
+
+def build_yahoo_client(config: Settings = settings) -> YahooClient:
+    """
+    Build the provider stack: the configured backend wrapped in the configured layers.
+
+    Args:
+        config (Settings): Application settings.
+    Returns:
+        YahooClient: The outermost client of the stack.
+    """
+    client = build_backend(config)
+
+    if config.provider_breaker_enabled:
+        client = CircuitBreakerYahooClient(
+            yahoo_client=client,
+            breaker=CircuitBreaker(
+                window_size=config.provider_breaker_window,
+                min_calls=config.provider_breaker_min_calls,
+                failure_rate_threshold=config.provider_breaker_failure_rate,
+                slow_call_seconds=config.provider_breaker_slow_call_seconds,
+                slow_rate_threshold=config.provider_breaker_slow_rate,
+                open_seconds=config.provider_breaker_open_seconds,
+            ),
+        )
+
+    if config.provider_rate_limit_enabled:
+        client = RateLimitedYahooClient(
+            yahoo_client=client,
+            bucket=TokenBucket(
+                rate=config.provider_rate_per_second,
+                capacity=config.provider_rate_burst,
+                max_wait=config.provider_rate_max_wait_seconds,
+            ),
+            limiter=AdaptiveConcurrencyLimiter(
+                initial_limit=config.provider_concurrency_initial,
+                min_limit=config.provider_concurrency_min,
+                max_limit=config.provider_concurrency_max,
+            ),
+        )
+
+    if config.provider_single_flight_enabled:
+        client = SingleFlightYahooClient(yahoo_client=client)
+
+    if config.provider_cache_enabled:
+        client = CachingYahooClient(
+            yahoo_client=client,
+            ttls=dict(config.provider_cache_ttls),
+            max_entries=config.provider_cache_max_entries,
+        )
+
+    return client
+
+
+def build_backend(config: Settings = settings) -> YahooClient:
+    """
+    Build the innermost client talking to Yahoo.
+
+    Args:
+        config (Settings): Application settings.
+    Returns:
+        YahooClient: The yfinance client on its provider pool, or the native HTTP client.
+    Raises:
+        ValueError: If ``yahoo_client_backend`` is not a known backend.
+    """
+    if config.yahoo_client_backend == "http":
+        return HttpYahooClient(
+            base_url=config.yahoo_http_base_url,
+            timeout=config.yahoo_http_timeout_seconds,
+            max_connections=config.yahoo_http_max_connections,
+            max_keepalive_connections=config.yahoo_http_max_keepalive,
+        )
+    if config.yahoo_client_backend == "yfinance":
+        executor = ProviderExecutor(
+            max_workers=config.provider_max_workers,
+            max_in_flight=config.provider_max_in_flight,
+            max_queue=config.provider_max_queue,
+            queue_timeout=config.provider_queue_timeout_seconds,
+        )
+        return YFinanceYahooClient(executor=executor)
+    raise ValueError(f"Unknown yahoo_client_backend '{config.yahoo_client_backend}'.")
+
+
+def provider_stats(client: YahooClient) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect the counters of every layer in a provider stack.
+
+    Layers are walked from the outermost client inwards through their
+    ``yahoo_client`` attribute; layers exposing ``stats()`` are reported
+    under their class name.
+
+    Args:
+        client (YahooClient): Outermost client of the stack.
+    Returns:
+        Dict[str, Dict[str, Any]]: Stats per layer.
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+    layer: Any = client
+    while layer is not None:
+        layer_stats = getattr(layer, "stats", None)
+        if callable(layer_stats):
+            stats[type(layer).__name__] = layer_stats()
+        layer = getattr(layer, "yahoo_client", None)
+    return stats
+
+
+def find_layer(client: YahooClient, layer_type: Type[L]) -> Optional[L]:
+    """
+    Find a layer of a given type in a provider stack.
+
+    Args:
+        client (YahooClient): Outermost client of the stack.
+        layer_type (Type[L]): Layer class to look for.
+    Returns:
+        Optional[L]: The first matching layer, or None.
+    """
+    layer: Any = client
+    while layer is not None:
+        if isinstance(layer, layer_type):
+            return layer
+        layer = getattr(layer, "yahoo_client", None)
+    return None
@@ -1,7 +1,19 @@
 from dataclasses import dataclass
-from typing import Protocol, Any, Dict, List
+from typing import TYPE_CHECKING, Protocol, Any, Callable, Dict, Optional, Sequence, TypeVar
 
 import asyncio
+import logging
+
+import numpy as np
+
+from app.providers.price_series import PriceSeries
+
+if TYPE_CHECKING:
+    from app.providers.executor import ProviderExecutor
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 class YahooClientError(Exception):
     """"""
@@ -9,6 +21,76 @@ class YahooClientError(Exception):
 class YahooSymbolNotFoundError(YahooClientError):
     """"""
     
+class YahooRateLimitError(YahooClientError):
+    """Raised when Yahoo Finance, or the client-side limiter, throttles a request."""
+    
+def _is_rate_limited(error: Exception) -> bool:
+    """
+    Check whether an upstream error means Yahoo Finance throttled the request.
+
+    Args:
+        error (Exception): Error raised by yfinance.
+    Returns:
+        bool: True for throttling responses.
+    """
+    if type(error).__name__ == "YFRateLimitError":
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    if status is not None:
+        return status == 429
+    message = str(error).lower()
+    return "too many requests" in message or "rate limit" in message
+
+def calendar_days(sessions: int) -> int:
+    """
+    Calendar days to request so a download covers a number of trading sessions.
+
+    About 252 of every 365 days are sessions; the margin covers holidays.
+
+    Args:
+        sessions (int): Trading sessions wanted.
+    Returns:
+        int: Calendar days spanning at least that many sessions.
+    """
+    return sessions * 3 // 2 + 10
+
+def first_trade_date(epoch_seconds: Any) -> Optional[np.datetime64]:
+    """
+    Convert an upstream ``firstTradeDate`` to a datetime.
+
+    Args:
+        epoch_seconds (Any): Listing time in seconds since the epoch, or None.
+    Returns:
+        Optional[np.datetime64]: The listing time, or None when not reported.
+    """
+    if not isinstance(epoch_seconds, (int, float)) or isinstance(epoch_seconds, bool):
+        return None
+    return np.datetime64(int(epoch_seconds), "s")
+
+def _collect_many(symbols: Sequence[str], results: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Pair per-symbol results from a fan-out, leaving out unknown symbols.
+
+    Args:
+        symbols (Sequence[str]): Symbols in request order.
+        results (Sequence[Any]): Results or exceptions, as returned by
+            ``asyncio.gather(..., return_exceptions=True)``.
+    Returns:
+        Dict[str, Any]: Results keyed by symbol.
+    Raises:
+        BaseException: The first error other than YahooSymbolNotFoundError.
+    """
+    collected: Dict[str, Any] = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, YahooSymbolNotFoundError):
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        collected[symbol] = result
+    return collected
+    
 class YahooClient(Protocol):
     """
     Protocol for Yahoo Finance client implementations.
@@ -24,7 +106,7 @@ class YahooClient(Protocol):
         """
         ...
     
-    async def fetch_daily_history(self, symbol: str, days: int) -> List[Dict[str, Any]]:
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
         """
         Fetch daily historical data for a given stock symbol.
 
@@ -32,7 +114,7 @@ class YahooClient(Protocol):
             symbol (str): Stock ticker symbol.
             days (int): Number of days of history to fetch.
         Returns:
-            List[Dict[str, Any]]: Daily historical data.
+            PriceSeries: Daily OHLCV bars, oldest to newest.
         """
         ...
         
@@ -47,21 +129,60 @@ class YahooClient(Protocol):
             Dict[str, Any]: Raw fundamentals data.
         """
         ...
-        
-    async def fetch_technical(self, symbol: str) -> Dict[str, Any]:
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch technical indicators for a given stock symbol.
+        Fetch quote data for several symbols.
+
+        The default fans out to ``fetch_quote``; implementations with a
+        multi-symbol upstream call override it.
 
         Args:
-            symbol (str): Stock ticker symbol.
+            symbols (Sequence[str]): Stock ticker symbols.
+        Returns:
+            Dict[str, Dict[str, Any]]: Quote data keyed by symbol; unknown
+            symbols are left out.
+        """
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(self.fetch_quote(s) for s in unique), return_exceptions=True)
+        return _collect_many(unique, results)
+
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """
+        Fetch daily historical data for several symbols.
+
+        The default fans out to ``fetch_daily_history``; implementations with
+        a multi-symbol upstream call override it.
 
+        Args:
+            symbols (Sequence[str]): Stock ticker symbols.
+            days (int): Number of days of history to fetch.
         Returns:
-            Dict[str, Any]: Raw technical data.
+            Dict[str, PriceSeries]: Daily bars keyed by symbol;
+            unknown symbols are left out.
         """
-        ...
+        unique = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(self.fetch_daily_history(s, days) for s in unique), return_exceptions=True)
+        return _collect_many(unique, results)
+
 @dataclass
-class YFinanceYahooClient:
-    """Yahoo Finance client implementation using yfinance."""
+class YFinanceYahooClient(YahooClient):
+    """Yahoo Finance client implementation using yfinance.
+
+    Blocking yfinance calls run on ``executor`` when one is given, otherwise on
+    the default asyncio thread pool.
+    """
+    executor: Optional["ProviderExecutor"] = None
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        """Run a blocking yfinance call off the event loop."""
+        if self.executor is None:
+            return await asyncio.to_thread(fn)
+        return await self.executor.run(fn)
+
+    def stats(self) -> Dict[str, float]:
+        """Report executor queue statistics, if a dedicated executor is used."""
+        return self.executor.stats() if self.executor is not None else {}
 
     async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
         """Fetch quote data for a given stock symbol using yfinance."""
@@ -91,41 +212,88 @@ class YFinanceYahooClient:
             return data
 
         try:
-            return await asyncio.to_thread(_get_quote_sync)
-        except YahooSymbolNotFoundError:
+            return await self._run(_get_quote_sync)
+        except YahooClientError:
             raise
         except Exception as e:
+            if _is_rate_limited(e):
+                raise YahooRateLimitError(f"Rate limited fetching quote for '{symbol}': {e}") from e
             raise YahooClientError(f"Error fetching quote for '{symbol}': {e}") from e
 
-    async def fetch_daily_history(self, symbol: str, days: int) -> List[Dict[str, Any]]:
-        """Fetch daily close prices for the requested number of days."""
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily OHLCV bars for the requested number of days."""
 
-        def _get_history_sync() -> List[Dict[str, Any]]:
+        def _get_history_sync() -> PriceSeries:
             import yfinance as yf
 
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=f"{days + 2}d", interval="1d")
+            hist = ticker.history(period=f"{calendar_days(days)}d", interval="1d")
 
             if hist.empty:
                 raise YahooSymbolNotFoundError(f"History for '{symbol}' not found.")
 
-            records: List[Dict[str, Any]] = []
-            for ts, row in hist.iterrows():
-                records.append({
-                    "date": ts.to_pydatetime(),
-                    "close": float(row["Close"]),
-                })
-
-            records.sort(key=lambda x: x["date"])
-            return records[-days:]
+            series = PriceSeries.from_frame(hist)
+            try:
+                metadata = ticker.history_metadata or {}
+            except Exception:
+                # The listing date is optional; the bars are still good
+                metadata = {}
+            series.first_trade = first_trade_date(metadata.get("firstTradeDate"))
+            return series.tail(days)
 
         try:
-            return await asyncio.to_thread(_get_history_sync)
-        except YahooSymbolNotFoundError:
+            return await self._run(_get_history_sync)
+        except YahooClientError:
             raise
         except Exception as e:
+            if _is_rate_limited(e):
+                raise YahooRateLimitError(f"Rate limited fetching history for '{symbol}': {e}") from e
             raise YahooClientError(f"Error fetching history for '{symbol}': {e}") from e
 
+    async def fetch_daily_history_many(self, symbols: Sequence[str], days: int) -> Dict[str, PriceSeries]:
+        """Fetch daily OHLCV bars for several symbols with one yfinance download."""
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+
+        def _download_sync() -> Dict[str, PriceSeries]:
+            import yfinance as yf
+
+            frame = yf.download(
+                tickers=unique,
+                period=f"{calendar_days(days)}d",
+                interval="1d",
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+                threads=False,
+            )
+
+            # Per-ticker failures show up as missing or all-NaN columns, which
+            # are treated as not found
+            histories: Dict[str, PriceSeries] = {}
+            tickers = set(frame.columns.get_level_values(0)) if frame is not None and not frame.empty else set()
+            for symbol in unique:
+                if symbol not in tickers:
+                    continue
+                series = PriceSeries.from_frame(frame[symbol])
+                if len(series):
+                    histories[symbol] = series.tail(days)
+
+            missing = [symbol for symbol in unique if symbol not in histories]
+            if missing:
+                logger.info("No history returned for %s; treating as not found.", missing)
+            return histories
+
+        try:
+            return await self._run(_download_sync)
+        except YahooClientError:
+            raise
+        except Exception as e:
+            if _is_rate_limited(e):
+                raise YahooRateLimitError(f"Rate limited downloading history: {e}") from e
+            raise YahooClientError(f"Error downloading history for {unique}: {e}") from e
+
     async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
         """Fetch raw fundamentals for a given stock symbol using yfinance."""
 
@@ -172,58 +340,14 @@ class YFinanceYahooClient:
             }
 
         try:
-            return await asyncio.to_thread(_get_fundamentals_sync)
-        except YahooSymbolNotFoundError:
+            return await self._run(_get_fundamentals_sync)
+        except YahooClientError:
             raise
         except Exception as e:
+            if _is_rate_limited(e):
+                raise YahooRateLimitError(f"Rate limited fetching fundamentals for '{symbol}': {e}") from e
             raise YahooClientError(f"Error fetching fundamentals for '{symbol}': {e}") from e
 
-    async def fetch_technical(self, symbol: str) -> Dict[str, Any]:
-        """Fetch technical indicators for a given stock symbol using yfinance."""
-
-        def _get_technical_sync() -> Dict[str, Any]:
-            import pandas as pd
-            import yfinance as yf
-
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="200d", interval="1d")
-
-            if hist.empty:
-                raise YahooSymbolNotFoundError(f"Symbol '{symbol}' not found.")
-
-            hist.sort_index(inplace=True)
-
-            sma_50d = hist["Close"].rolling(window=50).mean().iloc[-1]
-            sma_200d = hist["Close"].rolling(window=200).mean().iloc[-1]
-
-            current_price = hist["Close"].iloc[-1]
-            above_200d = current_price > sma_200d if pd.notna(sma_200d) else None
-
-            delta = hist["Close"].diff()
-            gain = delta.where(delta > 0, 0.0)
-            loss = -delta.where(delta < 0, 0.0)
-            avg_gain = gain.rolling(window=14).mean().iloc[-1]
-            avg_loss = loss.rolling(window=14).mean().iloc[-1]
-            rsi_14d = 100 - (100 / (1 + (avg_gain / avg_loss))) if avg_loss != 0 else None
-
-            volatility_30 = hist["Close"].diff().rolling(window=30).std().iloc[-1]
-
-            return {
-                "symbol": symbol,
-                "sma_50d": float(sma_50d) if pd.notna(sma_50d) else None,
-                "sma_200d": float(sma_200d) if pd.notna(sma_200d) else None,
-                "above_200d": above_200d,
-                "rsi_14d": float(rsi_14d) if pd.notna(rsi_14d) else None,
-                "volatility_30": float(volatility_30) if pd.notna(volatility_30) else None,
-            }
-
-        try:
-            return await asyncio.to_thread(_get_technical_sync)
-        except YahooSymbolNotFoundError:
-            raise
-        except Exception as e:
-            raise YahooClientError(f"Error fetching technicals for '{symbol}': {e}") from e
-        
 async def ticker_exists(symbol: str, client: YahooClient) -> bool:
     """
     Check if a ticker symbol exists using the provided YahooClient.
@@ -239,6 +363,8 @@ async def ticker_exists(symbol: str, client: YahooClient) -> bool:
         return True
     except YahooSymbolNotFoundError:
         return False
+    except YahooClientError:
+        raise
     except Exception as e:
         raise YahooClientError(f"Error talking to Yahoo Finance: {e}") from e
 
@@ -0,0 +1,292 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import (
+    YahooClient,
+    YahooClientError,
+    YahooRateLimitError,
+    YahooSymbolNotFoundError,
+    calendar_days,
+    first_trade_date,
+)
+
+# quoteSummary modules flattened into the fundamentals "info" mapping
+_SUMMARY_INFO_MODULES = ("price", "summaryDetail", "defaultKeyStatistics", "financialData")
+_SUMMARY_MODULES = _SUMMARY_INFO_MODULES + ("incomeStatementHistory", "cashflowStatementHistory", "balanceSheetHistory")
+
+
+def _raw(value: Any) -> Any:
+    """
+    Unwrap a Yahoo ``{"raw": ..., "fmt": ...}`` value.
+
+    Args:
+        value (Any): Value from a Yahoo JSON payload.
+    Returns:
+        Any: The raw value, or the value itself when it is not wrapped.
+    """
+    if isinstance(value, dict):
+        return value.get("raw")
+    return value
+
+def _statement_rows(statements: List[Dict[str, Any]], fields: Dict[str, str]) -> Dict[str, Dict[datetime, Any]]:
+    """
+    Pivot Yahoo statement history into ``{row name: {period end: value}}``.
+
+    Args:
+        statements (List[Dict[str, Any]]): Statement entries with an ``endDate``.
+        fields (Dict[str, str]): Yahoo field name -> row name.
+    Returns:
+        Dict[str, Dict[datetime, Any]]: Rows keyed by period end date.
+    """
+    rows: Dict[str, Dict[datetime, Any]] = {}
+    for statement in statements:
+        end = _raw(statement.get("endDate"))
+        if end is None:
+            continue
+        period = datetime.fromtimestamp(end, tz=timezone.utc)
+        for yahoo_name, row_name in fields.items():
+            value = _raw(statement.get(yahoo_name))
+            if value is not None:
+                rows.setdefault(row_name, {})[period] = value
+    return rows
+
+
+@dataclass
+class HttpYahooClient(YahooClient):
+    """
+    Yahoo Finance client speaking the chart, quote and quoteSummary JSON
+    endpoints directly over a pooled, keep-alive async HTTP client.
+
+    The quote and quoteSummary endpoints require a session cookie and a
+    matching "crumb" token. They are fetched on first use and refreshed
+    once when Yahoo answers 401.
+    """
+    base_url: str = "https://query2.finance.yahoo.com"
+    cookie_url: str = "https://fc.yahoo.com"
+    timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    headers: Dict[str, str] = field(default_factory=lambda: {"User-Agent": "Mozilla/5.0 (stock-evaluator)"})
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    _http: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, init=False, repr=False)
+    _crumb: Optional[str] = field(default=None, init=False, repr=False)
+    _crumb_lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, created on first use."""
+        # Pooled connections belong to one event loop; rebuild if the loop changed
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._loop is not loop:
+            if self._http is not None and not self._http.is_closed:
+                # Release the previous loop's pool rather than leaking it
+                loop.create_task(_close_quietly(self._http))
+            self._loop = loop
+            # The crumb is bound to the session cookie of the old client
+            self._crumb = None
+            self._crumb_lock = asyncio.Lock()
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers=self.headers,
+                transport=self.transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._crumb = None
+
+    async def fetch_quote(self, symbol: str) -> Dict[str, Any]:
+        """Fetch quote data from the v7 quote endpoint."""
+        payload = await self._get_json("/v7/finance/quote", {"symbols": symbol}, f"quote for '{symbol}'", crumb=True)
+        results = (payload.get("quoteResponse") or {}).get("result") or []
+        if not results:
+            raise YahooSymbolNotFoundError(f"Symbol '{symbol}' not found.")
+
+        data = dict(results[0])
+        data.setdefault("symbol", symbol)
+        return data
+
+    async def fetch_quotes_many(self, symbols: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quote data for several symbols with one v7 quote request."""
+        unique = list(dict.fromkeys(symbols))
+        if not unique:
+            return {}
+        payload = await self._get_json(
+            "/v7/finance/quote", {"symbols": ",".join(unique)}, f"quotes for {unique}", crumb=True,
+        )
+        results = (payload.get("quoteResponse") or {}).get("result") or []
+
+        quotes: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            symbol = result.get("symbol")
+            if symbol in unique:
+                quotes[symbol] = dict(result)
+        return quotes
+
+    async def fetch_daily_history(self, symbol: str, days: int) -> PriceSeries:
+        """Fetch daily OHLCV bars from the v8 chart endpoint."""
+        now = int(time.time())
+        params = {"period1": now - calendar_days(days) * 86400, "period2": now, "interval": "1d"}
+        payload = await self._get_json(f"/v8/finance/chart/{symbol}", params, f"history for '{symbol}'")
+
+        chart = payload.get("chart") or {}
+        if chart.get("error"):
+            raise YahooSymbolNotFoundError(f"History for '{symbol}' not found.")
+        results = chart.get("result") or []
+        if not results:
+            raise YahooSymbolNotFoundError(f"History for '{symbol}' not found.")
+
+        result = results[0]
+        timestamps = result.get("timestamp") or []
+        quote = ((result.get("indicators") or {}).get("quote") or [{}])[0]
+
+        series = PriceSeries.from_epoch_columns(
+            timestamps,
+            *(quote.get(name) or [] for name in ("open", "high", "low", "close", "volume")),
+        )
+        if not len(series):
+            raise YahooSymbolNotFoundError(f"History for '{symbol}' not found.")
+
+        series.first_trade = first_trade_date((result.get("meta") or {}).get("firstTradeDate"))
+        return series.tail(days)
+
+    async def fetch_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """Fetch raw fundamentals from the v10 quoteSummary endpoint."""
+        payload = await self._get_json(
+            f"/v10/finance/quoteSummary/{symbol}",
+            {"modules": ",".join(_SUMMARY_MODULES)},
+            f"fundamentals for '{symbol}'",
+            crumb=True,
+        )
+        summary = payload.get("quoteSummary") or {}
+        results = summary.get("result") or []
+        if summary.get("error") or not results:
+            raise YahooSymbolNotFoundError(f"Fundamentals for '{symbol}' not found.")
+        modules = results[0]
+
+        info: Dict[str, Any] = {}
+        for module in _SUMMARY_INFO_MODULES:
+            for key, value in (modules.get(module) or {}).items():
+                value = _raw(value)
+                if value is not None and not isinstance(value, (dict, list)):
+                    info.setdefault(key, value)
+
+        income = (modules.get("incomeStatementHistory") or {}).get("incomeStatementHistory") or []
+        cashflows = (modules.get("cashflowStatementHistory") or {}).get("cashflowStatements") or []
+        balance = (modules.get("balanceSheetHistory") or {}).get("balanceSheetStatements") or []
+
+        income_statement = _statement_rows(income, {"totalRevenue": "Total Revenue", "netIncome": "Net Income"})
+        cashflow = _statement_rows(cashflows, {
+            "totalCashFromOperatingActivities": "Operating Cash Flow",
+            "capitalExpenditures": "Capital Expenditure",
+        })
+        operating = cashflow.get("Operating Cash Flow", {})
+        capex = cashflow.get("Capital Expenditure", {})
+        free_cash_flow = {period: operating[period] + capex.get(period, 0) for period in operating}
+        if free_cash_flow:
+            cashflow["Free Cash Flow"] = free_cash_flow
+        balance_sheet = _statement_rows(balance, {"totalAssets": "Total Assets", "cash": "Cash"})
+
+        if not info and not income_statement and not balance_sheet and not cashflow:
+            raise YahooSymbolNotFoundError(f"Fundamentals for '{symbol}' not found.")
+
+        return {
+            "symbol": symbol,
+            "info": info,
+            "income_statement": income_statement,
+            "balance_sheet": balance_sheet,
+            "cashflow": cashflow,
+        }
+
+    async def _get_json(self, path: str, params: Dict[str, Any], what: str, crumb: bool = False) -> Dict[str, Any]:
+        """
+        GET a Yahoo JSON endpoint, mapping HTTP failures onto client errors.
+
+        Args:
+            path (str): Endpoint path.
+            params (Dict[str, Any]): Query parameters.
+            what (str): Description of the request for error messages.
+            crumb (bool): Send the session crumb, refreshing it once on a 401.
+        Returns:
+            Dict[str, Any]: Decoded JSON payload.
+        """
+        response = await self._get(path, params, what, crumb)
+        if crumb and response.status_code == 401:
+            await self._refresh_crumb(what, stale=self._crumb)
+            response = await self._get(path, params, what, crumb)
+
+        if response.status_code == 404:
+            raise YahooSymbolNotFoundError(f"No data for {what}.")
+        if response.status_code == 429:
+            raise YahooRateLimitError(f"Rate limited fetching {what}.")
+        if response.status_code >= 400:
+            raise YahooClientError(f"Error fetching {what}: HTTP {response.status_code}.")
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise YahooClientError(f"Invalid JSON fetching {what}: {e}") from e
+
+    async def _get(self, path: str, params: Dict[str, Any], what: str, crumb: bool) -> httpx.Response:
+        http = self.http
+        if crumb:
+            if self._crumb is None:
+                await self._refresh_crumb(what, stale=None)
+            params = {**params, "crumb": self._crumb}
+        try:
+            return await http.get(path, params=params)
+        except httpx.HTTPError as e:
+            raise YahooClientError(f"Error fetching {what}: {e}") from e
+
+    async def _refresh_crumb(self, what: str, stale: Optional[str]) -> None:
+        """
+        Fetch a session cookie and its crumb, once for all concurrent callers.
+
+        Args:
+            what (str): Description of the request for error messages.
+            stale (Optional[str]): The crumb the caller saw; it is kept if another
+                caller already replaced it.
+        Raises:
+            YahooRateLimitError: If Yahoo throttles the handshake.
+            YahooClientError: If no crumb could be obtained.
+        """
+        http = self.http
+        async with self._crumb_lock:
+            if self._crumb is not None and self._crumb != stale:
+                return
+            try:
+                # Sets the session cookie; the response itself is usually a 404
+                await http.get(self.cookie_url)
+                response = await http.get("/v1/test/getcrumb")
+            except httpx.HTTPError as e:
+                raise YahooClientError(f"Error fetching crumb for {what}: {e}") from e
+
+            if response.status_code == 429:
+                raise YahooRateLimitError(f"Rate limited fetching crumb for {what}.")
+            crumb = response.text.strip()
+            if response.status_code >= 400 or not crumb:
+                raise YahooClientError(f"Error fetching crumb for {what}: HTTP {response.status_code}.")
+            self._crumb = crumb
+
+
+async def _close_quietly(http: httpx.AsyncClient) -> None:
+    """Close a client whose connections may belong to a finished event loop."""
+    with contextlib.suppress(Exception):
+        await http.aclose()
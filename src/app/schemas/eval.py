@@ -1,6 +1,33 @@
-from pydantic import BaseModel
-from typing import Dict, Optional
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+
+from app.core.config import settings
+
+class MetricStatus(BaseModel):
+    status: Literal["ok", "timeout", "error"] = Field(..., description="Outcome of the metric evaluation.")
+    error: Optional[str] = Field(None, description="Error message when the metric did not complete.")
+    elapsed_ms: float = Field(..., description="Time spent evaluating the metric in milliseconds.")
+    cached: bool = Field(False, description="Whether the values were served from the metric result cache.")
+    stale: bool = Field(False, description="Whether the values were computed from last known good data because the provider is unavailable.")
 
 class EvalResponse(BaseModel):
     ticker: str
     metrics: Dict[str, Dict[str, Optional[float | bool]]]
+    status: Dict[str, MetricStatus] = Field(default_factory=dict, description="Per-metric evaluation status.")
+
+
+class BatchEvalRequest(BaseModel):
+    symbols: List[str] = Field(..., min_length=1, max_length=settings.eval_batch_max_symbols, description="Ticker symbols to evaluate.")
+
+class BatchEvalError(BaseModel):
+    error: str = Field(..., description="Error code, as returned by GET /eval/{symbol}.")
+    message: str = Field(..., description="Error message.")
+
+class BatchEvalItem(BaseModel):
+    symbol: str = Field(..., description="Normalised symbol, or the ticker as sent when it is invalid.")
+    result: Optional[EvalResponse] = Field(None, description="Evaluation, when the symbol succeeded.")
+    error: Optional[BatchEvalError] = Field(None, description="Error, when the symbol failed.")
+
+class BatchEvalResponse(BaseModel):
+    results: Dict[str, EvalResponse] = Field(default_factory=dict, description="Evaluations keyed by normalised symbol.")
+    errors: Dict[str, BatchEvalError] = Field(default_factory=dict, description="Symbols that could not be evaluated.")
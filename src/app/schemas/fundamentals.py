@@ -10,3 +10,4 @@ class FundamentalsResponse(BaseModel):
     return_on_invested_capital: Optional[float] = Field(None, description="Return on Invested Capital.")
     fcf_yield: Optional[float] = Field(None, description="Free Cash Flow Yield.")
     revenue_growth_5y: Optional[float] = Field(None, description="5 Year Revenue Growth Percentage.")
+    stale: bool = Field(False, description="True when served from the last known good data because the provider is unavailable.")
@@ -4,4 +4,5 @@ class PriceResponse(BaseModel):
     symbol: str = Field(..., description="Stock ticker symbol.")
     current: float = Field(..., description="Current stock price.")
     change_1d_pct: float = Field(..., description="Percentage change in price over the last day.")
-    change_1w_pct: float = Field(..., description="Percentage change in price over the last 7 days.")
\ No newline at end of file
+    change_1w_pct: float = Field(..., description="Percentage change in price over the last 7 days.")
+    stale: bool = Field(False, description="True when served from the last known good data because the provider is unavailable.")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 
 class TechnicalResponse(BaseModel):
@@ -8,3 +8,7 @@ class TechnicalResponse(BaseModel):
     above_200d: Optional[bool] = Field(None, description="Indicates if the current price is above the 200-day SMA.")
     rsi_14d: Optional[float] = Field(None, description="Relative Strength Index over the past 14 days.")
     volatility_30: Optional[float] = Field(None, description="Standard deviation of the last 30 changes in closing prices.")
+    sma: Dict[str, Optional[float]] = Field(default_factory=dict, description="Extra Simple Moving Averages keyed by window in days, requested with ?sma=.")
+    rsi: Dict[str, Optional[float]] = Field(default_factory=dict, description="Extra Relative Strength Indexes keyed by window, requested with ?rsi=.")
+    volatility: Dict[str, Optional[float]] = Field(default_factory=dict, description="Extra volatilities keyed by window, requested with ?volatility=.")
+    stale: bool = Field(False, description="True when served from the last known good data because the provider is unavailable.")
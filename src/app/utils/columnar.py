@@ -0,0 +1,80 @@
+import json
+from typing import Any, Dict, Iterator
+
+import numpy as np
+
+# Values per JSON chunk when streaming a column
+CHUNK_SIZE = 1024
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class ArrowUnavailableError(RuntimeError):
+    """Raised when Arrow output is requested but pyarrow is not installed."""
+
+
+def _json_values(values: np.ndarray) -> str:
+    """
+    Encode a block of column values as a JSON array body (without brackets).
+
+    Args:
+        values (np.ndarray): Float or datetime64 values.
+    Returns:
+        str: Comma-separated JSON values; NaN becomes null and dates ISO strings.
+    """
+    if np.issubdtype(values.dtype, np.datetime64):
+        items = np.datetime_as_string(values, unit="D").tolist()
+    else:
+        items = values.astype(object)
+        items[np.isnan(values)] = None
+        items = items.tolist()
+    return json.dumps(items)[1:-1]
+
+def iter_columnar_json(meta: Dict[str, Any], columns: Dict[str, np.ndarray]) -> Iterator[bytes]:
+    """
+    Stream a columnar JSON document ``{**meta, "columns": {name: [...]}}``.
+
+    Columns are written one after another in chunks of CHUNK_SIZE values,
+    so the document is never built in memory as a whole.
+
+    Args:
+        meta (Dict[str, Any]): Top-level fields written before the columns.
+        columns (Dict[str, np.ndarray]): Equal-length columns, in output order.
+    Yields:
+        bytes: Pieces of the JSON document.
+    """
+    head = json.dumps(meta)[:-1]
+    yield f'{head}{", " if meta else ""}"columns": {{'.encode()
+    for i, (name, values) in enumerate(columns.items()):
+        yield f'{", " if i else ""}{json.dumps(name)}: ['.encode()
+        for start in range(0, len(values), CHUNK_SIZE):
+            body = _json_values(values[start:start + CHUNK_SIZE])
+            yield f'{", " if start else ""}{body}'.encode()
+        yield b"]"
+    yield b"}}"
+
+def to_arrow_ipc(meta: Dict[str, Any], columns: Dict[str, np.ndarray]) -> bytes:
+    """
+    Encode columns as an Arrow IPC stream, with ``meta`` as schema metadata.
+
+    Args:
+        meta (Dict[str, Any]): Values stored as string schema metadata.
+        columns (Dict[str, np.ndarray]): Equal-length columns, in output order.
+    Returns:
+        bytes: The Arrow IPC stream.
+    Raises:
+        ArrowUnavailableError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ArrowUnavailableError("Arrow output requires the optional 'pyarrow' package.") from e
+
+    table = pa.table(
+        {name: pa.array(values, from_pandas=True) for name, values in columns.items()},
+    ).replace_schema_metadata({key: str(value) for key, value in meta.items()})
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
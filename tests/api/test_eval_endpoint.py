@@ -1,22 +1,37 @@
+import json
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.api.dependencies import get_services
 from app.core.price_service import PriceDataError
 from app.core.fundamentals_service import FundamentalsDataError
+from app.core.technical_service import TechnicalDataError
 from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
 from app.utils.ticker import InvalidTickerError
+from app.metrics import MetricTimeoutError
+from app.schemas.eval import EvalResponse, MetricStatus
 import app.api.routes.eval as eval_route
+import app.metrics.batch as batch_module
 
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def override_services():
+    app.dependency_overrides[get_services] = lambda: SimpleNamespace(history_store=None)
+    yield
+    app.dependency_overrides.pop(get_services, None)
+
+
 @pytest.fixture(autouse=True)
 def override_eval(monkeypatch):
-    async def fake_evaluate_all(symbol: str):
+    async def fake_evaluate_all(symbol: str, services, selection=None, precomputed=None):
         if symbol == "AAPL":
-            return {
+            return EvalResponse(ticker="AAPL", metrics={
                 "price": {
                     "price.current": 100.0,
                     "price.change_1d_pct": 1.0,
@@ -29,7 +44,18 @@ def override_eval(monkeypatch):
                     "technical.above_200d": True,
                     "technical.rsi_14d": 50.0,
                 },
-            }
+            }, status={
+                "price": MetricStatus(status="ok", elapsed_ms=1.0),
+                "fundamentals": MetricStatus(status="ok", elapsed_ms=1.0),
+                "technical": MetricStatus(status="ok", elapsed_ms=1.0),
+            })
+        if symbol == "PART":
+            return EvalResponse(ticker="PART", metrics={
+                "price": {"price.current": 100.0},
+            }, status={
+                "price": MetricStatus(status="ok", elapsed_ms=1.0),
+                "fundamentals": MetricStatus(status="timeout", error="slow", elapsed_ms=10.0),
+            })
         if symbol == "BAD":
             raise InvalidTickerError("bad ticker")
         if symbol == "MISS":
@@ -40,6 +66,10 @@ def override_eval(monkeypatch):
             raise PriceDataError("price problem")
         if symbol == "FERR":
             raise FundamentalsDataError("fundamentals problem")
+        if symbol == "TERR":
+            raise TechnicalDataError("no price history")
+        if symbol == "SLOW":
+            raise MetricTimeoutError("too slow")
         raise Exception("unexpected test symbol")
 
     monkeypatch.setattr(eval_route, "evaluate_all", fake_evaluate_all)
@@ -53,6 +83,16 @@ def test_eval_endpoint_success():
     assert body["ticker"] == "AAPL"
     assert body["metrics"]["price"]["price.current"] == 100.0
     assert body["metrics"]["technical"]["technical.above_200d"] is True
+    assert body["status"]["price"]["status"] == "ok"
+
+
+def test_eval_endpoint_partial_results():
+    response = client.get("/eval/PART")
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["metrics"] == {"price": {"price.current": 100.0}}
+    assert body["status"]["fundamentals"]["status"] == "timeout"
 
 
 def test_eval_endpoint_invalid_format_returns_422():
@@ -67,8 +107,90 @@ def test_eval_endpoint_not_found_returns_404():
     assert response.json()["detail"]["error"] == "TICKER_NOT_FOUND"
 
 
-@pytest.mark.parametrize("symbol", ["BROKE", "PERR", "FERR"])
+@pytest.mark.parametrize("symbol", ["BROKE", "PERR", "FERR", "TERR"])
 def test_eval_endpoint_upstream_errors_return_502(symbol: str):
     response = client.get(f"/eval/{symbol}")
     assert response.status_code == 502
     assert response.json()["detail"]["error"] == "YAHOO_CLIENT_ERROR"
+
+
+def test_eval_endpoint_all_metrics_timed_out_returns_504():
+    response = client.get("/eval/SLOW")
+    assert response.status_code == 504
+    assert response.json()["detail"]["error"] == "EVALUATION_TIMEOUT"
+
+
+def test_eval_batch_endpoint_returns_results_and_errors(monkeypatch):
+    async def no_prefetch(symbols, store):
+        pass
+
+    async def no_technical(symbols, services):
+        return {}
+
+    monkeypatch.setattr(batch_module, "evaluate_all", eval_route.evaluate_all)
+    monkeypatch.setattr(batch_module, "_prefetch_history", no_prefetch)
+    monkeypatch.setattr(batch_module, "_compute_technical", no_technical)
+
+    response = client.post("/eval/batch", json={"symbols": ["AAPL", "MISS", "bad symbol!"]})
+    assert response.status_code == 200
+
+    body = response.json()
+    assert list(body["results"]) == ["AAPL"]
+    assert body["results"]["AAPL"]["metrics"]["price"]["price.current"] == 100.0
+    assert body["errors"]["MISS"]["error"] == "TICKER_NOT_FOUND"
+    assert body["errors"]["bad symbol!"]["error"] == "INVALID_TICKER_FORMAT"
+
+
+def test_eval_batch_endpoint_rejects_empty_request():
+    response = client.post("/eval/batch", json={"symbols": []})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "sse"])
+def test_eval_batch_stream_emits_one_item_per_symbol(monkeypatch, fmt: str):
+    async def no_prefetch(symbols, store):
+        pass
+
+    async def no_technical(symbols, services):
+        return {}
+
+    monkeypatch.setattr(batch_module, "evaluate_all", eval_route.evaluate_all)
+    monkeypatch.setattr(batch_module, "_prefetch_history", no_prefetch)
+    monkeypatch.setattr(batch_module, "_compute_technical", no_technical)
+
+    response = client.post(f"/eval/batch/stream?format={fmt}", json={"symbols": ["AAPL", "MISS"]})
+    assert response.status_code == 200
+
+    if fmt == "ndjson":
+        assert response.headers["content-type"] == "application/x-ndjson"
+        items = [json.loads(line) for line in response.text.splitlines()]
+    else:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+        assert events[-1] == ["event: done", 'data: {"count": 2}']
+        items = [json.loads(data[len("data: "):]) for _, data in events[:-1]]
+
+    by_symbol = {item["symbol"]: item for item in items}
+    assert by_symbol["AAPL"]["result"]["ticker"] == "AAPL"
+    assert by_symbol["MISS"]["error"]["error"] == "TICKER_NOT_FOUND"
+
+
+def test_eval_endpoint_passes_metric_selection(monkeypatch):
+    seen = []
+
+    async def fake_evaluate_all(symbol: str, services, selection=None, precomputed=None):
+        seen.append(selection)
+        return EvalResponse(ticker=symbol, metrics={})
+
+    monkeypatch.setattr(eval_route, "evaluate_all", fake_evaluate_all)
+
+    response = client.get("/eval/AAPL?metrics=price,technical.rsi_14d")
+    assert response.status_code == 200
+    assert seen[0].groups == ("price",)
+    assert seen[0].keys == ("technical.rsi_14d",)
+
+
+def test_eval_endpoint_invalid_metric_selection_returns_422():
+    response = client.get("/eval/AAPL?metrics=price.nope")
+    assert response.status_code == 422
+    assert response.json()["detail"]["error"] == "INVALID_METRIC_SELECTION"
@@ -0,0 +1,62 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.providers.caching import CachingYahooClient
+from app.api.dependencies import get_services
+from app.core.services import Services
+from app.providers.stack import build_yahoo_client, find_layer, provider_stats
+from app.providers.yahoo_client import YFinanceYahooClient
+
+
+client = TestClient(app)
+
+
+def test_provider_stats_walks_every_layer():
+    stats = provider_stats(build_yahoo_client())
+
+    assert set(stats) == {
+        "CachingYahooClient",
+        "SingleFlightYahooClient",
+        "RateLimitedYahooClient",
+        "CircuitBreakerYahooClient",
+        "YFinanceYahooClient",
+    }
+    assert stats["YFinanceYahooClient"]["waiting"] == 0
+    assert "avg_wait_ms" in stats["YFinanceYahooClient"]
+
+
+def test_provider_health_endpoint_reports_stack(monkeypatch):
+    services = Services.build()
+    assert isinstance(services.yahoo_client, CachingYahooClient)
+    services.yahoo_client.hits = 3
+    app.dependency_overrides[get_services] = lambda: services
+    try:
+        response = client.get("/health/provider")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["CachingYahooClient"]["hits"] == 3
+    assert body["YFinanceYahooClient"]["in_flight"] == 0
+    assert body["MetricResultCache"]["size"] == 0
+
+
+def test_lifespan_shares_services_and_releases_backend(monkeypatch):
+    closed = []
+
+    async def fake_aclose(self):
+        closed.append(self)
+
+    monkeypatch.setattr(Services, "aclose", fake_aclose)
+
+    with TestClient(app) as lifespan_client:
+        assert lifespan_client.get("/health/provider").status_code == 200
+        services = app.state.services
+        assert lifespan_client.get("/health/provider").status_code == 200
+        assert app.state.services is services
+
+    assert closed == [services]
+    assert [metric.service for metric in services.metrics] == [services.price, services.fundamentals, services.technical]
+    assert services.price.history_store is services.technical.history_store
+    assert find_layer(services.yahoo_client, YFinanceYahooClient) is not None
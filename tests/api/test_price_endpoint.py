@@ -4,8 +4,9 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.api.routes.price import get_price_service
 from app.schemas.price import PriceResponse
-from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
+from app.providers.yahoo_client import YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
 from app.utils.ticker import InvalidTickerError
+from app.providers.executor import ProviderBusyError
 
 
 #
@@ -30,6 +31,12 @@ class FakePriceService:
         if symbol == "BROKE":
             raise YahooClientError("upstream")
 
+        if symbol == "BUSY":
+            raise ProviderBusyError("queue full")
+
+        if symbol == "SLOW":
+            raise YahooRateLimitError("too many requests")
+
         raise Exception("unexpected test symbol")
 
 
@@ -79,3 +86,21 @@ def test_price_endpoint_upstream_error_returns_502():
 
     body = response.json()
     assert body["detail"]["error"] == "YAHOO_CLIENT_ERROR"
+
+
+
+def test_price_endpoint_provider_busy_returns_503():
+    response = client.get("/price/BUSY")
+    assert response.status_code == 503
+
+    body = response.json()
+    assert body["detail"]["error"] == "PROVIDER_BUSY"
+
+
+
+def test_price_endpoint_rate_limited_returns_503():
+    response = client.get("/price/SLOW")
+    assert response.status_code == 503
+
+    body = response.json()
+    assert body["detail"]["error"] == "UPSTREAM_RATE_LIMITED"
@@ -1,15 +1,19 @@
+import sys
+
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.api.routes.technical import get_technical_service
+from app.core.indicators import IndicatorHistory
 from app.schemas.technical import TechnicalResponse
 from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
 from app.utils.ticker import InvalidTickerError
 
 
 class FakeTechnicalService:
-    async def get_technical_for_symbol(self, symbol: str) -> TechnicalResponse:
+    async def get_technical_for_symbol(self, symbol: str, windows=None) -> TechnicalResponse:
         if symbol == "AAPL":
             return TechnicalResponse(
                 symbol="AAPL",
@@ -18,6 +22,7 @@ class FakeTechnicalService:
                 above_200d=True,
                 rsi_14d=55.0,
                 volatility_30=2.1,
+                sma={str(w): float(w) for w in windows.sma} if windows else {},
             )
         if symbol == "BAD":
             raise InvalidTickerError("bad ticker")
@@ -27,6 +32,17 @@ class FakeTechnicalService:
             raise YahooClientError("upstream")
         raise Exception("unexpected test symbol")
 
+    async def get_indicator_history(self, symbol: str, days: int, windows=None) -> IndicatorHistory:
+        if symbol == "AAPL":
+            return IndicatorHistory(
+                symbol="AAPL",
+                timestamps=np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[ns]"),
+                columns={"close": np.array([10.0, 11.0]), "sma_50d": np.array([np.nan, 10.5])},
+            )
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        raise Exception("unexpected test symbol")
+
 
 @pytest.fixture(autouse=True)
 def override_technical_service():
@@ -70,3 +86,58 @@ def test_technical_endpoint_upstream_error_returns_502():
 
     body = response.json()
     assert body["detail"]["error"] == "YAHOO_CLIENT_ERROR"
+
+
+def test_technical_endpoint_passes_extra_windows():
+    response = client.get("/technical/AAPL?sma=20,100&rsi=7")
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["sma"] == {"20": 20.0, "100": 100.0}
+
+
+@pytest.mark.parametrize("query", ["sma=0", "sma=abc", "rsi=500", "volatility=1,2,3,4,5,6,7,8,9,10,11"])
+def test_technical_endpoint_invalid_windows_return_422(query):
+    response = client.get(f"/technical/AAPL?{query}")
+    assert response.status_code == 422
+
+    body = response.json()
+    assert body["detail"]["error"] == "INVALID_INDICATOR_WINDOW"
+
+
+def test_technical_history_streams_columnar_json():
+    response = client.get("/technical/AAPL/history?days=2")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    body = response.json()
+    assert body["symbol"] == "AAPL"
+    assert body["columns"] == {
+        "timestamp": ["2024-01-02", "2024-01-03"],
+        "close": [10.0, 11.0],
+        "sma_50d": [None, 10.5],
+    }
+
+
+def test_technical_history_not_found_returns_404():
+    response = client.get("/technical/MISS/history")
+    assert response.status_code == 404
+
+    body = response.json()
+    assert body["detail"]["error"] == "TICKER_NOT_FOUND"
+
+
+def test_technical_history_rejects_out_of_range_days():
+    response = client.get("/technical/AAPL/history?days=0")
+    assert response.status_code == 422
+
+
+def test_technical_history_arrow_without_pyarrow_returns_406(monkeypatch):
+    # A None entry in sys.modules makes ``import pyarrow`` raise ImportError
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    response = client.get("/technical/AAPL/history?format=arrow")
+    assert response.status_code == 406
+
+    body = response.json()
+    assert body["detail"]["error"] == "ARROW_UNAVAILABLE"
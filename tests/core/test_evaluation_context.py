@@ -0,0 +1,139 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.evaluation_context import EvaluationContext
+from app.core.fundamentals_service import FundamentalsService
+from app.core.price_service import PriceService
+from app.core.technical_service import TechnicalService
+from app.core.ticker_validation import TickerValidationService
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooSymbolNotFoundError
+
+
+class CountingYahooClient:
+    """Fake Yahoo client recording every upstream call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_quote(self, symbol: str):
+        self.calls.append(("quote", symbol))
+        return {"symbol": symbol, "regularMarketPrice": 1.0}
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append(("history", symbol, days))
+        await asyncio.sleep(0)
+        closes = 100.0 + np.arange(days)
+        return PriceSeries(np.arange(days).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(days))
+
+    async def fetch_fundamentals(self, symbol: str):
+        self.calls.append(("fundamentals", symbol))
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        return {"info": {"marketCap": 10.0}, "income_statement": {}, "cashflow": {}}
+
+
+@pytest.mark.asyncio
+async def test_context_memoizes_concurrent_calls():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client)
+
+    first, second = await asyncio.gather(
+        context.fetch_fundamentals("AAPL"),
+        context.fetch_fundamentals("AAPL"),
+    )
+
+    assert first is second
+    assert client.calls == [("fundamentals", "AAPL")]
+
+
+@pytest.mark.asyncio
+async def test_context_slices_narrower_history_from_widest_window():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client, window_days=30)
+
+    wide = await context.fetch_daily_history("AAPL", 30)
+    narrow = await context.fetch_daily_history("AAPL", 7)
+
+    assert np.array_equal(narrow.close, wide.close[-7:])
+    assert client.calls == [("history", "AAPL", 30)]
+
+
+@pytest.mark.asyncio
+async def test_context_history_does_not_depend_on_request_order():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client, window_days=200)
+
+    narrow = await context.fetch_daily_history("AAPL", 7)
+    wide = await context.fetch_daily_history("AAPL", 200)
+
+    assert np.array_equal(narrow.close, wide.close[-7:])
+    assert client.calls == [("history", "AAPL", 200)]
+
+
+@pytest.mark.asyncio
+async def test_bound_services_share_history_reads():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=200, ttl_seconds=0)
+    context = EvaluationContext(yahoo_client=client)
+
+    price = context.bind(PriceService(yahoo_client=client, history_store=store))
+    technical = context.bind(TechnicalService(yahoo_client=client, history_store=store))
+    await asyncio.gather(price.get_price_for_symbol("AAPL"), technical.get_technical_for_symbol("AAPL"))
+
+    # With no TTL the store would download twice; the context reads it once
+    assert client.calls == [("history", "AAPL", 200)]
+    assert price.history_store.history_store is store
+
+
+@pytest.mark.asyncio
+async def test_context_serves_quote_from_fundamentals_info():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client)
+
+    await context.fetch_fundamentals("AAPL")
+    quote = await context.fetch_quote("AAPL")
+
+    assert quote == {"marketCap": 10.0, "symbol": "AAPL"}
+    assert client.calls == [("fundamentals", "AAPL")]
+
+
+@pytest.mark.asyncio
+async def test_context_shares_errors_with_every_caller():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client)
+
+    results = await asyncio.gather(
+        context.fetch_fundamentals("MISS"),
+        context.fetch_fundamentals("MISS"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, YahooSymbolNotFoundError) for r in results)
+    assert client.calls == [("fundamentals", "MISS")]
+
+
+@pytest.mark.asyncio
+async def test_bound_services_share_the_context():
+    client = CountingYahooClient()
+    context = EvaluationContext(yahoo_client=client)
+    fundamentals = context.bind(FundamentalsService(yahoo_client=CountingYahooClient()))
+    validation = context.bind(TickerValidationService(yahoo_client=CountingYahooClient()))
+
+    await asyncio.gather(
+        fundamentals.get_fundamentals_for_symbol("AAPL"),
+        fundamentals.get_fundamentals_for_symbol("AAPL"),
+    )
+    await validation.validate_ticker("AAPL")
+
+    assert client.calls == [("fundamentals", "AAPL")]
+
+
+def test_bind_leaves_services_without_a_client_untouched():
+    context = EvaluationContext(yahoo_client=CountingYahooClient())
+    service = object()
+
+    assert context.bind(service) is service
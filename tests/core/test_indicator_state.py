@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from app.core.indicator_state import IndicatorState, IndicatorStateStore, RollingVariance
+from app.core.indicators import compute_indicators
+from app.providers.price_series import PriceSeries
+
+
+def _series(closes, start=0):
+    closes = np.asarray(closes, dtype=float)
+    n = len(closes)
+    days = np.arange(start, start + n).astype("datetime64[D]")
+    return PriceSeries(days, closes, closes, closes, closes, np.zeros(n))
+
+
+def _assert_matches(values, series):
+    expected = compute_indicators(series)
+    assert values["above_200d"] == expected["above_200d"]
+    for key in ("sma_50d", "sma_200d", "rsi_14d", "volatility_30"):
+        if expected[key] is None:
+            assert values[key] is None, key
+        else:
+            assert values[key] == pytest.approx(expected[key], rel=1e-9), key
+
+
+def _walk(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    return 100.0 + np.cumsum(rng.normal(0, 1, n))
+
+
+def test_rolling_variance_matches_numpy():
+    values = _walk(100)
+    rolling = RollingVariance(30)
+    for x in values:
+        rolling.push(float(x))
+
+    assert rolling.std() == pytest.approx(np.std(values[-30:], ddof=1))
+
+
+def test_new_bars_are_folded_in_one_at_a_time():
+    closes = _walk()
+    store = IndicatorStateStore()
+
+    for end in range(200, len(closes) + 1):
+        # The history store hands out the latest 200-bar window each time
+        window = _series(closes[end - 200:end], start=end - 200)
+        values = store.update("AAPL", window)
+        _assert_matches(values, window)
+
+    assert store.stats() == {"folded": len(closes) - 200, "rebuilds": 1, "prefix_builds": 0, "size": 1}
+
+
+def test_moving_last_bar_is_replaced_in_place():
+    closes = _walk(250)
+    state = IndicatorState()
+    state.update(_series(closes))
+
+    moved = closes.copy()
+    moved[-1] += 5.0
+    work = state.update(_series(moved))
+
+    assert work == 1
+    assert state.rebuilds == 1
+    _assert_matches(state.values(), _series(moved))
+
+
+def test_revised_history_triggers_rebuild():
+    closes = _walk(250)
+    state = IndicatorState()
+    state.update(_series(closes))
+
+    # A split adjustment rescales every settled bar
+    adjusted = np.append(closes * 0.5, closes[-1] * 0.5 + 1.0)
+    state.update(_series(adjusted))
+
+    assert state.rebuilds == 2
+    _assert_matches(state.values(), _series(adjusted))
+
+
+def test_flat_tail_has_no_rsi_after_losses_leave_the_window():
+    closes = np.concatenate([_walk(220), np.full(40, 90.0)])
+    state = IndicatorState()
+    state.update(_series(closes[:220]))
+    for end in range(221, len(closes) + 1):
+        state.update(_series(closes[:end]))
+
+    assert state.values()["rsi_14d"] is None
+    assert state.values()["volatility_30"] == pytest.approx(0.0, abs=1e-9)
+
+
+def test_prefix_sums_are_rebuilt_when_a_middle_bar_is_revised():
+    closes = _walk(250)
+    store = IndicatorStateStore()
+
+    first = store.prefix_sums("AAPL", _series(closes))
+    assert store.prefix_sums("AAPL", _series(closes.copy())) is first
+
+    # Same length, first/last bars unchanged, one settled close adjusted
+    revised = closes.copy()
+    revised[100] *= 0.5
+    sums = store.prefix_sums("AAPL", _series(revised))
+
+    assert sums is not first
+    assert sums.sma(200) == pytest.approx(revised[-200:].mean())
+    assert store.stats()["prefix_builds"] == 2
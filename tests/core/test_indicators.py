@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.indicators import (
+    IndicatorWindowError,
+    IndicatorWindows,
+    PrefixSums,
+    close_matrix,
+    compute_indicators,
+    compute_indicators_many,
+    indicator_history,
+    rsi,
+    rsi_series,
+    sma,
+    sma_series,
+    volatility,
+    volatility_series,
+    warmup_bars,
+)
+from app.providers.price_series import PriceSeries
+
+
+def _closes(n=260, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100.0 + np.cumsum(rng.normal(0, 1, n))
+
+
+def _pandas_rsi(closes, window):
+    delta = pd.Series(closes).diff()
+    gain = delta.where(delta > 0, 0.0).rolling(window).mean()
+    loss = (-delta.where(delta < 0, 0.0)).rolling(window).mean()
+    return (100 - 100 / (1 + gain / loss)).to_numpy()
+
+
+def test_series_match_pandas_rolling():
+    closes = _closes()
+    frame = pd.Series(closes)
+
+    np.testing.assert_allclose(sma_series(closes, 50), frame.rolling(50).mean(), equal_nan=True)
+    # pandas treats the first (missing) change as 0, so compare once 14 real changes exist
+    np.testing.assert_allclose(rsi_series(closes, 14)[14:], _pandas_rsi(closes, 14)[14:])
+    np.testing.assert_allclose(volatility_series(closes, 30), frame.diff().rolling(30).std(), equal_nan=True)
+
+
+def test_latest_values_match_series():
+    closes = _closes()
+
+    assert sma(closes, 200) == pytest.approx(sma_series(closes, 200)[-1])
+    assert rsi(closes, 14) == pytest.approx(rsi_series(closes, 14)[-1])
+    assert volatility(closes, 30) == pytest.approx(volatility_series(closes, 30)[-1])
+
+
+def test_short_or_flat_input_gives_none():
+    assert sma(np.array([1.0, 2.0]), 5) is None
+    assert rsi(np.array([1.0] * 10), 14) is None
+    # No losses in the window: RSI is undefined
+    assert rsi(np.arange(20.0), 14) is None
+    assert volatility(np.array([1.0, 2.0]), 30) is None
+    assert np.isnan(sma_series(np.array([1.0, 2.0]), 5)).all()
+
+
+def test_compute_indicators_on_price_series():
+    closes = np.array([100.0 + (i % 2) * 2 for i in range(200)])
+    series = PriceSeries(np.arange(200).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(200))
+
+    result = compute_indicators(series)
+
+    assert result["sma_50d"] == 101.0
+    assert result["sma_200d"] == 101.0
+    assert result["above_200d"] is True
+    assert result["rsi_14d"] == 50.0
+    assert result["volatility_30"] == pytest.approx(np.sqrt(30 * 4 / 29))
+
+
+def test_prefix_sums_match_window_indicators():
+    closes = _closes()
+    sums = PrefixSums(closes)
+
+    for window in (2, 7, 20, 100, 200):
+        assert sums.sma(window) == pytest.approx(sma(closes, window))
+        assert sums.rsi(window) == pytest.approx(rsi(closes, window))
+        assert sums.volatility(window) == pytest.approx(volatility(closes, window))
+    assert sums.sma(len(closes) + 1) is None
+    assert sums.volatility(len(closes)) is None
+
+
+def test_indicator_windows_parse_and_compute():
+    windows = IndicatorWindows.parse(sma="100, 20,20", rsi="7", max_window=200)
+
+    assert windows.sma == (100, 20)
+    assert windows.key == "sma=20,100;rsi=7"
+    assert not IndicatorWindows.parse()
+
+    values = windows.compute(PrefixSums(_closes()))
+    assert list(values["sma"]) == ["100", "20"]
+    assert values["volatility"] == {}
+
+    with pytest.raises(IndicatorWindowError):
+        IndicatorWindows.parse(sma="201", max_window=200)
+
+
+def test_indicator_history_keeps_last_rows_with_warmup():
+    closes = _closes(300)
+    series = PriceSeries(np.arange(300).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(300))
+    windows = IndicatorWindows(sma=(20,), rsi=(7,))
+
+    history = indicator_history("AAPL", series, rows=100, windows=windows)
+
+    assert warmup_bars() == 199
+    assert warmup_bars(IndicatorWindows(volatility=(250,))) == 250
+    assert len(history.timestamps) == 100
+    assert history.timestamps[-1] == series.timestamps[-1]
+    assert list(history.columns) == ["close", "sma_50d", "sma_200d", "rsi_14d", "volatility_30", "sma_20", "rsi_7"]
+    np.testing.assert_allclose(history.columns["sma_200d"], sma_series(closes, 200)[-100:])
+    assert not np.isnan(history.columns["sma_200d"]).any()
+
+
+def test_matrix_indicators_match_per_symbol_computation():
+    universe = []
+    for i, n in enumerate([260, 200, 120, 31, 14, 1, 0]):
+        closes = _closes(n, seed=i) if n else np.array([])
+        universe.append(PriceSeries(np.arange(n).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(n)))
+
+    matrix = close_matrix(universe)
+    assert matrix.shape == (7, 200)
+    assert np.isnan(matrix[2, :80]).all() and not np.isnan(matrix[2, 80:]).any()
+
+    for batch, bars in zip(compute_indicators_many(universe), universe):
+        expected = compute_indicators(bars)
+        assert batch.keys() == expected.keys()
+        for name, value in expected.items():
+            assert batch[name] == (pytest.approx(value) if isinstance(value, float) else value)
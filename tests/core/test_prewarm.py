@@ -0,0 +1,60 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+import app.core.prewarm as prewarm_module
+from app.core.config import Settings
+from app.core.services import Services
+from app.providers.yahoo_http import HttpYahooClient
+from app.schemas.eval import BatchEvalError, BatchEvalResponse
+
+
+def _services(handler):
+    services = Services.build()
+    services.yahoo_client = HttpYahooClient(transport=httpx.MockTransport(handler))
+    return services
+
+
+@pytest.mark.asyncio
+async def test_prewarm_runs_every_phase_and_reports_timings(monkeypatch, caplog):
+    requests, imported, evaluated = [], [], []
+
+    async def fake_evaluate_batch(symbols, services):
+        evaluated.append(list(symbols))
+        return BatchEvalResponse(errors={"MISS": BatchEvalError(error="TICKER_NOT_FOUND", message="missing")})
+
+    monkeypatch.setattr(prewarm_module, "_import_modules", imported.extend)
+    monkeypatch.setattr(prewarm_module, "evaluate_batch", fake_evaluate_batch)
+    services = _services(lambda request: requests.append(request.url.path) or httpx.Response(404))
+    config = Settings(yahoo_client_backend="yfinance", prewarm_symbols=["AAPL", "MISS"])
+
+    with caplog.at_level(logging.INFO, logger="app.core.prewarm"):
+        timings = await prewarm_module.prewarm(services, config)
+
+    assert list(timings) == ["imports", "connections", "prefetch"]
+    assert imported == ["pandas", "yfinance"]
+    assert requests == ["/"]
+    assert evaluated == [["AAPL", "MISS"]]
+    assert "Prewarm phase 'prefetch' took" in caplog.text
+    assert "['MISS']" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_prewarm_skips_failed_and_slow_phases(monkeypatch, caplog):
+    async def hanging_evaluate_batch(symbols, services):
+        await asyncio.sleep(10)
+
+    def unreachable(request):
+        raise httpx.ConnectError("no route")
+
+    monkeypatch.setattr(prewarm_module, "evaluate_batch", hanging_evaluate_batch)
+    config = Settings(yahoo_client_backend="http", prewarm_symbols=["AAPL"], prewarm_timeout_seconds=0.01)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.prewarm"):
+        timings = await prewarm_module.prewarm(_services(unreachable), config)
+
+    assert list(timings) == ["imports", "connections", "prefetch"]
+    assert "Prewarm phase 'connections' failed" in caplog.text
+    assert "Prewarm phase 'prefetch' failed" in caplog.text
@@ -1,11 +1,17 @@
+import numpy as np
 import pytest
-from datetime import datetime, timedelta
 
 from app.core.price_service import PriceService, PriceDataError
+from app.providers.price_series import PriceSeries
 from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
 from app.utils.ticker import InvalidTickerError
 from app.schemas.price import PriceResponse
 
+def _series(closes):
+    n = len(closes)
+    days = np.datetime64("today") - np.arange(n)[::-1]
+    return PriceSeries(days, closes, closes, closes, closes, np.zeros(n))
+
 class FakeYahooClient:
     """
     Fake Yahoo client for testing PriceService.
@@ -15,15 +21,7 @@ class FakeYahooClient:
     async def fetch_daily_history(self, symbol: str, days: int):
         if symbol == "AAPL":
             # Return 7 days of increasing prices
-            base = 100.0
-            now = datetime.utcnow()
-            history = []
-            for i in range(7):
-                history.append({
-                    "date": now - timedelta(days=7 - i),
-                    "close": base + i,
-                })
-            return history
+            return _series([100.0 + i for i in range(7)])
 
         if symbol == "MISS":
             raise YahooSymbolNotFoundError("missing")
@@ -33,12 +31,7 @@ class FakeYahooClient:
 
         if symbol == "SHORT":
             # Not enough data (< 2 points)
-            return [
-                {
-                    "date": datetime.utcnow(),
-                    "close": 150.0
-                }
-            ]
+            return _series([150.0])
 
         # Default: behave like AAPL
         return await self.fetch_daily_history("AAPL", days)
@@ -0,0 +1,42 @@
+import pytest
+
+from types import SimpleNamespace
+
+from app.api.dependencies import get_price_service, get_services, get_technical_service
+from app.core.services import Services
+from app.providers.executor import ProviderExecutor
+from app.providers.yahoo_client import YFinanceYahooClient
+
+
+def test_build_wires_services_and_metrics_onto_one_stack():
+    services = Services.build()
+
+    assert services.price.history_store is services.technical.history_store
+    assert services.technical.indicators is services.indicators
+    assert services.price.fallback is services.stale_fallback
+    assert [metric.service for metric in services.metrics] == [services.price, services.fundamentals, services.technical]
+    assert Services.build().history_store is not services.history_store
+
+
+def test_service_dependencies_read_the_app_state():
+    services = Services.build()
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(services=services)))
+
+    assert get_services(request) is services
+    assert get_price_service(get_services(request)) is services.price
+    assert get_technical_service(get_services(request)) is services.technical
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_executor_threads_and_stays_usable():
+    executor = ProviderExecutor(max_workers=1)
+    client = YFinanceYahooClient(executor=executor)
+    services = Services.build()
+    services.yahoo_client = client
+
+    assert await executor.run(lambda: 1) == 1
+    await services.aclose()
+    assert executor._pool is None
+
+    assert await executor.run(lambda: 2) == 2
+    executor.shutdown()
@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.core.services import Services
+from app.core.snapshot import load_snapshot, save_snapshot
+from app.metrics.cache import MetricResultCache, TtlFreshness
+from app.providers.caching import CachingYahooClient
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient
+
+
+class FakeYahooClient(YahooClient):
+    async def fetch_quote(self, symbol: str):
+        return {"symbol": symbol, "regularMarketPrice": np.float64(101.5)}
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        closes = 100.0 + np.arange(days)
+        return PriceSeries(np.arange(days).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(days))
+
+    async def fetch_fundamentals(self, symbol: str):
+        period = datetime(2023, 12, 31, tzinfo=timezone.utc)
+        return {"symbol": symbol, "info": {"trailingPE": 20.0}, "income_statement": {"Net Income": {period: 5.0}}}
+
+
+def _services(ttls=None):
+    services = Services.build()
+    services.yahoo_client = CachingYahooClient(yahoo_client=FakeYahooClient(), ttls=ttls or {
+        "fetch_quote": 60.0,
+        "fetch_fundamentals": 3600.0,
+    })
+    services.history_store = HistoryStore(yahoo_client=services.yahoo_client, window_days=10, ttl_seconds=60)
+    return services
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip_restores_values_and_expiry(tmp_path):
+    path = str(tmp_path / "caches.msgpack")
+    services = _services()
+    metrics = MetricResultCache()
+    await services.yahoo_client.fetch_quote("AAPL")
+    await services.yahoo_client.fetch_fundamentals("AAPL")
+    await services.history_store.get_history("AAPL", 5)
+    metrics.put("price", "AAPL", {"price.current": 101.5}, TtlFreshness(30))
+
+    assert save_snapshot(path, services, metrics) == {"provider": 2, "history": 1, "metrics": 1}
+
+    restored = _services()
+    restored_metrics = MetricResultCache()
+    assert load_snapshot(path, restored, restored_metrics) == {"provider": 2, "history": 1, "metrics": 1}
+
+    client = restored.yahoo_client
+    assert (await client.fetch_quote("AAPL"))["regularMarketPrice"] == 101.5
+    fundamentals = await client.fetch_fundamentals("AAPL")
+    assert fundamentals["income_statement"]["Net Income"] == {datetime(2023, 12, 31, tzinfo=timezone.utc): 5.0}
+    assert client.stats()["hits"] == 2 and client.stats()["misses"] == 0
+
+    original = services.history_store._entries["AAPL"][2]
+    bars = restored.history_store._entries["AAPL"][2]
+    assert np.array_equal(bars.timestamps, original.timestamps)
+    assert bars.close.tolist() == original.close.tolist()
+
+    expires_at = restored_metrics._entries[("price", "AAPL")][0]
+    assert expires_at == metrics._entries[("price", "AAPL")][0]
+    assert restored_metrics.get("price", "AAPL") == {"price.current": 101.5}
+
+    quote_expiry = client._entries[("fetch_quote", "AAPL")][0] - time.monotonic()
+    assert 55 < quote_expiry <= 60
+
+
+def test_snapshot_skips_expired_entries(tmp_path):
+    path = str(tmp_path / "caches.msgpack")
+    clock_now = [1_000.0]
+    metrics = MetricResultCache(clock=lambda: clock_now[0])
+    metrics.put("price", "AAPL", {"price.current": 1.0}, TtlFreshness(10))
+    save_snapshot(path, _services(), metrics)
+
+    clock_now[0] += 20
+    restored = MetricResultCache(clock=lambda: clock_now[0])
+    assert load_snapshot(path, _services(), restored)["metrics"] == 0
+
+
+def test_missing_or_corrupt_snapshot_restores_nothing(tmp_path):
+    path = tmp_path / "caches.msgpack"
+    empty = {"provider": 0, "history": 0, "metrics": 0}
+
+    assert load_snapshot(str(path), _services(), MetricResultCache()) == empty
+    path.write_bytes(b"not msgpack at all")
+    assert load_snapshot(str(path), _services(), MetricResultCache()) == empty
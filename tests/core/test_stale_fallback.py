@@ -0,0 +1,140 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.core.price_service import PriceService
+from app.core.stale import StaleFallback
+from app.providers.price_series import PriceSeries
+from app.providers.circuit_breaker import CircuitBreaker, CircuitBreakerYahooClient, CircuitOpenError, HALF_OPEN
+from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SwitchableYahooClient:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.base = 100.0
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls += 1
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        if self.fail:
+            raise YahooClientError("upstream down")
+        closes = [self.base + i for i in range(7)]
+        return PriceSeries(np.arange(7).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(7))
+
+
+def _service(breaker=None):
+    inner = SwitchableYahooClient()
+    client = inner if breaker is None else CircuitBreakerYahooClient(yahoo_client=inner, breaker=breaker)
+    fallback = StaleFallback(breaker=breaker)
+    service = PriceService(yahoo_client=client, fallback=fallback)
+    # Always go to the provider so the tests control every upstream call
+    service.history_store.ttl_seconds = 0
+    return service, inner, fallback
+
+
+@pytest.mark.asyncio
+async def test_failed_call_serves_last_good_response_marked_stale():
+    service, inner, fallback = _service()
+
+    fresh = await service.get_price_for_symbol("AAPL")
+    assert fresh.stale is False
+
+    inner.fail = True
+    stale = await service.get_price_for_symbol("AAPL")
+
+    assert stale.stale is True
+    assert stale.current == fresh.current
+    assert fallback.stats()["served_stale"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_without_last_good_value_propagates():
+    service, inner, _ = _service()
+    inner.fail = True
+
+    with pytest.raises(YahooClientError):
+        await service.get_price_for_symbol("AAPL")
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_never_served_stale():
+    service, _, _ = _service()
+
+    with pytest.raises(YahooSymbolNotFoundError):
+        await service.get_price_for_symbol("MISS")
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_serves_stale_without_calling_provider():
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, open_seconds=30.0, clock=clock)
+    service, inner, _ = _service(breaker)
+
+    await service.get_price_for_symbol("AAPL")
+    inner.fail = True
+    await service.get_price_for_symbol("AAPL")
+    calls = inner.calls
+
+    stale = await service.get_price_for_symbol("AAPL")
+    assert stale.stale is True
+    assert inner.calls == calls
+
+    with pytest.raises(CircuitOpenError):
+        await service.get_price_for_symbol("MSFT")
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_refreshes_in_background():
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, open_seconds=30.0, clock=clock)
+    service, inner, fallback = _service(breaker)
+
+    await service.get_price_for_symbol("AAPL")
+    inner.fail = True
+    await service.get_price_for_symbol("AAPL")
+
+    clock.now += 31.0
+    assert breaker.state == HALF_OPEN
+    inner.fail = False
+    inner.base = 200.0
+
+    stale = await service.get_price_for_symbol("AAPL")
+    assert stale.stale is True
+    assert stale.current == 106.0
+
+    await asyncio.gather(*fallback._refreshing.values())
+    fresh = await service.get_price_for_symbol("AAPL")
+    assert fresh.stale is False
+    assert fresh.current == 206.0
+    assert fallback.stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_values_older_than_max_age_are_not_served():
+    service, inner, fallback = _service()
+    clock = FakeClock()
+    fallback.clock = clock
+    fallback.max_age = 60.0
+
+    await service.get_price_for_symbol("AAPL")
+    inner.fail = True
+
+    clock.now = 30.0
+    assert (await service.get_price_for_symbol("AAPL")).stale is True
+
+    clock.now = 61.0
+    with pytest.raises(YahooClientError):
+        await service.get_price_for_symbol("AAPL")
+    assert fallback.stats()["size"] == 0
@@ -1,34 +1,40 @@
+import numpy as np
 import pytest
+from math import sqrt
 
-from app.core.technical_service import TechnicalService
-from app.providers.yahoo_client import YahooSymbolNotFoundError, YahooClientError
+from app.core.technical_service import TechnicalService, TechnicalDataError
+from app.core.indicators import IndicatorWindows
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError, YahooClientError
 from app.utils.ticker import InvalidTickerError
 from app.schemas.technical import TechnicalResponse
 
 
-class FakeYahooClient:
-	async def fetch_technical(self, symbol: str):
+def _bars(closes):
+	n = len(closes)
+	return PriceSeries(np.arange(n).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(n))
+
+
+class FakeYahooClient(YahooClient):
+	def __init__(self):
+		self.calls = []
+
+	async def fetch_daily_history(self, symbol: str, days: int):
+		self.calls.append((symbol, days))
 		if symbol == "AAPL":
-			return {
-				"sma_50d": 180.5,
-				"sma_200d": 165.0,
-				"above_200d": True,
-				"rsi_14d": 61.2,
-				"volatility_30": 1.8,
-			}
+			# Alternating 100 / 102 closes: every change is +/- 2
+			return _bars([100.0 + (i % 2) * 2 for i in range(days)])
+		if symbol == "SHORT":
+			return _bars([100.0 + (i % 2) * 2 for i in range(20)])
+		if symbol == "FLAT":
+			return _bars([50.0] * days)
+		if symbol == "EMPTY":
+			return _bars([])
 		if symbol == "MISS":
 			raise YahooSymbolNotFoundError("not found")
 		if symbol == "BROKE":
 			raise YahooClientError("upstream")
-		if symbol == "NANVA":
-			return {
-				"sma_50d": float("nan"),
-				"sma_200d": float("inf"),
-				"above_200d": False,
-				"rsi_14d": None,
-				"volatility_30": "bad",
-			}
-		return {}
+		return _bars([1.0])
 
 
 @pytest.mark.asyncio
@@ -39,11 +45,11 @@ async def test_technical_service_success():
 
 	assert isinstance(res, TechnicalResponse)
 	assert res.symbol == "AAPL"
-	assert res.sma_50d == 180.5
-	assert res.sma_200d == 165.0
+	assert res.sma_50d == 101.0
+	assert res.sma_200d == 101.0
 	assert res.above_200d is True
-	assert res.rsi_14d == 61.2
-	assert res.volatility_30 == 1.8
+	assert res.rsi_14d == 50.0
+	assert res.volatility_30 == pytest.approx(sqrt(30 * 4 / 29))
 
 
 @pytest.mark.asyncio
@@ -71,14 +77,95 @@ async def test_technical_service_upstream_error():
 
 
 @pytest.mark.asyncio
-async def test_technical_service_filters_non_finite_values():
+async def test_technical_service_empty_history():
+	service = TechnicalService(yahoo_client=FakeYahooClient())
+
+	with pytest.raises(TechnicalDataError):
+		await service.get_technical_for_symbol("EMPTY")
+
+
+@pytest.mark.asyncio
+async def test_technical_service_short_history_leaves_long_windows_empty():
 	service = TechnicalService(yahoo_client=FakeYahooClient())
 
-	res = await service.get_technical_for_symbol("NANVA")
+	res = await service.get_technical_for_symbol("SHORT")
 
-	assert res.symbol == "NANVA"
 	assert res.sma_50d is None
 	assert res.sma_200d is None
+	assert res.above_200d is None
+	assert res.rsi_14d == 50.0
+	assert res.volatility_30 is None
+
+
+@pytest.mark.asyncio
+async def test_technical_service_flat_prices():
+	service = TechnicalService(yahoo_client=FakeYahooClient())
+
+	res = await service.get_technical_for_symbol("FLAT")
+
 	assert res.above_200d is False
 	assert res.rsi_14d is None
-	assert res.volatility_30 is None
\ No newline at end of file
+	assert res.volatility_30 == 0.0
+
+
+@pytest.mark.asyncio
+async def test_technical_service_extra_windows_reuse_history_and_prefix_sums():
+	client = FakeYahooClient()
+	service = TechnicalService(yahoo_client=client)
+	windows = IndicatorWindows(sma=(2, 20), rsi=(7,), volatility=(10,))
+
+	first = await service.get_technical_for_symbol("AAPL", windows)
+	second = await service.get_technical_for_symbol("AAPL", IndicatorWindows(sma=(3,)))
+
+	assert first.sma == {"2": 101.0, "20": 101.0}
+	assert first.rsi == {"7": pytest.approx(100 - 100 / (1 + 8 / 6))}
+	assert first.volatility["10"] == pytest.approx(sqrt(10 * 4 / 9))
+	assert second.sma == {"3": pytest.approx(304 / 3)}
+	assert len(client.calls) == 1
+	assert service.indicators.stats()["prefix_builds"] == 1
+
+
+@pytest.mark.asyncio
+async def test_technical_service_indicator_history_fetches_warmup():
+	client = FakeYahooClient()
+	service = TechnicalService(yahoo_client=client)
+
+	history = await service.get_indicator_history("aapl", 10, IndicatorWindows(sma=(2,)))
+
+	assert history.symbol == "AAPL"
+	assert client.calls == [("AAPL", 10 + 199)]
+	assert len(history.timestamps) == 10
+	assert history.columns["sma_2"].tolist() == [101.0] * 10
+	assert history.columns["sma_200d"].tolist() == [101.0] * 10
+
+
+@pytest.mark.asyncio
+async def test_technical_service_indicator_history_empty():
+	service = TechnicalService(yahoo_client=FakeYahooClient())
+
+	with pytest.raises(TechnicalDataError):
+		await service.get_indicator_history("EMPTY", 10)
+
+
+@pytest.mark.asyncio
+async def test_technical_service_batch_computes_all_symbols_together():
+	client = FakeYahooClient()
+	service = TechnicalService(yahoo_client=client)
+
+	results = await service.get_technical_for_symbols(["aapl", "FLAT", "SHORT", "EMPTY", "AAPL"])
+
+	assert list(results) == ["AAPL", "FLAT", "SHORT"]
+	single = await service.get_technical_for_symbol("AAPL")
+	for name in ("sma_50d", "sma_200d", "above_200d", "rsi_14d", "volatility_30"):
+		assert getattr(results["AAPL"], name) == pytest.approx(getattr(single, name))
+	assert results["FLAT"].rsi_14d is None
+	assert results["SHORT"].sma_50d is None
+	assert len(client.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_technical_service_batch_rejects_invalid_symbol():
+	service = TechnicalService(yahoo_client=FakeYahooClient())
+
+	with pytest.raises(InvalidTickerError):
+		await service.get_technical_for_symbols(["AAPL", "bad symbol!"])
@@ -0,0 +1,207 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import app.metrics.batch as batch_module
+from app.core.technical_service import TechnicalDataError, TechnicalService
+from app.metrics import MetricTimeoutError
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooClientError, YahooSymbolNotFoundError
+from app.schemas.eval import EvalResponse
+
+
+class BatchHistoryClient(YahooClient):
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def fetch_daily_history_many(self, symbols, days: int):
+        self.calls.append((tuple(symbols), days))
+        if self.fail:
+            raise YahooClientError("batch down")
+        closes = np.arange(days, dtype=float)
+        return {symbol: PriceSeries(np.arange(days).astype("datetime64[D]"), closes, closes, closes, closes, closes) for symbol in symbols}
+
+
+def _services(store):
+    technical = TechnicalService(yahoo_client=store.yahoo_client, history_store=store)
+    return SimpleNamespace(history_store=store, technical=technical)
+
+
+@pytest.fixture
+def fake_evaluate_all(monkeypatch):
+    state = {"running": 0, "peak": 0, "calls": [], "precomputed": {}}
+
+    async def evaluate_all(symbol: str, services, precomputed=None):
+        state["calls"].append(symbol)
+        state["precomputed"][symbol] = precomputed
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        if symbol == "SLOW":
+            raise MetricTimeoutError("too slow")
+        if symbol == "TERR":
+            raise TechnicalDataError("no price history")
+        if symbol == "BOOM":
+            raise RuntimeError("unexpected")
+        return EvalResponse(ticker=symbol, metrics={"price": {"price.current": 1.0}})
+
+    monkeypatch.setattr(batch_module, "evaluate_all", evaluate_all)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_results_and_errors_per_symbol(fake_evaluate_all):
+    store = HistoryStore(yahoo_client=BatchHistoryClient(), window_days=10)
+
+    response = await batch_module.evaluate_batch(["aapl", "MSFT", "AAPL", "bad symbol!", "MISS", "SLOW", "TERR", "BOOM"], services=_services(store))
+
+    assert list(response.results) == ["AAPL", "MSFT"]
+    assert {symbol: error.error for symbol, error in response.errors.items()} == {
+        "bad symbol!": "INVALID_TICKER_FORMAT",
+        "MISS": "TICKER_NOT_FOUND",
+        "SLOW": "EVALUATION_TIMEOUT",
+        "TERR": "YAHOO_CLIENT_ERROR",
+        "BOOM": "EVALUATION_ERROR",
+    }
+    assert fake_evaluate_all["calls"] == ["AAPL", "MSFT", "MISS", "SLOW", "TERR", "BOOM"]
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrency(fake_evaluate_all):
+    store = HistoryStore(yahoo_client=BatchHistoryClient(), window_days=10)
+
+    response = await batch_module.evaluate_batch([f"T{chr(65 + i)}" for i in range(20)], concurrency=3, services=_services(store))
+
+    assert len(response.results) == 20
+    assert fake_evaluate_all["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_prefetches_history_in_one_call(fake_evaluate_all):
+    client = BatchHistoryClient()
+    store = HistoryStore(yahoo_client=client, window_days=200)
+
+    await batch_module.evaluate_batch(["AAPL", "MSFT", "bad symbol!"], services=_services(store))
+
+    assert client.calls == [(("AAPL", "MSFT"), 200)]
+    assert len(await store.get_history("MSFT", 5)) == 5
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_validates_tickers_once(monkeypatch, fake_evaluate_all):
+    calls = []
+    validate = batch_module._validate
+    monkeypatch.setattr(batch_module, "_validate", lambda tickers: calls.append(tickers) or validate(tickers))
+    store = HistoryStore(yahoo_client=BatchHistoryClient(), window_days=10)
+
+    response = await batch_module.evaluate_batch(["aapl", "bad symbol!"], services=_services(store))
+
+    assert len(calls) == 1
+    assert list(response.results) == ["AAPL"]
+    assert list(response.errors) == ["bad symbol!"]
+
+
+@pytest.mark.asyncio
+async def test_batch_computes_technical_blocks_in_one_pass(monkeypatch, fake_evaluate_all):
+    client = BatchHistoryClient()
+    store = HistoryStore(yahoo_client=client, window_days=200)
+    services = _services(store)
+    passes = []
+    batch = services.technical.get_technical_for_symbols
+
+    async def get_technical_for_symbols(symbols):
+        passes.append(list(symbols))
+        return await batch(symbols)
+
+    monkeypatch.setattr(services.technical, "get_technical_for_symbols", get_technical_for_symbols)
+
+    await batch_module.evaluate_batch(["AAPL", "MSFT"], services=services)
+
+    assert passes == [["AAPL", "MSFT"]]
+    assert client.calls == [(("AAPL", "MSFT"), 200)]
+    technical = fake_evaluate_all["precomputed"]["AAPL"]["technical"]
+    assert technical["technical.sma_200d"] == pytest.approx(99.5)
+    assert technical["technical.above_200d"] is True
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_streams_before_slow_chunks_are_prefetched(monkeypatch, fake_evaluate_all):
+    monkeypatch.setattr(batch_module.settings, "eval_batch_prefetch_chunk", 2)
+    release = asyncio.Event()
+
+    class SlowChunkClient(BatchHistoryClient):
+        async def fetch_daily_history_many(self, symbols, days: int):
+            if "HANG" in symbols:
+                await release.wait()
+            return await super().fetch_daily_history_many(symbols, days)
+
+    client = SlowChunkClient()
+    store = HistoryStore(yahoo_client=client, window_days=200)
+    items = batch_module.iter_batch(["AAPL", "MSFT", "HANG", "IBM"], services=_services(store))
+
+    first = await asyncio.wait_for(items.__anext__(), timeout=1.0)
+    assert first.symbol in ("AAPL", "MSFT")
+    assert not release.is_set()
+    # The second chunk is still downloading
+    assert (("HANG", "IBM"), 200) not in client.calls
+
+    release.set()
+    rest = [item.symbol async for item in items]
+    assert sorted([first.symbol, *rest]) == ["AAPL", "HANG", "IBM", "MSFT"]
+    assert [call[0] for call in client.calls] == [("AAPL", "MSFT"), ("HANG", "IBM")]
+
+
+@pytest.mark.asyncio
+async def test_batch_survives_failed_prefetch(fake_evaluate_all):
+    store = HistoryStore(yahoo_client=BatchHistoryClient(fail=True), window_days=10)
+
+    response = await batch_module.evaluate_batch(["AAPL"], services=_services(store))
+
+    assert list(response.results) == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_yields_in_completion_order(monkeypatch):
+    async def evaluate_all(symbol: str, services, precomputed=None):
+        await asyncio.sleep({"SLOW": 0.05, "FAST": 0.0}.get(symbol, 0.01))
+        return EvalResponse(ticker=symbol, metrics={})
+
+    monkeypatch.setattr(batch_module, "evaluate_all", evaluate_all)
+    store = HistoryStore(yahoo_client=BatchHistoryClient(), window_days=10)
+
+    items = [item async for item in batch_module.iter_batch(["SLOW", "MID", "FAST", "bad symbol!"], services=_services(store))]
+
+    assert [item.symbol for item in items] == ["bad symbol!", "FAST", "MID", "SLOW"]
+    assert items[0].error.error == "INVALID_TICKER_FORMAT"
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_cancels_running_evaluations_when_closed(monkeypatch):
+    cancelled = []
+
+    async def evaluate_all(symbol: str, services, precomputed=None):
+        try:
+            await asyncio.sleep(0 if symbol == "FAST" else 10)
+        except asyncio.CancelledError:
+            cancelled.append(symbol)
+            raise
+        return EvalResponse(ticker=symbol, metrics={})
+
+    monkeypatch.setattr(batch_module, "evaluate_all", evaluate_all)
+    store = HistoryStore(yahoo_client=BatchHistoryClient(), window_days=10)
+
+    items = batch_module.iter_batch(["FAST", "HANG", "IDLE"], concurrency=2, services=_services(store))
+    first = await items.__anext__()
+    await items.aclose()
+    await asyncio.sleep(0)
+
+    assert first.symbol == "FAST"
+    assert cancelled == ["HANG"]
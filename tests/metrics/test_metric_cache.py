@@ -0,0 +1,120 @@
+from datetime import datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import app.metrics as metrics_module
+from app.metrics.cache import MetricResultCache, NextCloseFreshness, TtlFreshness
+
+NY = ZoneInfo("America/New_York")
+
+
+class FakeClock:
+    def __init__(self, now=1_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _ts(*args):
+    return datetime(*args, tzinfo=NY).timestamp()
+
+
+def test_cache_serves_until_expiry_and_counts_per_metric():
+    clock = FakeClock()
+    cache = MetricResultCache(clock=clock)
+
+    assert cache.get("price", "AAPL") is None
+    cache.put("price", "AAPL", {"price.current": 1.0}, TtlFreshness(10))
+    clock.now += 5
+    assert cache.get("price", "AAPL") == {"price.current": 1.0}
+    clock.now += 10
+    assert cache.get("price", "AAPL") is None
+
+    stats = cache.stats()
+    assert stats["metrics"]["price"] == {"hits": 1, "misses": 2, "expirations": 1, "hit_rate": pytest.approx(1 / 3)}
+    assert stats["size"] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = MetricResultCache(max_entries=2, clock=FakeClock())
+    for symbol in ("A", "B", "C"):
+        cache.put("price", symbol, {}, TtlFreshness(10))
+
+    assert cache.get("price", "A") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_next_close_freshness_skips_weekends_and_keeps_wall_clock():
+    policy = NextCloseFreshness(timezone="America/New_York", close_time="16:00")
+
+    # Wednesday morning -> same day close
+    assert policy.expires_at(_ts(2024, 3, 6, 10, 0)) == _ts(2024, 3, 6, 16, 0)
+    # Friday after the close -> Monday close, across the DST change on Sunday
+    assert policy.expires_at(_ts(2024, 3, 8, 17, 0)) == _ts(2024, 3, 11, 16, 0)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_recomputes_only_stale_metric_blocks(monkeypatch):
+    calls = []
+
+    class Quick:
+        name = "quick"
+        freshness = TtlFreshness(5)
+
+        async def compute(self, ticker: str, context=None):
+            calls.append(self.name)
+            return {"quick.value": float(len(calls))}
+
+    class Slow:
+        name = "slow"
+        freshness = TtlFreshness(3600)
+
+        async def compute(self, ticker: str, context=None):
+            calls.append(self.name)
+            return {"slow.value": 1.0}
+
+    clock = FakeClock()
+    cache = MetricResultCache(clock=clock)
+    services = SimpleNamespace(metrics=[Quick(), Slow()], yahoo_client=None, metric_cache=cache)
+
+    await metrics_module.evaluate_all("AAPL", services)
+    cached = await metrics_module.evaluate_all("AAPL", services)
+    clock.now += 10
+    refreshed = await metrics_module.evaluate_all("AAPL", services)
+
+    assert calls == ["quick", "slow", "quick"]
+    assert cached.status["quick"].cached and cached.status["slow"].cached
+    assert refreshed.metrics["quick"] == {"quick.value": 3.0}
+    assert not refreshed.status["quick"].cached
+    assert refreshed.status["slow"].cached
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_does_not_cache_blocks_built_from_stale_data(monkeypatch):
+    calls = []
+    outage = [True]
+
+    class Technical:
+        name = "technical"
+        freshness = TtlFreshness(3600)
+
+        async def compute(self, ticker: str, context=None):
+            calls.append(self.name)
+            if outage[0]:
+                context.mark_stale(self.name)
+            return {"technical.value": 1.0}
+
+    cache = MetricResultCache(clock=FakeClock())
+    services = SimpleNamespace(metrics=[Technical()], yahoo_client=None, metric_cache=cache)
+
+    stale = await metrics_module.evaluate_all("AAPL", services)
+    outage[0] = False
+    fresh = await metrics_module.evaluate_all("AAPL", services)
+    cached = await metrics_module.evaluate_all("AAPL", services)
+
+    assert calls == ["technical", "technical"]
+    assert stale.status["technical"].stale and not fresh.status["technical"].stale
+    assert cached.status["technical"].cached
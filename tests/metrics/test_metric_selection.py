@@ -0,0 +1,49 @@
+import pytest
+
+from app.metrics.price import StockPriceMetric
+from app.metrics.technical import StockTechnicalMetric
+from app.metrics.selection import MetricSelection, MetricSelectionError
+
+
+class FakeService:
+    pass
+
+
+METRICS = [StockPriceMetric(service=FakeService()), StockTechnicalMetric(service=FakeService())]
+
+
+def test_parse_groups_and_keys():
+    selection = MetricSelection.parse(" price , technical.rsi_14d,technical.rsi_14d,,", METRICS)
+
+    assert selection.groups == ("price",)
+    assert selection.keys == ("technical.rsi_14d",)
+    assert selection.includes("price") and selection.includes("technical")
+    assert not selection.includes("fundamentals")
+
+
+def test_group_absorbs_its_keys():
+    selection = MetricSelection.parse("technical.rsi_14d,technical", METRICS)
+
+    assert selection.groups == ("technical",)
+    assert selection.keys == ()
+
+
+def test_empty_selection_includes_everything():
+    selection = MetricSelection.parse(None, METRICS)
+
+    assert not selection
+    assert selection.includes("anything")
+    assert selection.filter("price", {"price.current": 1.0}) == {"price.current": 1.0}
+
+
+def test_filter_keeps_selected_keys():
+    selection = MetricSelection.parse("technical.rsi_14d", METRICS)
+
+    values = {"technical.rsi_14d": 50.0, "technical.sma_50d": 10.0}
+    assert selection.filter("technical", values) == {"technical.rsi_14d": 50.0}
+
+
+@pytest.mark.parametrize("value", ["fundamentals", "price.nope", "technical.", "bogus.current"])
+def test_parse_rejects_unknown_metrics_and_keys(value):
+    with pytest.raises(MetricSelectionError):
+        MetricSelection.parse(value, METRICS)
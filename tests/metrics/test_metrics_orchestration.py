@@ -1,3 +1,6 @@
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
 from app.metrics.price import StockPriceMetric
@@ -7,6 +10,14 @@ from app.schemas.price import PriceResponse
 from app.schemas.fundamentals import FundamentalsResponse
 from app.schemas.technical import TechnicalResponse
 import app.metrics as metrics_module
+from app.core.config import settings
+from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError
+from app.utils.ticker import InvalidTickerError
+
+
+def _services(metrics):
+    """Stand-in for Services carrying just what evaluate_all reads."""
+    return SimpleNamespace(metrics=metrics, yahoo_client=None, metric_cache=None)
 
 
 class FakePriceService:
@@ -73,19 +84,154 @@ async def test_evaluate_all_aggregates_metric_results(monkeypatch):
     class MetricOne:
         name = "one"
 
-        async def compute(self, ticker: str):
+        async def compute(self, ticker: str, context=None):
             return {"k1": 1.0}
 
     class MetricTwo:
         name = "two"
 
-        async def compute(self, ticker: str):
+        async def compute(self, ticker: str, context=None):
             return {"k2": 2.0}
 
-    monkeypatch.setattr(metrics_module, "_METRICS", [MetricOne(), MetricTwo()])
+    services = _services([MetricOne(), MetricTwo()])
 
-    result = await metrics_module.evaluate_all("AAPL")
-    assert result == {
+    result = await metrics_module.evaluate_all("AAPL", services)
+    assert result.ticker == "AAPL"
+    assert result.metrics == {
         "one": {"k1": 1.0},
         "two": {"k2": 2.0},
     }
+    assert {name: s.status for name, s in result.status.items()} == {"one": "ok", "two": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_runs_metrics_concurrently(monkeypatch):
+    started = asyncio.Event()
+
+    class Waiter:
+        name = "waiter"
+
+        async def compute(self, ticker: str, context=None):
+            await started.wait()
+            return {"w": 1.0}
+
+    class Starter:
+        name = "starter"
+
+        async def compute(self, ticker: str, context=None):
+            started.set()
+            return {"s": 1.0}
+
+    services = _services([Waiter(), Starter()])
+
+    result = await asyncio.wait_for(metrics_module.evaluate_all("AAPL", services), timeout=1.0)
+    assert result.metrics == {"waiter": {"w": 1.0}, "starter": {"s": 1.0}}
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_returns_partial_results_on_timeout_and_error(monkeypatch):
+    class Fast:
+        name = "fast"
+
+        async def compute(self, ticker: str, context=None):
+            return {"f": 1.0}
+
+    class Hung:
+        name = "hung"
+
+        async def compute(self, ticker: str, context=None):
+            await asyncio.sleep(10)
+
+    class Broken:
+        name = "broken"
+
+        async def compute(self, ticker: str, context=None):
+            raise YahooClientError("upstream")
+
+    services = _services([Fast(), Hung(), Broken()])
+    monkeypatch.setitem(settings.metric_timeouts, "hung", 0.01)
+
+    result = await metrics_module.evaluate_all("AAPL", services)
+    assert result.metrics == {"fast": {"f": 1.0}}
+    assert result.status["fast"].status == "ok"
+    assert result.status["hung"].status == "timeout"
+    assert result.status["broken"].status == "error"
+    assert result.status["broken"].error == "upstream"
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_raises_when_no_metric_completes(monkeypatch):
+    class Missing:
+        name = "missing"
+
+        async def compute(self, ticker: str, context=None):
+            raise YahooSymbolNotFoundError("missing")
+
+    class Hung:
+        name = "hung"
+
+        async def compute(self, ticker: str, context=None):
+            await asyncio.sleep(10)
+
+    services = _services([Hung(), Missing()])
+    monkeypatch.setitem(settings.metric_timeouts, "hung", 0.01)
+
+    with pytest.raises(YahooSymbolNotFoundError):
+        await metrics_module.evaluate_all("AAPL", services)
+
+    services = _services([Hung()])
+    with pytest.raises(metrics_module.MetricTimeoutError):
+        await metrics_module.evaluate_all("AAPL", services)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_rejects_invalid_ticker():
+    with pytest.raises(InvalidTickerError):
+        await metrics_module.evaluate_all("$$$", _services([]))
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_runs_only_selected_metrics(monkeypatch):
+    computed = []
+
+    class Price:
+        name = "price"
+        keys = ("price.current", "price.change_1d_pct")
+
+        async def compute(self, ticker: str, context=None):
+            computed.append(self.name)
+            return {"price.current": 1.0, "price.change_1d_pct": 2.0}
+
+    class Fundamentals:
+        name = "fundamentals"
+
+        async def compute(self, ticker: str, context=None):
+            computed.append(self.name)
+            return {"fundamentals.pe_ttm": 3.0}
+
+    services = _services([Price(), Fundamentals()])
+
+    selection = metrics_module.parse_metric_selection("price.current")
+    result = await metrics_module.evaluate_all("AAPL", services, selection)
+
+    assert computed == ["price"]
+    assert result.metrics == {"price": {"price.current": 1.0}}
+    assert list(result.status) == ["price"]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_all_marks_metrics_served_stale(monkeypatch):
+    class StalePriceService:
+        async def get_price_for_symbol(self, symbol: str) -> PriceResponse:
+            return PriceResponse(symbol=symbol, current=100.0, change_1d_pct=1.0, change_1w_pct=2.0, stale=True)
+
+    services = _services([
+        StockPriceMetric(service=StalePriceService()),
+        StockTechnicalMetric(service=FakeTechnicalService()),
+    ])
+    monkeypatch.setattr(settings, "metric_cache_enabled", False)
+
+    result = await metrics_module.evaluate_all("AAPL", services)
+
+    assert result.status["price"].stale is True
+    assert result.status["technical"].stale is False
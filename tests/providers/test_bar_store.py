@@ -0,0 +1,222 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.core.config import Settings
+from app.providers.bar_store import MmapBarStore, SQLiteBarStore, build_bar_store
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError
+
+
+def _series(start, closes):
+    n = len(closes)
+    days = np.busday_offset(np.datetime64(start, "D"), np.arange(n), roll="forward")
+    closes = np.asarray(closes, dtype=float)
+    return PriceSeries(days.astype("datetime64[ns]"), closes, closes, closes, closes, np.full(n, np.nan))
+
+
+class CalendarYahooClient(YahooClient):
+    """Serves the tail of a growing business-day calendar of closes."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.calls = []
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append((symbol, days))
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        return self.bars.tail(days)
+
+    async def fetch_daily_history_many(self, symbols, days: int):
+        self.calls.append((tuple(symbols), days))
+        return {symbol: self.bars.tail(days) for symbol in symbols if symbol != "MISS"}
+
+
+@pytest.fixture(params=["sqlite", "mmap"])
+def make_store(request, tmp_path):
+    if request.param == "sqlite":
+        return lambda: SQLiteBarStore(str(tmp_path / "bars.sqlite"))
+    return lambda: MmapBarStore(str(tmp_path / "bars"))
+
+
+def test_store_round_trips_and_appends(make_store):
+    store = make_store()
+    bars = _series("2024-01-01", [1.0, 2.0, 3.0, 4.0])
+
+    assert not len(store.read("AAPL"))
+    assert store.depth("AAPL") == 0
+
+    store.write("AAPL", bars, depth=10)
+    read = store.read("AAPL")
+    assert np.array_equal(read.timestamps, bars.timestamps)
+    assert read.close.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert np.isnan(read.volume).all()
+    assert store.depth("AAPL") == 10
+    assert store.read("AAPL", 2).close.tolist() == [3.0, 4.0]
+
+    # Replaces the last stored bar and adds one
+    store.append("AAPL", _series("2024-01-04", [4.5, 5.0]))
+    assert store.read("AAPL").close.tolist() == [1.0, 2.0, 3.0, 4.5, 5.0]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_downloads_only_new_sessions(make_store):
+    closes = list(np.arange(30.0))
+    client = CalendarYahooClient(_series("2024-01-01", closes))
+    today = [client.bars.timestamps[-1].astype("datetime64[D]")]
+    store = HistoryStore(
+        yahoo_client=client, window_days=20, ttl_seconds=0,
+        bar_store=make_store(), today=lambda: today[0],
+    )
+
+    first = await store.get_history("AAPL", 20)
+    assert client.calls == [("AAPL", 20)]
+    assert first.close.tolist() == closes[-20:]
+
+    # Three new sessions, and the last stored bar settled at a new value
+    closes[-1] = 29.5
+    client.bars = _series("2024-01-01", closes + [30.0, 31.0, 32.0])
+    today[0] = client.bars.timestamps[-1].astype("datetime64[D]")
+
+    second = await store.get_history("AAPL", 20)
+    assert client.calls[-1] == ("AAPL", 5)
+    assert second.close.tolist() == closes[-17:] + [30.0, 31.0, 32.0]
+
+
+@pytest.mark.asyncio
+async def test_revised_history_and_long_lookbacks_download_in_full(tmp_path):
+    client = CalendarYahooClient(_series("2024-01-01", np.arange(60.0)))
+    today = client.bars.timestamps[-1].astype("datetime64[D]")
+    store = HistoryStore(
+        yahoo_client=client, window_days=20, ttl_seconds=0,
+        bar_store=SQLiteBarStore(str(tmp_path / "bars.sqlite")), today=lambda: today,
+    )
+
+    await store.get_history("AAPL", 20)
+    # A split halves every past close
+    client.bars = _series("2024-01-01", np.arange(60.0) / 2)
+    revised = await store.get_history("AAPL", 20)
+    assert client.calls == [("AAPL", 20), ("AAPL", 2), ("AAPL", 20)]
+    assert revised.close[-1] == 59.0 / 2
+
+    # A deeper window than stored is downloaded once, then served incrementally
+    await store.get_history("AAPL", 50)
+    await store.get_history("AAPL", 50)
+    assert client.calls[3:] == [("AAPL", 50), ("AAPL", 2)]
+
+
+@pytest.mark.asyncio
+async def test_short_listed_history_refreshes_incrementally(make_store):
+    # A recent listing has fewer bars than any window asked for
+    client = CalendarYahooClient(_series("2024-01-01", np.arange(10.0)))
+    client.bars.first_trade = client.bars.timestamps[0]
+    today = client.bars.timestamps[-1].astype("datetime64[D]")
+    store = HistoryStore(
+        yahoo_client=client, window_days=20, ttl_seconds=0,
+        bar_store=make_store(), today=lambda: today,
+    )
+
+    await store.get_history("IPO", 20)
+    again = await store.get_history("IPO", 20)
+    deeper = await store.get_history("IPO", 50)
+
+    assert client.calls == [("IPO", 20), ("IPO", 2), ("IPO", 2)]
+    assert again.close.tolist() == deeper.close.tolist() == list(np.arange(10.0))
+
+
+@pytest.mark.asyncio
+async def test_short_download_of_mature_symbol_is_widened_later(make_store):
+    class ShortYahooClient(CalendarYahooClient):
+        # Falls short of the requested sessions, like a calendar-day period
+        async def fetch_daily_history(self, symbol: str, days: int):
+            self.calls.append((symbol, days))
+            return self.bars.tail(days * 3 // 4)
+
+    client = ShortYahooClient(_series("2024-01-01", np.arange(200.0)))
+    client.bars.first_trade = client.bars.timestamps[0]
+    today = client.bars.timestamps[-1].astype("datetime64[D]")
+    store = HistoryStore(
+        yahoo_client=client, window_days=20, ttl_seconds=0,
+        bar_store=make_store(), today=lambda: today,
+    )
+
+    assert len(await store.get_history("AAPL", 20)) == 15
+    wider = await store.get_history("AAPL", 100)
+
+    assert client.calls == [("AAPL", 20), ("AAPL", 100)]
+    assert len(wider) == 75
+
+
+@pytest.mark.asyncio
+async def test_batch_refresh_splits_incremental_and_full_downloads(tmp_path):
+    client = CalendarYahooClient(_series("2024-01-01", np.arange(30.0)))
+    today = client.bars.timestamps[-1].astype("datetime64[D]")
+    store = HistoryStore(
+        yahoo_client=client, window_days=20, ttl_seconds=0,
+        bar_store=SQLiteBarStore(str(tmp_path / "bars.sqlite")), today=lambda: today,
+    )
+
+    await store.get_history("AAPL", 20)
+    bars = await store.get_history_many(["AAPL", "MSFT", "MISS"], 20)
+
+    assert list(bars) == ["AAPL", "MSFT"]
+    assert client.calls[1:] == [(("AAPL",), 2), (("MSFT", "MISS"), 20)]
+    assert bars["MSFT"].close.tolist() == bars["AAPL"].close.tolist()
+
+
+def test_mmap_store_reads_shared_views(tmp_path):
+    writer = MmapBarStore(str(tmp_path))
+    reader = MmapBarStore(str(tmp_path))
+    writer.write("AAPL", _series("2024-01-01", [1.0, 2.0, 3.0]), depth=3)
+
+    first = reader.read("AAPL", 2)
+    again = reader.read("AAPL")
+    assert first.close.tolist() == [2.0, 3.0]
+    assert isinstance(first.close.base, np.memmap)
+    assert not first.close.flags.writeable
+    assert np.shares_memory(first.close, again.close)
+
+    # Another process's write is picked up; earlier reads keep the old file
+    writer.append("AAPL", _series("2024-01-03", [3.5, 4.0]))
+    assert reader.read("AAPL").close.tolist() == [1.0, 2.0, 3.5, 4.0]
+    assert reader.depth("AAPL") == 3
+    assert first.close.tolist() == [2.0, 3.0]
+
+
+def test_build_bar_store_selects_backend(tmp_path):
+    assert build_bar_store(Settings(bar_store_path=None)) is None
+    assert isinstance(build_bar_store(Settings(bar_store_path=str(tmp_path / "db"))), SQLiteBarStore)
+    assert isinstance(build_bar_store(Settings(bar_store_path=str(tmp_path), bar_store_backend="mmap")), MmapBarStore)
+    with pytest.raises(ValueError):
+        build_bar_store(Settings(bar_store_path=str(tmp_path), bar_store_backend="parquet"))
+
+
+def test_mmap_store_bounds_open_maps(tmp_path):
+    store = MmapBarStore(str(tmp_path), max_maps=2)
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        store.write(symbol, _series("2024-01-01", [1.0, 2.0]), depth=2)
+        store.read(symbol)
+
+    assert list(store._maps) == ["MSFT", "NVDA"]
+    assert store.read("AAPL").close.tolist() == [1.0, 2.0]
+    assert list(store._maps) == ["NVDA", "AAPL"]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_mmap_store_concurrent_writes_do_not_clobber(tmp_path):
+    store = MmapBarStore(str(tmp_path))
+
+    def write(i):
+        store.write("AAPL", _series("2024-01-01", [float(i)] * 50), depth=50)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(32)))
+
+    bars = store.read("AAPL")
+    assert len(bars) == 50
+    assert len(set(bars.close.tolist())) == 1
@@ -0,0 +1,131 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.providers.caching import CachingYahooClient
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import (
+    YahooClient,
+    YahooClientError,
+    YahooSymbolNotFoundError,
+    YFinanceYahooClient,
+)
+
+
+class FanOutYahooClient(YahooClient):
+    """Single-symbol client relying on the protocol's default batch methods."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_quote(self, symbol: str):
+        self.calls.append(("quote", symbol))
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        if symbol == "BROKE":
+            raise YahooClientError("upstream down")
+        return {"symbol": symbol}
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append(("history", symbol, days))
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        closes = np.arange(days, dtype=float)
+        return PriceSeries(np.arange(days).astype("datetime64[D]"), closes, closes, closes, closes, closes)
+
+
+class BatchYahooClient(YahooClient):
+    def __init__(self):
+        self.batches = []
+
+    async def fetch_quotes_many(self, symbols):
+        self.batches.append(("quotes", list(symbols)))
+        return {s: {"symbol": s} for s in symbols if s != "MISS"}
+
+    async def fetch_daily_history_many(self, symbols, days):
+        self.batches.append(("history", list(symbols), days))
+        return {s: PriceSeries(["2024-01-02"], [1.0], [1.0], [1.0], [1.0], [0.0]) for s in symbols}
+
+
+@pytest.mark.asyncio
+async def test_default_fan_out_leaves_out_unknown_symbols():
+    client = FanOutYahooClient()
+
+    quotes = await client.fetch_quotes_many(["AAPL", "MISS", "MSFT", "AAPL"])
+    histories = await client.fetch_daily_history_many(["AAPL", "MISS"], 3)
+
+    assert quotes == {"AAPL": {"symbol": "AAPL"}, "MSFT": {"symbol": "MSFT"}}
+    assert list(histories) == ["AAPL"]
+    assert len(histories["AAPL"]) == 3
+    # Duplicates are fetched once
+    assert client.calls.count(("quote", "AAPL")) == 1
+
+
+@pytest.mark.asyncio
+async def test_default_fan_out_raises_provider_errors():
+    with pytest.raises(YahooClientError):
+        await FanOutYahooClient().fetch_quotes_many(["AAPL", "BROKE"])
+
+
+@pytest.mark.asyncio
+async def test_cached_batch_only_fetches_missing_symbols():
+    inner = BatchYahooClient()
+    client = CachingYahooClient(yahoo_client=inner, ttls={"fetch_quote": 60.0})
+
+    first = await client.fetch_quotes_many(["AAPL", "MSFT"])
+    second = await client.fetch_quotes_many(["MSFT", "NVDA", "MISS"])
+
+    assert list(first) == ["AAPL", "MSFT"]
+    assert list(second) == ["MSFT", "NVDA"]
+    assert inner.batches == [("quotes", ["AAPL", "MSFT"]), ("quotes", ["NVDA", "MISS"])]
+    # Single-symbol calls share the batch entries
+    assert await client.fetch_quote("NVDA") == {"symbol": "NVDA"}
+    assert len(inner.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_yfinance_batch_uses_one_multi_ticker_download(monkeypatch):
+    import yfinance as yf
+
+    index = pd.DatetimeIndex([datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 4)])
+    columns = pd.MultiIndex.from_product([["AAPL", "MISS"], ["Open", "High", "Low", "Close", "Volume"]])
+    frame = pd.DataFrame(float("nan"), index=index, columns=columns)
+    for field in ("Open", "High", "Low", "Close"):
+        frame[("AAPL", field)] = [10.0, 11.0, 12.0]
+    frame[("AAPL", "Volume")] = [100.0, 200.0, 300.0]
+
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(list(tickers))
+        return frame
+
+    monkeypatch.setattr(yf, "download", fake_download)
+
+    histories = await YFinanceYahooClient().fetch_daily_history_many(["AAPL", "MISS"], 2)
+
+    assert downloads == [["AAPL", "MISS"]]
+    assert list(histories) == ["AAPL"]
+    assert histories["AAPL"].close.tolist() == [11.0, 12.0]
+
+
+@pytest.mark.asyncio
+async def test_yfinance_batch_treats_missing_and_empty_columns_as_not_found(monkeypatch):
+    import yfinance as yf
+
+    index = pd.DatetimeIndex([datetime(2024, 1, 2), datetime(2024, 1, 3)])
+    columns = pd.MultiIndex.from_product([["AAPL", "NAN"], ["Open", "High", "Low", "Close", "Volume"]])
+    frame = pd.DataFrame(float("nan"), index=index, columns=columns)
+    frame[("AAPL", "Close")] = [10.0, 11.0]
+
+    monkeypatch.setattr(yf, "download", lambda tickers, **kwargs: frame)
+
+    histories = await YFinanceYahooClient().fetch_daily_history_many(["AAPL", "NAN", "GONE"], 5)
+
+    assert list(histories) == ["AAPL"]
+    assert histories["AAPL"].close.tolist() == [10.0, 11.0]
+
+    monkeypatch.setattr(yf, "download", lambda tickers, **kwargs: pd.DataFrame())
+    assert await YFinanceYahooClient().fetch_daily_history_many(["AAPL"], 5) == {}
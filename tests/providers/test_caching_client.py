@@ -0,0 +1,114 @@
+import pytest
+
+from app.providers.caching import CachingYahooClient
+from app.providers.yahoo_client import YahooSymbolNotFoundError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingYahooClient:
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_quote(self, symbol: str):
+        self.calls.append(("quote", symbol))
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        return {"symbol": symbol}
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append(("history", symbol, days))
+        return [{"date": i, "close": float(i)} for i in range(days)]
+
+    async def fetch_fundamentals(self, symbol: str):
+        self.calls.append(("fundamentals", symbol))
+        return {"info": {"symbol": symbol}}
+
+
+def _client(**kwargs):
+    inner = CountingYahooClient()
+    clock = FakeClock()
+    ttls = {"fetch_quote": 10.0, "fetch_daily_history": 100.0, "fetch_fundamentals": 1000.0}
+    client = CachingYahooClient(yahoo_client=inner, ttls=kwargs.pop("ttls", ttls), clock=clock, **kwargs)
+    return client, inner, clock
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_are_served_from_cache():
+    client, inner, _ = _client()
+
+    for _ in range(3):
+        await client.fetch_quote("AAPL")
+        await client.fetch_daily_history("AAPL", 7)
+        await client.fetch_fundamentals("AAPL")
+
+    assert len(inner.calls) == 3
+    assert client.stats() == {"hits": 6, "misses": 3, "evictions": 0, "expirations": 0, "size": 3}
+
+
+@pytest.mark.asyncio
+async def test_history_is_keyed_on_window():
+    client, inner, _ = _client()
+
+    await client.fetch_daily_history("AAPL", 7)
+    await client.fetch_daily_history("AAPL", 30)
+
+    assert inner.calls == [("history", "AAPL", 7), ("history", "AAPL", 30)]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_per_method_ttl():
+    client, inner, clock = _client()
+
+    await client.fetch_quote("AAPL")
+    await client.fetch_fundamentals("AAPL")
+
+    clock.now = 11.0
+    await client.fetch_quote("AAPL")
+    await client.fetch_fundamentals("AAPL")
+
+    assert inner.calls == [("quote", "AAPL"), ("fundamentals", "AAPL"), ("quote", "AAPL")]
+    assert client.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    client, inner, _ = _client(max_entries=2)
+
+    await client.fetch_quote("AAA")
+    await client.fetch_quote("BBB")
+    await client.fetch_quote("AAA")
+    await client.fetch_quote("CCC")
+    await client.fetch_quote("AAA")
+    await client.fetch_quote("BBB")
+
+    assert [c[1] for c in inner.calls] == ["AAA", "BBB", "CCC", "BBB"]
+    assert client.stats()["evictions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    client, inner, _ = _client()
+
+    for _ in range(2):
+        with pytest.raises(YahooSymbolNotFoundError):
+            await client.fetch_quote("MISS")
+
+    assert inner.calls == [("quote", "MISS"), ("quote", "MISS")]
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_caching_for_method():
+    client, inner, _ = _client(ttls={"fetch_quote": 0.0})
+
+    await client.fetch_quote("AAPL")
+    await client.fetch_quote("AAPL")
+
+    assert len(inner.calls) == 2
+    assert client.stats()["misses"] == 0
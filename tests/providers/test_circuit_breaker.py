@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.providers.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerYahooClient,
+    CircuitOpenError,
+)
+from app.providers.executor import ProviderBusyError, ProviderExecutor
+from app.providers.yahoo_client import YahooClientError, YahooSymbolNotFoundError, YFinanceYahooClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyYahooClient:
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = 0
+        self.fail = False
+        self.latency = 0.0
+
+    async def fetch_quote(self, symbol: str):
+        self.calls += 1
+        self.clock.now += self.latency
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        if self.fail:
+            raise YahooClientError("upstream down")
+        return {"symbol": symbol}
+
+
+def _client(**kwargs):
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=10, min_calls=4, open_seconds=30.0, clock=clock, **kwargs)
+    inner = FlakyYahooClient(clock)
+    return CircuitBreakerYahooClient(yahoo_client=inner, breaker=breaker), inner, clock
+
+
+async def _failures(client, count):
+    for _ in range(count):
+        with pytest.raises(YahooClientError):
+            await client.fetch_quote("AAPL")
+
+
+@pytest.mark.asyncio
+async def test_breaker_trips_on_error_rate_and_fails_fast():
+    client, inner, _ = _client()
+    inner.fail = True
+
+    await _failures(client, 4)
+    assert client.breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await client.fetch_quote("AAPL")
+    assert inner.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_breaker_trips_on_slow_calls():
+    client, inner, _ = _client(slow_call_seconds=2.0)
+    inner.latency = 3.0
+
+    for _ in range(4):
+        await client.fetch_quote("AAPL")
+
+    assert client.breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_not_found_counts_as_success():
+    client, _, _ = _client()
+
+    for _ in range(5):
+        with pytest.raises(YahooSymbolNotFoundError):
+            await client.fetch_quote("MISS")
+
+    assert client.breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_success_closes_breaker():
+    client, inner, clock = _client()
+    inner.fail = True
+    await _failures(client, 4)
+
+    clock.now += 31.0
+    assert client.breaker.state == HALF_OPEN
+
+    inner.fail = False
+    assert await client.fetch_quote("AAPL") == {"symbol": "AAPL"}
+    assert client.breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_trial_and_reopens_on_failure():
+    client, inner, clock = _client()
+    inner.fail = True
+    await _failures(client, 4)
+
+    clock.now += 31.0
+    assert client.breaker.allow() is True
+    assert client.breaker.allow() is False
+    client.breaker.abandon()
+
+    await _failures(client, 1)
+    assert client.breaker.state == OPEN
+    assert client.breaker.stats()["opened"] == 2
+
+
+class HangingYahooClient:
+    def __init__(self, clock, latency):
+        self.clock = clock
+        self.latency = latency
+
+    async def fetch_quote(self, symbol: str):
+        self.clock.now += self.latency
+        await asyncio.sleep(10)
+
+
+@pytest.mark.asyncio
+async def test_calls_cut_off_by_deadline_count_as_slow_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=10, min_calls=4, slow_call_seconds=2.0, clock=clock)
+    client = CircuitBreakerYahooClient(yahoo_client=HangingYahooClient(clock, latency=3.0), breaker=breaker)
+
+    for _ in range(4):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.fetch_quote("AAPL"), timeout=0.01)
+
+    assert breaker.state == OPEN
+    assert breaker.stats()["slow_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_quickly_cancelled_calls_are_not_recorded():
+    clock = FakeClock()
+    breaker = CircuitBreaker(window_size=10, min_calls=4, slow_call_seconds=2.0, clock=clock)
+    client = CircuitBreakerYahooClient(yahoo_client=HangingYahooClient(clock, latency=0.5), breaker=breaker)
+
+    for _ in range(4):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.fetch_quote("AAPL"), timeout=0.01)
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_executor_does_not_trip_breaker():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1, max_queue=0)
+    breaker = CircuitBreaker(window_size=10, min_calls=2)
+    client = CircuitBreakerYahooClient(yahoo_client=YFinanceYahooClient(executor=executor), breaker=breaker)
+    release = threading.Event()
+
+    try:
+        running = asyncio.ensure_future(executor.run(lambda: release.wait(timeout=5)))
+        await asyncio.sleep(0.01)
+        for _ in range(5):
+            with pytest.raises(ProviderBusyError):
+                await client.fetch_quote("AAPL")
+        release.set()
+        await running
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert breaker.state == CLOSED
+    assert breaker.stats()["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_time_queued_for_a_provider_slot_is_not_counted_as_slow():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1, max_queue=10, queue_timeout=None)
+    breaker = CircuitBreaker(window_size=10, min_calls=4, slow_call_seconds=0.1)
+
+    class BlockingYahooClient(YFinanceYahooClient):
+        async def fetch_quote(self, symbol: str):
+            return await self._run(lambda: time.sleep(0.04) or {"symbol": symbol})
+
+    client = CircuitBreakerYahooClient(yahoo_client=BlockingYahooClient(executor=executor), breaker=breaker)
+    try:
+        # Each call runs for 40ms but the last ones queue for over 100ms
+        await asyncio.gather(*(client.fetch_quote("AAPL") for _ in range(5)))
+    finally:
+        executor.shutdown()
+
+    assert executor.stats()["max_wait_ms"] >= 100
+    assert breaker.state == CLOSED
+    assert breaker.stats()["slow_rate"] == 0.0
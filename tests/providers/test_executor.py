@@ -0,0 +1,156 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.providers.executor import ProviderExecutor, ProviderBusyError
+from app.providers.yahoo_client import YFinanceYahooClient
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_blocking_calls_on_its_own_pool():
+    executor = ProviderExecutor(max_workers=2, max_in_flight=2)
+    try:
+        name = await executor.run(lambda: threading.current_thread().name)
+    finally:
+        executor.shutdown()
+
+    assert name.startswith("yahoo-provider")
+    assert executor.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_limits_calls_in_flight():
+    executor = ProviderExecutor(max_workers=4, max_in_flight=2, max_queue=10)
+    release = threading.Event()
+    running = []
+    peak = []
+
+    def blocking():
+        running.append(1)
+        peak.append(len(running))
+        release.wait(timeout=5)
+        running.pop()
+        return True
+
+    try:
+        tasks = [asyncio.ensure_future(executor.run(blocking)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+
+        stats = executor.stats()
+        assert stats["in_flight"] == 2
+        assert stats["waiting"] == 3
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [True] * 5
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert max(peak) <= 2
+    assert executor.stats()["completed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_queue_is_full():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1, max_queue=1)
+    release = threading.Event()
+
+    try:
+        running = asyncio.ensure_future(executor.run(lambda: release.wait(timeout=5)))
+        queued = asyncio.ensure_future(executor.run(lambda: True))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ProviderBusyError):
+            await executor.run(lambda: True)
+
+        release.set()
+        await asyncio.gather(running, queued)
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert executor.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_after_queue_timeout():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1, max_queue=5, queue_timeout=0.05)
+    release = threading.Event()
+
+    try:
+        running = asyncio.ensure_future(executor.run(lambda: release.wait(timeout=5)))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ProviderBusyError):
+            await executor.run(lambda: True)
+
+        release.set()
+        await running
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert stats["rejected"] == 1
+    assert stats["max_wait_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_yfinance_client_uses_configured_executor():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1)
+    client = YFinanceYahooClient(executor=executor)
+    try:
+        assert await client._run(lambda: 42) == 42
+    finally:
+        executor.shutdown()
+
+    assert client.stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_yfinance_client_surfaces_busy_executor():
+    executor = ProviderExecutor(max_workers=1, max_in_flight=1, max_queue=0)
+    client = YFinanceYahooClient(executor=executor)
+    release = threading.Event()
+
+    try:
+        running = asyncio.ensure_future(executor.run(lambda: release.wait(timeout=5)))
+        await asyncio.sleep(0.01)
+
+        for call in (client.fetch_quote("AAPL"), client.fetch_daily_history("AAPL", 5), client.fetch_fundamentals("AAPL")):
+            with pytest.raises(ProviderBusyError):
+                await call
+
+        release.set()
+        await running
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert executor.stats()["rejected"] == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_holds_slot_until_cancelled_call_finishes():
+    executor = ProviderExecutor(max_workers=2, max_in_flight=1, max_queue=5, queue_timeout=0.05)
+    release = threading.Event()
+
+    try:
+        running = asyncio.ensure_future(executor.run(lambda: release.wait(timeout=5)))
+        await asyncio.sleep(0.01)
+        running.cancel()
+        await asyncio.sleep(0.01)
+
+        # The thread is still running, so its slot is still taken
+        assert executor.stats()["in_flight"] == 1
+        with pytest.raises(ProviderBusyError):
+            await executor.run(lambda: True)
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert executor.stats()["in_flight"] == 0
+        assert await executor.run(lambda: True) is True
+    finally:
+        release.set()
+        executor.shutdown()
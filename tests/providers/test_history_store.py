@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from app.core.price_service import PriceService
+from app.core.technical_service import TechnicalService
+from app.providers.history_store import HistoryStore
+from app.providers.price_series import PriceSeries
+from app.providers.yahoo_client import YahooClient, YahooSymbolNotFoundError
+
+
+class CountingYahooClient(YahooClient):
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append((symbol, days))
+        await asyncio.sleep(0)
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError("missing")
+        closes = 100.0 + np.arange(days)
+        return PriceSeries(np.arange(days).astype("datetime64[D]"), closes, closes, closes, closes, np.zeros(days))
+
+    async def fetch_daily_history_many(self, symbols, days: int):
+        self.calls.append((tuple(symbols), days))
+        return await super().fetch_daily_history_many(symbols, days)
+
+
+@pytest.mark.asyncio
+async def test_store_downloads_widest_window_once_and_slices():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=200, ttl_seconds=60)
+
+    week = await store.get_history("AAPL", 7)
+    full = await store.get_history("AAPL", 200)
+
+    assert client.calls == [("AAPL", 200)]
+    assert week.close.tolist() == [100.0 + i for i in range(193, 200)]
+    assert np.array_equal(week.timestamps, full.timestamps[-7:])
+
+
+@pytest.mark.asyncio
+async def test_store_coalesces_concurrent_readers():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=50, ttl_seconds=60)
+
+    await asyncio.gather(*(store.get_history("AAPL", 7) for _ in range(5)))
+
+    assert client.calls == [("AAPL", 50)]
+
+
+@pytest.mark.asyncio
+async def test_store_refetches_after_ttl_and_wider_requests():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=10, ttl_seconds=0)
+
+    await store.get_history("AAPL", 7)
+    await store.get_history("AAPL", 7)
+
+    store.ttl_seconds = 60
+    await store.get_history("AAPL", 30)
+    await store.get_history("AAPL", 30)
+
+    assert client.calls == [("AAPL", 10), ("AAPL", 10), ("AAPL", 30)]
+
+
+@pytest.mark.asyncio
+async def test_store_does_not_cache_errors():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=10, ttl_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(YahooSymbolNotFoundError):
+            await store.get_history("MISS", 7)
+
+    assert client.calls == [("MISS", 10), ("MISS", 10)]
+
+
+@pytest.mark.asyncio
+async def test_price_and_technical_services_share_one_download():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=200, ttl_seconds=60)
+    price = PriceService(yahoo_client=client, history_store=store)
+    technical = TechnicalService(yahoo_client=client, history_store=store)
+
+    await asyncio.gather(
+        price.get_price_for_symbol("AAPL"),
+        technical.get_technical_for_symbol("AAPL"),
+    )
+
+    assert client.calls == [("AAPL", 200)]
+
+
+@pytest.mark.asyncio
+async def test_store_batch_fetches_only_uncached_symbols():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=10, ttl_seconds=60)
+
+    await store.get_history("AAPL", 7)
+    bars = await store.get_history_many(["AAPL", "MSFT", "MISS", "MSFT"], 7)
+    await store.get_history("MSFT", 7)
+
+    assert list(bars) == ["AAPL", "MSFT"]
+    assert len(bars["MSFT"]) == 7
+    assert client.calls[:2] == [("AAPL", 10), (("MSFT", "MISS"), 10)]
+    assert len(client.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used_and_expired_windows():
+    client = CountingYahooClient()
+    store = HistoryStore(yahoo_client=client, window_days=10, ttl_seconds=60, max_entries=2)
+
+    await store.get_history("AAPL", 5)
+    await store.get_history("MSFT", 5)
+    await store.get_history("AAPL", 5)
+    await store.get_history_many(["NVDA"], 5)
+
+    assert list(store._entries) == ["AAPL", "NVDA"]
+
+    # Expired windows are dropped when looked up
+    store.ttl_seconds = 0
+    assert store._lookup("AAPL", 10, time.monotonic()) is None
+    assert list(store._entries) == ["NVDA"]
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.providers.price_series import PriceSeries
+
+
+def _frame():
+    index = pd.DatetimeIndex(
+        [datetime(2024, 1, 3), datetime(2024, 1, 2), datetime(2024, 1, 4)], tz="America/New_York"
+    )
+    return pd.DataFrame(
+        {
+            "Open": [2.0, 1.0, 3.0],
+            "High": [2.5, 1.5, 3.5],
+            "Low": [1.5, 0.5, 2.5],
+            "Close": [2.0, 1.0, np.nan],
+            "Volume": [20, 10, 30],
+        },
+        index=index,
+    )
+
+
+def test_from_frame_builds_sorted_arrays_without_missing_closes():
+    series = PriceSeries.from_frame(_frame())
+
+    assert len(series) == 2
+    assert series.close.dtype == np.float64
+    assert series.close.tolist() == [1.0, 2.0]
+    assert series.volume.tolist() == [10.0, 20.0]
+    assert series.timestamps.dtype == np.dtype("datetime64[ns]")
+    # Timestamps are normalised to UTC
+    assert series.timestamps[0] == np.datetime64("2024-01-02T05:00:00")
+
+
+def test_slices_share_memory_with_the_series():
+    series = PriceSeries(np.arange(5).astype("datetime64[D]"), *([np.arange(5.0)] * 5))
+
+    tail = series.tail(2)
+
+    assert tail.close.tolist() == [3.0, 4.0]
+    assert np.shares_memory(tail.close, series.close)
+    assert len(series.tail(0)) == 0
+    assert len(series.tail(10)) == 5
+
+
+def test_from_epoch_columns_drops_null_closes_and_pads_missing_columns():
+    series = PriceSeries.from_epoch_columns(
+        [300, 100, 200], [3.0, 1.0, 2.0], [], [], [3.0, 1.0, None], [None, 10, 20]
+    )
+
+    assert series.close.tolist() == [1.0, 3.0]
+    assert np.isnan(series.high).all()
+    assert series.timestamps[0] == np.datetime64(100, "s")
+
+
+def test_series_has_no_instance_dict_and_rejects_mismatched_columns():
+    series = PriceSeries.empty()
+
+    assert not hasattr(series, "__dict__")
+    with pytest.raises(ValueError):
+        PriceSeries([0, 1], [1.0], [1.0], [1.0], [1.0], [1.0])
@@ -0,0 +1,187 @@
+import asyncio
+
+import pytest
+
+from app.providers.rate_limit import AdaptiveConcurrencyLimiter, RateLimitedYahooClient, TokenBucket
+from app.providers.yahoo_client import YahooRateLimitError, _is_rate_limited
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ThrottlingYahooClient:
+    def __init__(self):
+        self.calls = 0
+        self.throttle = False
+
+    async def fetch_quote(self, symbol: str):
+        self.calls += 1
+        if self.throttle:
+            raise YahooRateLimitError("Too Many Requests")
+        return {"symbol": symbol}
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_rejects_beyond_max_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2.0, max_wait=0.0, clock=clock)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    with pytest.raises(YahooRateLimitError):
+        await bucket.acquire()
+
+    clock.now = 1.0
+    await bucket.acquire()
+
+
+@pytest.mark.asyncio
+async def test_bucket_refunds_token_of_cancelled_waiter():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock)
+
+    await bucket.acquire()
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    assert bucket.tokens == -1.0
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert bucket.tokens == 0.0
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_waiting_callers():
+    bucket = TokenBucket(rate=100.0, capacity=1.0)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert loop.time() - started >= 0.025
+
+
+def test_limiter_increases_additively_and_decreases_multiplicatively():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4.0, min_limit=1.0, max_limit=8.0, cooldown=1.0, clock=clock)
+
+    for _ in range(4):
+        limiter.on_success()
+    assert 4.9 < limiter.limit < 5.0
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    halved = limiter.limit
+    assert 2.4 < halved < 2.5
+
+    clock.now = 2.0
+    for _ in range(10):
+        limiter.on_throttle()
+        clock.now += 1.0
+    assert limiter.limit == 1.0
+    assert limiter.throttled == 12
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2.0)
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        await limiter.acquire()
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        limiter.release()
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_passes_wake_up_on_when_woken_waiter_is_cancelled():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1.0)
+    await limiter.acquire()
+    first = asyncio.ensure_future(limiter.acquire())
+    second = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # Wake the first waiter, then cancel it before it runs
+    limiter.release()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await asyncio.wait_for(second, timeout=1.0)
+    assert limiter.in_flight == 1
+    assert not limiter._waiters
+
+
+@pytest.mark.asyncio
+async def test_client_backs_off_on_throttling_and_recovers():
+    inner = ThrottlingYahooClient()
+    client = RateLimitedYahooClient(
+        yahoo_client=inner,
+        bucket=TokenBucket(rate=1000.0, capacity=1000.0),
+        limiter=AdaptiveConcurrencyLimiter(initial_limit=8.0, cooldown=0.0),
+    )
+
+    inner.throttle = True
+    for _ in range(2):
+        with pytest.raises(YahooRateLimitError):
+            await client.fetch_quote("AAPL")
+    assert client.stats()["concurrency_limit"] == 2.0
+
+    inner.throttle = False
+    for _ in range(10):
+        await client.fetch_quote("AAPL")
+    assert client.stats()["concurrency_limit"] > 4.0
+    assert client.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_client_side_rejection_does_not_shrink_limit():
+    inner = ThrottlingYahooClient()
+    client = RateLimitedYahooClient(
+        yahoo_client=inner,
+        bucket=TokenBucket(rate=0.001, capacity=1.0, max_wait=0.0),
+        limiter=AdaptiveConcurrencyLimiter(initial_limit=4.0),
+    )
+
+    await client.fetch_quote("AAPL")
+    with pytest.raises(YahooRateLimitError):
+        await client.fetch_quote("AAPL")
+
+    assert inner.calls == 1
+    assert client.stats()["throttled"] == 0
+
+
+def test_rate_limit_detection():
+    class YFRateLimitError(Exception):
+        pass
+
+    assert _is_rate_limited(YFRateLimitError("anything"))
+    assert _is_rate_limited(Exception("429 Client Error: Too Many Requests"))
+    assert not _is_rate_limited(Exception("connection reset"))
+
+    class HTTPError(Exception):
+        def __init__(self, message, status_code):
+            super().__init__(message)
+            self.response = type("Response", (), {"status_code": status_code})()
+
+    assert _is_rate_limited(HTTPError("throttled", 429))
+    # A 429 elsewhere in the message (symbol, URL, body) is not a status
+    assert not _is_rate_limited(HTTPError("Not Found for url: /v8/finance/chart/429", 404))
+    assert not _is_rate_limited(Exception("No data found for symbol 4290.T"))
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from app.providers.single_flight import SingleFlightYahooClient
+from app.providers.yahoo_client import YahooSymbolNotFoundError
+
+
+class GatedYahooClient:
+    """Fake client whose calls block until the test releases them."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def fetch_quote(self, symbol: str):
+        self.calls.append(("quote", symbol))
+        await self.release.wait()
+        if symbol == "MISS":
+            raise YahooSymbolNotFoundError(f"'{symbol}' missing")
+        return {"symbol": symbol}
+
+    async def fetch_daily_history(self, symbol: str, days: int):
+        self.calls.append(("history", symbol, days))
+        await self.release.wait()
+        return [{"date": i, "close": float(i)} for i in range(days)]
+
+    async def fetch_fundamentals(self, symbol: str):
+        self.calls.append(("fundamentals", symbol))
+        await self.release.wait()
+        return {"info": {}}
+
+
+async def _gather_released(inner, *coros):
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    await asyncio.sleep(0)
+    inner.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_call():
+    inner = GatedYahooClient()
+    client = SingleFlightYahooClient(yahoo_client=inner)
+
+    results = await _gather_released(inner, *(client.fetch_quote("AAPL") for _ in range(50)))
+
+    assert inner.calls == [("quote", "AAPL")]
+    assert all(r is results[0] for r in results)
+    assert client.stats() == {"calls": 1, "coalesced": 49, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_calls_with_different_args_are_not_coalesced():
+    inner = GatedYahooClient()
+    client = SingleFlightYahooClient(yahoo_client=inner)
+
+    await _gather_released(
+        inner,
+        client.fetch_daily_history("AAPL", 7),
+        client.fetch_daily_history("AAPL", 200),
+        client.fetch_daily_history("MSFT", 7),
+        client.fetch_fundamentals("AAPL"),
+    )
+
+    assert len(inner.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_unchanged():
+    inner = GatedYahooClient()
+    client = SingleFlightYahooClient(yahoo_client=inner)
+
+    results = await _gather_released(inner, *(client.fetch_quote("MISS") for _ in range(3)))
+
+    assert inner.calls == [("quote", "MISS")]
+    assert all(type(r) is YahooSymbolNotFoundError for r in results)
+    assert all(r is results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_waiter_timeout_does_not_cancel_shared_call():
+    inner = GatedYahooClient()
+    client = SingleFlightYahooClient(yahoo_client=inner)
+
+    patient = asyncio.ensure_future(client.fetch_quote("AAPL"))
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.fetch_quote("AAPL"), timeout=0.01)
+
+    inner.release.set()
+    assert await patient == {"symbol": "AAPL"}
+    assert inner.calls == [("quote", "AAPL")]
+
+
+@pytest.mark.asyncio
+async def test_finished_calls_are_not_reused():
+    inner = GatedYahooClient()
+    inner.release.set()
+    client = SingleFlightYahooClient(yahoo_client=inner)
+
+    await client.fetch_quote("AAPL")
+    await client.fetch_quote("AAPL")
+
+    assert inner.calls == [("quote", "AAPL"), ("quote", "AAPL")]
@@ -0,0 +1,255 @@
+import httpx
+import pytest
+
+from app.core.config import Settings
+from app.providers.stack import build_backend
+from app.providers.yahoo_client import YahooClientError, YahooRateLimitError, YahooSymbolNotFoundError
+from app.providers.yahoo_http import HttpYahooClient
+
+DAY = 86400
+
+
+def make_client(handler, crumbs=("crumb-1",)):
+    """Client whose cookie/crumb handshake is answered before ``handler`` sees requests."""
+    issued = list(crumbs)
+
+    def with_handshake(request):
+        if request.url.host == "fc.yahoo.test":
+            return httpx.Response(404, headers={"set-cookie": "A3=session; Path=/; Domain=.yahoo.test"})
+        if request.url.path == "/v1/test/getcrumb":
+            return httpx.Response(200, text=issued.pop(0) if len(issued) > 1 else issued[0])
+        return handler(request)
+
+    return HttpYahooClient(
+        base_url="https://query.yahoo.test",
+        cookie_url="https://fc.yahoo.test",
+        transport=httpx.MockTransport(with_handshake),
+    )
+
+
+def chart_payload(closes):
+    start = 1_700_000_000
+    return {
+        "chart": {
+            "result": [{
+                "timestamp": [start + i * DAY for i in range(len(closes))],
+                "indicators": {"quote": [{
+                    "open": closes,
+                    "high": closes,
+                    "low": closes,
+                    "close": closes,
+                    "volume": [1000] * len(closes),
+                }]},
+            }],
+            "error": None,
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_daily_history_parses_chart_and_skips_missing_closes():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        payload = chart_payload([10.0, None, 12.0, 13.0])
+        payload["chart"]["result"][0]["meta"] = {"firstTradeDate": 1_700_000_000}
+        return httpx.Response(200, json=payload)
+
+    client = make_client(handler)
+    try:
+        bars = await client.fetch_daily_history("AAPL", 2)
+        everything = await client.fetch_daily_history("AAPL", 10)
+    finally:
+        await client.aclose()
+
+    assert bars.close.tolist() == [12.0, 13.0]
+    assert bars.timestamps[0] < bars.timestamps[1]
+    assert not bars.starts_at_listing()
+    assert everything.starts_at_listing()
+    assert seen[0].url.path == "/v8/finance/chart/AAPL"
+    assert seen[0].url.params["interval"] == "1d"
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_connections():
+    clients = set()
+
+    def handler(request):
+        return httpx.Response(200, json={"quoteResponse": {"result": [{"regularMarketPrice": 1.0}]}})
+
+    client = make_client(handler)
+    try:
+        for _ in range(3):
+            await client.fetch_quote("AAPL")
+            clients.add(id(client.http))
+    finally:
+        await client.aclose()
+
+    assert len(clients) == 1
+
+
+@pytest.mark.asyncio
+async def test_quote_returns_first_result_with_symbol():
+    client = make_client(lambda request: httpx.Response(
+        200, json={"quoteResponse": {"result": [{"regularMarketPrice": 101.5}]}}
+    ))
+    try:
+        quote = await client.fetch_quote("MSFT")
+    finally:
+        await client.aclose()
+
+    assert quote == {"regularMarketPrice": 101.5, "symbol": "MSFT"}
+
+
+@pytest.mark.asyncio
+async def test_fundamentals_flatten_summary_modules():
+    payload = {
+        "quoteSummary": {
+            "result": [{
+                "summaryDetail": {"trailingPE": {"raw": 25.0, "fmt": "25.00"}},
+                "financialData": {"totalRevenue": {"raw": 1000}, "freeCashflow": {"raw": 80}},
+                "cashflowStatementHistory": {"cashflowStatements": [{
+                    "endDate": {"raw": 1_700_000_000},
+                    "totalCashFromOperatingActivities": {"raw": 120},
+                    "capitalExpenditures": {"raw": -40},
+                }]},
+                "incomeStatementHistory": {"incomeStatementHistory": [{
+                    "endDate": {"raw": 1_700_000_000},
+                    "totalRevenue": {"raw": 1000},
+                }]},
+            }],
+            "error": None,
+        }
+    }
+    client = make_client(lambda request: httpx.Response(200, json=payload))
+    try:
+        raw = await client.fetch_fundamentals("AAPL")
+    finally:
+        await client.aclose()
+
+    assert raw["info"]["trailingPE"] == 25.0
+    assert list(raw["income_statement"]["Total Revenue"].values()) == [1000]
+    assert list(raw["cashflow"]["Free Cash Flow"].values()) == [80]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, error",
+    [(404, YahooSymbolNotFoundError), (429, YahooRateLimitError), (500, YahooClientError)],
+)
+async def test_http_errors_map_to_client_errors(status, error):
+    client = make_client(lambda request: httpx.Response(status, json={}))
+    try:
+        with pytest.raises(error):
+            await client.fetch_quote("AAPL")
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_empty_quote_result_is_not_found():
+    client = make_client(lambda request: httpx.Response(200, json={"quoteResponse": {"result": []}}))
+    try:
+        with pytest.raises(YahooSymbolNotFoundError):
+            await client.fetch_quote("NOPE")
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_become_client_errors():
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    client = make_client(handler)
+    try:
+        with pytest.raises(YahooClientError):
+            await client.fetch_daily_history("AAPL", 5)
+    finally:
+        await client.aclose()
+
+
+def test_build_backend_selects_http_client():
+    backend = build_backend(Settings(yahoo_client_backend="http", yahoo_http_max_connections=3))
+
+    assert isinstance(backend, HttpYahooClient)
+    assert backend.max_connections == 3
+
+    with pytest.raises(ValueError):
+        build_backend(Settings(yahoo_client_backend="carrier-pigeon"))
+
+
+@pytest.mark.asyncio
+async def test_quotes_many_uses_one_request():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.params["symbols"])
+        return httpx.Response(200, json={"quoteResponse": {"result": [
+            {"symbol": "AAPL", "regularMarketPrice": 1.0},
+            {"symbol": "MSFT", "regularMarketPrice": 2.0},
+        ]}})
+
+    client = make_client(handler)
+    try:
+        quotes = await client.fetch_quotes_many(["AAPL", "MSFT", "NOPE"])
+    finally:
+        await client.aclose()
+
+    assert seen == ["AAPL,MSFT,NOPE"]
+    assert sorted(quotes) == ["AAPL", "MSFT"]
+
+
+@pytest.mark.asyncio
+async def test_quote_sends_crumb_and_refreshes_it_on_401():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.params["crumb"], request.headers.get("cookie")))
+        if request.url.params["crumb"] == "stale":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"quoteResponse": {"result": [{"regularMarketPrice": 1.0}]}})
+
+    client = make_client(handler, crumbs=("stale", "fresh"))
+    try:
+        await client.fetch_quote("AAPL")
+        await client.fetch_quote("MSFT")
+    finally:
+        await client.aclose()
+
+    assert seen == [("stale", "A3=session"), ("fresh", "A3=session"), ("fresh", "A3=session")]
+
+
+@pytest.mark.asyncio
+async def test_history_does_not_need_a_crumb():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=chart_payload([10.0]))
+
+    client = HttpYahooClient(base_url="https://query.yahoo.test", transport=httpx.MockTransport(handler))
+    try:
+        await client.fetch_daily_history("AAPL", 1)
+    finally:
+        await client.aclose()
+
+    assert [request.url.path for request in requests] == ["/v8/finance/chart/AAPL"]
+
+
+def test_client_from_a_finished_loop_is_closed():
+    import asyncio
+
+    client = make_client(lambda request: httpx.Response(200, json=chart_payload([10.0])))
+
+    async def fetch():
+        await client.fetch_daily_history("AAPL", 1)
+        return client._http
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    asyncio.run(client.aclose())
+
+    assert first is not second
+    assert first.is_closed